@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import hmac
 import json
 from typing import Any
 
 from scheduler.conf import get_str
+from django.db import IntegrityError, transaction
 from django.http import JsonResponse
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
 from scheduler.models import Event, JobDefinition, JobRun
+from scheduler.redis_coordination import publish_jobrun_ready
 
 
 def _get_client_token(request) -> str:
@@ -20,7 +23,7 @@ def _is_authenticated_for_events(request) -> bool:
     # Token can be overridden via SchedulerSetting (DB). Read fresh to avoid stale auth decisions.
     token_required = get_str(key="SCHEDULER_EVENTS_API_TOKEN", default="", fresh=True).strip()
     if token_required:
-        return _get_client_token(request) == token_required
+        return hmac.compare_digest(_get_client_token(request).encode("utf-8"), token_required.encode("utf-8"))
     return bool(getattr(request, "user", None) and request.user.is_authenticated)
 
 
@@ -51,6 +54,17 @@ def _safe_body_json(request) -> dict[str, Any]:
         return {}
 
 
+def _deduped_response(event_id: int) -> JsonResponse:
+    return JsonResponse(
+        {
+            "ok": True,
+            "event_id": event_id,
+            "deduped": True,
+            "created_job_run_ids": [],
+        }
+    )
+
+
 @csrf_exempt
 @require_POST
 def ingest_event(request):
@@ -72,61 +86,60 @@ def ingest_event(request):
     if dedupe_key is not None:
         dedupe_key = str(dedupe_key).strip() or None
 
-    # MVP idempotency: if dedupe_key exists and same event_type+dedupe_key already stored, return it.
-    if dedupe_key:
-        existing = (
-            Event.objects.filter(event_type=event_type, dedupe_key=dedupe_key)
-            .order_by("-id")
-            .only("id", "processed_at")
-            .first()
-        )
-        if existing is not None:
-            return JsonResponse(
-                {
-                    "ok": True,
-                    "event_id": existing.id,
-                    "deduped": True,
-                    "created_job_run_ids": [],
-                }
-            )
+    # Idempotency: (event_type, dedupe_key) is unique for non-null keys. New keys are the common case,
+    # so there is no read-before-insert probe; a duplicate surfaces as IntegrityError on the insert below
+    # and only then is the existing event looked up.
+    # Find matching enabled event jobs (outside the write transaction to keep it short).
+    job_defs = JobDefinition.objects.filter(enabled=True, type=JobDefinition.JobType.EVENT).only("id", "schedule")
+    matched_job_ids: list[int] = [int(jd.id) for jd in job_defs if _event_job_matches(jd, event_type)]
 
     now = timezone.now()
 
-    ev = Event.objects.create(
-        event_type=event_type,
-        payload_json=payload_json,
-        dedupe_key=dedupe_key,
-        processed_at=None,
-    )
-
-    # Find matching enabled event jobs
-    job_defs = JobDefinition.objects.filter(enabled=True, type=JobDefinition.JobType.EVENT).only("id", "schedule")
-    matched_job_ids: list[int] = []
-    created_run_ids: list[int] = []
-
-    for jd in job_defs:
-        if not _event_job_matches(jd, event_type):
-            continue
-        matched_job_ids.append(int(jd.id))
+    # One transaction (one commit) for the event and all of its runs. The event is stored as
+    # processed: it is only visible together with the runs it produced.
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                ev = Event.objects.create(
+                    event_type=event_type,
+                    payload_json=payload_json,
+                    dedupe_key=dedupe_key,
+                    processed_at=now,
+                )
+        except IntegrityError:
+            if not dedupe_key:
+                raise
+            existing_id = (
+                Event.objects.filter(event_type=event_type, dedupe_key=dedupe_key).values_list("id", flat=True).first()
+            )
+            if existing_id is None:
+                raise
+            return _deduped_response(existing_id)
 
         # Use microsecond timestamp to avoid collisions; keep scheduled_for for ordering.
         # Store some idempotency marker for observability / future fencing.
-        if dedupe_key:
-            idem = f"event:{event_type}:{dedupe_key}:job:{jd.id}"
-        else:
-            idem = f"event:{ev.id}:job:{jd.id}"
-
-        jr = JobRun.objects.create(
-            job_definition=jd,
-            scheduled_for=now,
-            state=JobRun.State.PENDING,
-            attempt=0,
-            idempotency_key=idem,
-        )
-        created_run_ids.append(int(jr.id))
-
-    ev.processed_at = timezone.now()
-    ev.save(update_fields=["processed_at"])
+        runs = [
+            JobRun(
+                job_definition_id=jd_id,
+                scheduled_for=now,
+                state=JobRun.State.PENDING,
+                attempt=0,
+                idempotency_key=(
+                    f"event:{event_type}:{dedupe_key}:job:{jd_id}" if dedupe_key else f"event:{ev.id}:job:{jd_id}"
+                ),
+            )
+            for jd_id in matched_job_ids
+        ]
+        if runs:
+            JobRun.objects.bulk_create(runs)
+    created_run_ids: list[int] = [int(jr.id) for jr in runs]
+
+    # Wake an idle leader; without Redis the runs are still picked up on the next (backed-off) tick.
+    if runs:
+        try:
+            publish_jobrun_ready(get_str(key="SCHEDULER_REDIS_URL"))
+        except Exception:
+            pass
 
     return JsonResponse(
         {
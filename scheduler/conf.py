@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import threading
+import time
 from typing import Any
 
 from django.conf import settings
@@ -17,6 +18,18 @@ _settings_cache_lock = threading.Lock()
 _settings_cache: dict[str, Any] | None = None
 _settings_cache_generation: int = 0
 
+# fresh=True reads: a snapshot shared by all threads, dropped when any process
+# publishes scheduler:settings_changed (see notify_settings_changed; every
+# SchedulerSetting save/delete does so via scheduler.signals). The age cap
+# bounds staleness if a notification is missed; without a listener (no Redis URL)
+# it degrades to a ~1s TTL.
+_FRESH_MAX_AGE_SECONDS = 30.0
+_FRESH_MAX_AGE_NO_LISTENER_SECONDS = 1.0
+_fresh_lock = threading.Lock()
+_fresh_cache: tuple[float, dict[str, Any]] | None = None
+_fresh_changed = threading.Event()
+_fresh_listener: threading.Thread | None = None
+
 
 def _normalize_setting_value(value_json: Any) -> Any:
     # Backward/forward compatible:
@@ -27,7 +40,8 @@ def _normalize_setting_value(value_json: Any) -> Any:
     return value_json
 
 
-def _load_settings_overrides_from_db() -> dict[str, Any]:
+def _load_settings_overrides_from_db() -> dict[str, Any] | None:
+    """Return the overrides, or None if they could not be read (callers must not cache that)."""
     try:
         from scheduler.models import SchedulerSetting
 
@@ -35,7 +49,7 @@ def _load_settings_overrides_from_db() -> dict[str, Any]:
         return {str(r.key): _normalize_setting_value(r.value_json) for r in rows}
     except Exception:
         # DB未初期化/マイグレーション前などでも落とさない。
-        return {}
+        return None
 
 
 def reload_scheduler_settings_cache() -> int:
@@ -45,26 +59,95 @@ def reload_scheduler_settings_cache() -> int:
     """
 
     global _settings_cache, _settings_cache_generation
+    _fresh_changed.set()
     with _settings_cache_lock:
         _settings_cache = None
         _settings_cache_generation += 1
         return int(_settings_cache_generation)
 
 
+def notify_settings_changed(key: str = "") -> None:
+    """Drop this process's fresh snapshot and tell the others.
+
+    SchedulerSetting save/delete call this on commit (scheduler.signals); call it directly
+    only after writes that send no signal, such as QuerySet.update().
+    """
+    _fresh_changed.set()
+    redis_url = str(getattr(settings, "SCHEDULER_REDIS_URL", "") or "")
+    if not redis_url:
+        return
+    try:
+        from scheduler.redis_coordination import publish_settings_changed
+
+        publish_settings_changed(redis_url, key)
+    except Exception:
+        # Other processes fall back to _FRESH_MAX_AGE_SECONDS.
+        pass
+
+
+def _ensure_fresh_listener() -> bool:
+    global _fresh_listener
+    if _fresh_listener is not None:
+        return True
+    redis_url = str(getattr(settings, "SCHEDULER_REDIS_URL", "") or "")
+    if not redis_url:
+        return False
+    from scheduler.redis_coordination import run_notification_listener, settings_changed_channel
+
+    t = threading.Thread(
+        target=run_notification_listener,
+        kwargs={
+            "redis_url": redis_url,
+            "wake_events": {settings_changed_channel(): _fresh_changed},
+            "should_stop": lambda: False,
+        },
+        name="scheduler-settings-listener",
+        daemon=True,
+    )
+    _fresh_listener = t
+    t.start()
+    return True
+
+
+def _get_fresh_overrides() -> dict[str, Any]:
+    global _fresh_cache
+    with _fresh_lock:
+        max_age = _FRESH_MAX_AGE_SECONDS if _ensure_fresh_listener() else _FRESH_MAX_AGE_NO_LISTENER_SECONDS
+        now = time.monotonic()
+        snap = _fresh_cache
+        if snap is not None and not _fresh_changed.is_set() and (now - snap[0]) < max_age:
+            return snap[1]
+        # Loading under the lock: concurrent misses wait for this one query instead of each hitting the DB.
+        changed = _fresh_changed.is_set()
+        _fresh_changed.clear()
+        data = _load_settings_overrides_from_db()
+        if data is None:
+            # Keep serving the last good snapshot (uncached, so the next call retries) rather than
+            # pinning the defaults for max_age.
+            if changed:
+                _fresh_changed.set()
+            return snap[1] if snap is not None else {}
+        _fresh_cache = (now, data)
+        return data
+
+
 def _get_db_overrides(*, fresh: bool = False) -> dict[str, Any]:
+    """Return the overrides mapping. The dict is shared; callers must not mutate it."""
     global _settings_cache
     if fresh:
-        return _load_settings_overrides_from_db()
+        return _get_fresh_overrides()
     with _settings_cache_lock:
         if _settings_cache is None:
-            _settings_cache = _load_settings_overrides_from_db()
-        return dict(_settings_cache)
+            data = _load_settings_overrides_from_db()
+            if data is None:
+                return {}
+            _settings_cache = data
+        return _settings_cache
 
 
-def get_setting(*, key: str, default: Any = None, fresh: bool = False) -> Any:
+def _resolve_setting(db: dict[str, Any], key: str, default: Any) -> Any:
     if key in _NON_OVERRIDABLE_KEYS:
         return getattr(settings, key, default)
-    db = _get_db_overrides(fresh=fresh)
     if key in db:
         return db[key]
     if hasattr(settings, key):
@@ -72,6 +155,12 @@ def get_setting(*, key: str, default: Any = None, fresh: bool = False) -> Any:
     return default
 
 
+def get_setting(*, key: str, default: Any = None, fresh: bool = False) -> Any:
+    if key in _NON_OVERRIDABLE_KEYS:
+        return getattr(settings, key, default)
+    return _resolve_setting(_get_db_overrides(fresh=fresh), key, default)
+
+
 def get_setting_with_source(*, key: str, default: Any = None, fresh: bool = False) -> tuple[Any, str]:
     if key in _NON_OVERRIDABLE_KEYS:
         return getattr(settings, key, default), "env"
@@ -83,6 +172,22 @@ def get_setting_with_source(*, key: str, default: Any = None, fresh: bool = Fals
     return default, "default"
 
 
+def get_many_with_source(*, keys: list[str], default: Any = None, fresh: bool = False) -> dict[str, tuple[Any, str]]:
+    """get_setting_with_source() for several keys, resolved against one overrides snapshot."""
+    db = _get_db_overrides(fresh=fresh)
+    out: dict[str, tuple[Any, str]] = {}
+    for key in keys:
+        if key in _NON_OVERRIDABLE_KEYS:
+            out[key] = (getattr(settings, key, default), "env")
+        elif key in db:
+            out[key] = (db[key], "db")
+        elif hasattr(settings, key):
+            out[key] = (getattr(settings, key), "env")
+        else:
+            out[key] = (default, "default")
+    return out
+
+
 def list_all_scheduler_setting_keys(*, fresh: bool = False) -> list[str]:
     keys = {k for k in dir(settings) if k.startswith("SCHEDULER_")}
     keys.update(_get_db_overrides(fresh=fresh).keys())
@@ -107,6 +212,16 @@ def get_str(*, key: str, default: str = "", fresh: bool = False) -> str:
     return str(v) if v is not None else str(default)
 
 
+def get_many_str(*, defaults: dict[str, str], fresh: bool = False) -> dict[str, str]:
+    """get_str() for several keys ({key: default}) resolved against one overrides snapshot."""
+    db = _get_db_overrides(fresh=fresh)
+    out: dict[str, str] = {}
+    for key, default in defaults.items():
+        v = _resolve_setting(db, key, default)
+        out[key] = str(v) if v is not None else str(default)
+    return out
+
+
 def get_int(*, key: str, default: int = 0, fresh: bool = False) -> int:
     v = get_setting(key=key, default=default, fresh=fresh)
     try:
@@ -135,6 +250,7 @@ class SchedulerRuntimeConfig:
     grpc_port_range_end: int
     tls_cert_file: str
     tls_key_file: str
+    grpc_send_args_json: bool
 
     assign_ahead_seconds: int
 
@@ -155,6 +271,8 @@ class SchedulerRuntimeConfig:
 
     leader_ping_batch_size: int
 
+    poll_interval_seconds_max: int
+
 
 def get_scheduler_config() -> SchedulerRuntimeConfig:
     return SchedulerRuntimeConfig(
@@ -165,6 +283,7 @@ def get_scheduler_config() -> SchedulerRuntimeConfig:
         grpc_port_range_end=get_int(key="SCHEDULER_GRPC_PORT_RANGE_END", default=50150),
         tls_cert_file=get_str(key="SCHEDULER_TLS_CERT_FILE"),
         tls_key_file=get_str(key="SCHEDULER_TLS_KEY_FILE"),
+        grpc_send_args_json=get_bool(key="SCHEDULER_GRPC_SEND_ARGS_JSON", default=False),
         assign_ahead_seconds=get_int(key="SCHEDULER_ASSIGN_AHEAD_SECONDS", default=60),
 
         skip_late_runs_after_seconds=get_int(key="SCHEDULER_SKIP_LATE_RUNS_AFTER_SECONDS", default=300),
@@ -181,4 +300,6 @@ def get_scheduler_config() -> SchedulerRuntimeConfig:
         rebalance_assigned_cooldown_seconds=get_int(key="SCHEDULER_REBALANCE_ASSIGNED_COOLDOWN_SECONDS", default=5),
 
         leader_ping_batch_size=get_int(key="SCHEDULER_LEADER_PING_BATCH_SIZE", default=2),
+
+        poll_interval_seconds_max=get_int(key="SCHEDULER_POLL_INTERVAL_SECONDS_MAX", default=10),
     )
@@ -7,17 +7,19 @@ import subprocess
 import sys
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 import grpc
+from google.protobuf import json_format
 try:
     import boto3  # type: ignore
 except Exception:  # pragma: no cover
     boto3 = None
 from django.conf import settings
-from django.db import transaction
+from django.db.models import F, Q
 from django.utils import timezone
 
 from scheduler.grpc import worker_pb2, worker_pb2_grpc
@@ -73,18 +75,30 @@ def _collect_proc_tree_counters(pid: int) -> tuple[float, int, int, int]:
     return cpu_s, rss_sum, io_r, io_w
 
 
-@dataclass
-class WorkerRuntimeState:
-    worker_id: str
-    node_id: str
+@dataclass(frozen=True, slots=True)
+class CoordinationSnapshot:
+    """Coordination view published by the coordination thread.
+
+    Replaced as a whole (single attribute assignment) on every tick, so RPC
+    handlers can read a consistent snapshot without taking the runtime lock.
+    """
 
-    # Updated by the main loop
     role: str = "worker"  # leader/subleader/worker
     cluster_epoch: int = 0
     leader_epoch: int = 0
     leader_worker_id: str = ""
     last_heartbeat_unix_ms: int = 0
 
+
+@dataclass
+class WorkerRuntimeState:
+    worker_id: str
+    node_id: str
+
+    # Updated by the coordination loop (lock-free; see CoordinationSnapshot)
+    coordination: CoordinationSnapshot = field(default_factory=CoordinationSnapshot)
+
+    # Updated by RPC handlers under the runtime lock (compound read-modify-write)
     detached: bool = False
     draining: bool = False
     load: int = 0
@@ -187,6 +201,43 @@ def _archive_log_if_enabled(*, local_path: Path, worker_id: str, job_run_id: int
     return f"s3://{cfg['bucket']}/{key}", None
 
 
+# StartJobRequest.args (Struct) was added after args_json; tolerate stale generated code.
+_START_JOB_HAS_STRUCT_ARGS = "args" in worker_pb2.StartJobRequest.DESCRIPTOR.fields_by_name
+
+
+_STRUCT_MAX_EXACT_INT = 2**53
+
+
+def _struct_exact(v) -> bool:
+    """True if v survives Struct (all numbers as double) + _struct_value_to_python unchanged.
+
+    Rejects ints a double cannot hold exactly and integral floats (1.0 would come back as 1).
+    """
+    if isinstance(v, bool) or v is None or isinstance(v, str):
+        return True
+    if isinstance(v, int):
+        return -_STRUCT_MAX_EXACT_INT <= v <= _STRUCT_MAX_EXACT_INT
+    if isinstance(v, float):
+        return not v.is_integer()
+    if isinstance(v, dict):
+        return all(isinstance(k, str) and _struct_exact(x) for k, x in v.items())
+    if isinstance(v, (list, tuple)):
+        return all(_struct_exact(x) for x in v)
+    return False
+
+
+def _struct_value_to_python(v):
+    # Struct stores every number as double; restore integral values to int so
+    # commands see the same types they would get from json.loads().
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    if isinstance(v, dict):
+        return {k: _struct_value_to_python(x) for k, x in v.items()}
+    if isinstance(v, list):
+        return [_struct_value_to_python(x) for x in v]
+    return v
+
+
 def _safe_int(s: str) -> Optional[int]:
     try:
         return int(s)
@@ -195,28 +246,36 @@ def _safe_int(s: str) -> Optional[int]:
 
 
 def _jobrun_mark_running(*, job_run_id: int, worker_id: str, leader_epoch: int, attempt: int, log_ref: str) -> bool:
+    # One conditional UPDATE (no SELECT ... FOR UPDATE round trip): the WHERE clause carries the
+    # eligibility checks, and the row lock is taken by the UPDATE itself.
     now = timezone.now()
-    with transaction.atomic():
-        try:
-            jr = JobRun.objects.select_for_update().get(id=job_run_id)
-        except JobRun.DoesNotExist:
-            return False
-
-        if jr.state != JobRun.State.ASSIGNED:
-            return False
-        if jr.assigned_worker_id != worker_id:
-            return False
+    updated = (
+        JobRun.objects.filter(
+            id=job_run_id,
+            state=JobRun.State.ASSIGNED,
+            assigned_worker_id=worker_id,
+        )
         # Fence: allow only the same/newer leader epoch (MVP uses >= check)
-        if jr.leader_epoch is not None and int(jr.leader_epoch) > int(leader_epoch):
-            return False
-
-        jr.state = JobRun.State.RUNNING
-        jr.started_at = now
-        jr.attempt = int(attempt)
-        jr.log_ref = str(log_ref)
-        jr.version = int(jr.version) + 1
-        jr.save(update_fields=["state", "started_at", "attempt", "log_ref", "version", "updated_at"])
-        return True
+        .filter(Q(leader_epoch__isnull=True) | Q(leader_epoch__lte=int(leader_epoch)))
+        .update(
+            state=JobRun.State.RUNNING,
+            started_at=now,
+            attempt=int(attempt),
+            log_ref=str(log_ref),
+            version=F("version") + 1,
+            updated_at=now,
+        )
+    )
+    return updated == 1
+
+
+_TERMINAL_STATES = (
+    JobRun.State.SUCCEEDED,
+    JobRun.State.FAILED,
+    JobRun.State.CANCELED,
+    JobRun.State.SKIPPED,
+    JobRun.State.TIMED_OUT,
+)
 
 
 def _jobrun_finish(
@@ -233,50 +292,29 @@ def _jobrun_finish(
     resource_io_write_bytes: Optional[int] = None,
 ):
     now = timezone.now()
-    with transaction.atomic():
-        try:
-            jr = JobRun.objects.select_for_update().get(id=job_run_id)
-        except JobRun.DoesNotExist:
-            return
-
-        # Only the assigned worker should complete it.
-        if jr.assigned_worker_id and jr.assigned_worker_id != worker_id:
-            return
-
-        # If already terminal, do nothing.
-        if jr.state in {
-            JobRun.State.SUCCEEDED,
-            JobRun.State.FAILED,
-            JobRun.State.CANCELED,
-            JobRun.State.SKIPPED,
-            JobRun.State.TIMED_OUT,
-        }:
-            return
-
-        jr.state = final_state
-        jr.finished_at = now
-        jr.exit_code = exit_code
-        jr.error_summary = (error_summary or "")[:2000]
-        jr.log_ref = str(log_ref)
-        if resource_cpu_seconds_total is not None:
-            jr.resource_cpu_seconds_total = float(resource_cpu_seconds_total)
-        if resource_peak_rss_bytes is not None:
-            jr.resource_peak_rss_bytes = int(resource_peak_rss_bytes)
-        if resource_io_read_bytes is not None:
-            jr.resource_io_read_bytes = int(resource_io_read_bytes)
-        if resource_io_write_bytes is not None:
-            jr.resource_io_write_bytes = int(resource_io_write_bytes)
-        jr.version = int(jr.version) + 1
-        update_fields = ["state", "finished_at", "exit_code", "error_summary", "log_ref", "version", "updated_at"]
-        if resource_cpu_seconds_total is not None:
-            update_fields.append("resource_cpu_seconds_total")
-        if resource_peak_rss_bytes is not None:
-            update_fields.append("resource_peak_rss_bytes")
-        if resource_io_read_bytes is not None:
-            update_fields.append("resource_io_read_bytes")
-        if resource_io_write_bytes is not None:
-            update_fields.append("resource_io_write_bytes")
-        jr.save(update_fields=update_fields)
+    fields = {
+        "state": final_state,
+        "finished_at": now,
+        "exit_code": exit_code,
+        "error_summary": (error_summary or "")[:2000],
+        "log_ref": str(log_ref),
+        "version": F("version") + 1,
+        "updated_at": now,
+    }
+    if resource_cpu_seconds_total is not None:
+        fields["resource_cpu_seconds_total"] = float(resource_cpu_seconds_total)
+    if resource_peak_rss_bytes is not None:
+        fields["resource_peak_rss_bytes"] = int(resource_peak_rss_bytes)
+    if resource_io_read_bytes is not None:
+        fields["resource_io_read_bytes"] = int(resource_io_read_bytes)
+    if resource_io_write_bytes is not None:
+        fields["resource_io_write_bytes"] = int(resource_io_write_bytes)
+
+    # Single UPDATE: only the assigned worker (or an unassigned row) may complete it,
+    # and terminal rows are left untouched.
+    JobRun.objects.filter(id=job_run_id).filter(
+        Q(assigned_worker_id="") | Q(assigned_worker_id=worker_id)
+    ).exclude(state__in=_TERMINAL_STATES).update(**fields)
 
 
 class WorkerService(worker_pb2_grpc.WorkerServiceServicer):
@@ -289,34 +327,35 @@ class WorkerService(worker_pb2_grpc.WorkerServiceServicer):
         self._proc_cancel_requested: bool = False
 
     def Ping(self, request: worker_pb2.PingRequest, context: grpc.ServicerContext) -> worker_pb2.PingResponse:
-        with self._lock:
-            now_ms = int(time.time() * 1000)
-            return worker_pb2.PingResponse(
-                worker_id=self._state.worker_id,
-                node_id=self._state.node_id,
-                observed_leader_epoch=int(self._state.cluster_epoch),
-                now_unix_ms=now_ms,
-            )
+        snap = self._state.coordination
+        now_ms = int(time.time() * 1000)
+        return worker_pb2.PingResponse(
+            worker_id=self._state.worker_id,
+            node_id=self._state.node_id,
+            observed_leader_epoch=int(snap.cluster_epoch),
+            now_unix_ms=now_ms,
+        )
 
     def GetStatus(
         self, request: worker_pb2.GetStatusRequest, context: grpc.ServicerContext
     ) -> worker_pb2.GetStatusResponse:
+        snap = self._state.coordination
         with self._lock:
             return worker_pb2.GetStatusResponse(
                 worker_id=self._state.worker_id,
                 node_id=self._state.node_id,
-                role=self._state.role,
+                role=snap.role,
                 detached=bool(self._state.detached),
                 draining=bool(self._state.draining),
                 load=int(self._state.load),
                 current_job_run_id=self._state.current_job_run_id,
-                observed_leader_epoch=int(self._state.cluster_epoch),
-                last_heartbeat_unix_ms=int(self._state.last_heartbeat_unix_ms),
+                observed_leader_epoch=int(snap.cluster_epoch),
+                last_heartbeat_unix_ms=int(snap.last_heartbeat_unix_ms),
             )
 
     def StartJob(self, request: worker_pb2.StartJobRequest, context: grpc.ServicerContext) -> worker_pb2.StartJobResponse:
         with self._lock:
-            if int(request.leader_epoch) < int(self._state.cluster_epoch or 0):
+            if int(request.leader_epoch) < int(self._state.coordination.cluster_epoch or 0):
                 return worker_pb2.StartJobResponse(
                     result=worker_pb2.StartJobResponse.REJECTED_OLD_EPOCH,
                     message="old epoch",
@@ -340,7 +379,6 @@ class WorkerService(worker_pb2_grpc.WorkerServiceServicer):
         job_run_id_str = (request.job_run_id or "").strip()
         job_run_id = _safe_int(job_run_id_str)
         command_name = (request.command_name or "").strip()
-        args_json = request.args_json or "{}"
         timeout_seconds = int(request.timeout_seconds or 0)
         attempt = int(request.attempt or 0)
 
@@ -354,20 +392,26 @@ class WorkerService(worker_pb2_grpc.WorkerServiceServicer):
                 result=worker_pb2.StartJobResponse.REJECTED_INVALID,
                 message="invalid command_name",
             )
-        try:
-            parsed_args = json.loads(args_json) if args_json else {}
-            if parsed_args is None:
-                parsed_args = {}
-            if not isinstance(parsed_args, (dict, list)):
+        if _START_JOB_HAS_STRUCT_ARGS and request.HasField("args"):
+            parsed_args = _struct_value_to_python(json_format.MessageToDict(request.args))
+        else:
+            # Fallback: args_json (JSON arrays, args a double cannot carry exactly, or leaders
+            # from before StartJobRequest.args).
+            args_json = request.args_json or "{}"
+            try:
+                parsed_args = json.loads(args_json) if args_json else {}
+                if parsed_args is None:
+                    parsed_args = {}
+                if not isinstance(parsed_args, (dict, list)):
+                    return worker_pb2.StartJobResponse(
+                        result=worker_pb2.StartJobResponse.REJECTED_INVALID,
+                        message="args_json must be object or array",
+                    )
+            except Exception:
                 return worker_pb2.StartJobResponse(
                     result=worker_pb2.StartJobResponse.REJECTED_INVALID,
-                    message="args_json must be object or array",
+                    message="args_json must be valid JSON",
                 )
-        except Exception:
-            return worker_pb2.StartJobResponse(
-                result=worker_pb2.StartJobResponse.REJECTED_INVALID,
-                message="args_json must be valid JSON",
-            )
 
         logs_dir = _job_logs_dir(worker_id=self._state.worker_id)
         logs_dir.mkdir(parents=True, exist_ok=True)
@@ -614,7 +658,7 @@ class WorkerService(worker_pb2_grpc.WorkerServiceServicer):
         self, request: worker_pb2.CancelJobRequest, context: grpc.ServicerContext
     ) -> worker_pb2.CancelJobResponse:
         with self._lock:
-            if int(request.leader_epoch) < int(self._state.cluster_epoch or 0):
+            if int(request.leader_epoch) < int(self._state.coordination.cluster_epoch or 0):
                 return worker_pb2.CancelJobResponse(
                     result=worker_pb2.CancelJobResponse.REJECTED_OLD_EPOCH,
                     message="old epoch",
@@ -685,9 +729,8 @@ class WorkerService(worker_pb2_grpc.WorkerServiceServicer):
         self, request: worker_pb2.ReloadConfigRequest, context: grpc.ServicerContext
     ) -> worker_pb2.ReloadConfigResponse:
         # Fence by epoch (same semantics as StartJob/CancelJob).
-        with self._lock:
-            if int(request.leader_epoch) < int(self._state.cluster_epoch or 0):
-                return worker_pb2.ReloadConfigResponse(ok=False, message="old epoch", cache_generation=0)
+        if int(request.leader_epoch) < int(self._state.coordination.cluster_epoch or 0):
+            return worker_pb2.ReloadConfigResponse(ok=False, message="old epoch", cache_generation=0)
 
         gen = reload_scheduler_settings_cache()
         return worker_pb2.ReloadConfigResponse(ok=True, message="reloaded", cache_generation=int(gen))
@@ -750,6 +793,109 @@ def start_worker_grpc_server(
     return server
 
 
+# Client channels are shared per (target, TLS files) so TLS handshakes / HTTP2 setup are
+# amortized across ping / dispatch / reload / reconcile calls.
+_CHANNEL_CACHE_MAX = 256
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 20000),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.http2.max_pings_without_data", 0),
+    # A restarted worker should become reachable again quickly.
+    ("grpc.initial_reconnect_backoff_ms", 500),
+    ("grpc.max_reconnect_backoff_ms", 5000),
+]
+_channel_cache: "OrderedDict[tuple[str, str, str], grpc.Channel]" = OrderedDict()
+_channel_cache_lock = threading.Lock()
+
+
+def _make_channel(target: str, tls_cert_file: str, tls_key_file: str) -> grpc.Channel:
+    if tls_cert_file and tls_key_file:
+        creds = create_channel_credentials(cert_file=tls_cert_file, key_file=tls_key_file)
+        return grpc.secure_channel(target, creds, options=_CHANNEL_OPTIONS)
+    return grpc.insecure_channel(target, options=_CHANNEL_OPTIONS)
+
+
+def get_channel(*, target: str, tls_cert_file: str, tls_key_file: str) -> grpc.Channel:
+    key = (str(target), str(tls_cert_file or ""), str(tls_key_file or ""))
+    evicted: list[grpc.Channel] = []
+    with _channel_cache_lock:
+        channel = _channel_cache.get(key)
+        if channel is not None:
+            _channel_cache.move_to_end(key)
+            return channel
+        channel = _make_channel(*key)
+        _channel_cache[key] = channel
+        while len(_channel_cache) > _CHANNEL_CACHE_MAX:
+            _, old = _channel_cache.popitem(last=False)
+            evicted.append(old)
+    for old in evicted:
+        try:
+            old.close()
+        except Exception:
+            pass
+    return channel
+
+
+def _discard_channel(*, target: str, tls_cert_file: str, tls_key_file: str, channel: grpc.Channel) -> None:
+    key = (str(target), str(tls_cert_file or ""), str(tls_key_file or ""))
+    with _channel_cache_lock:
+        if _channel_cache.get(key) is not channel:
+            return
+        del _channel_cache[key]
+    try:
+        channel.close()
+    except Exception:
+        pass
+
+
+def prune_channels(*, active_targets) -> int:
+    """Close cached channels whose target is no longer an active worker. Returns the count closed."""
+    active = set(active_targets)
+    with _channel_cache_lock:
+        stale = [k for k in _channel_cache if k[0] not in active]
+        channels = [_channel_cache.pop(k) for k in stale]
+    for channel in channels:
+        try:
+            channel.close()
+        except Exception:
+            pass
+    return len(channels)
+
+
+def close_all_channels() -> None:
+    with _channel_cache_lock:
+        channels = list(_channel_cache.values())
+        _channel_cache.clear()
+    for channel in channels:
+        try:
+            channel.close()
+        except Exception:
+            pass
+
+
+def _call_worker(
+    *,
+    target: str,
+    tls_cert_file: str,
+    tls_key_file: str,
+    channel: Optional[grpc.Channel],
+    invoke,
+):
+    # Explicit channel: caller owns it. Otherwise use the shared cache and drop the entry when
+    # the worker is unreachable (it may have moved, or restarted with new TLS material).
+    if channel is not None:
+        return invoke(worker_pb2_grpc.WorkerServiceStub(channel))
+
+    cached = get_channel(target=target, tls_cert_file=tls_cert_file, tls_key_file=tls_key_file)
+    try:
+        return invoke(worker_pb2_grpc.WorkerServiceStub(cached))
+    except grpc.RpcError as e:
+        code = e.code() if hasattr(e, "code") else None
+        if code == grpc.StatusCode.UNAVAILABLE:
+            _discard_channel(target=target, tls_cert_file=tls_cert_file, tls_key_file=tls_key_file, channel=cached)
+        raise
+
+
 def ping_worker(
     *,
     target: str,
@@ -758,21 +904,16 @@ def ping_worker(
     tls_cert_file: str,
     tls_key_file: str,
     timeout_seconds: float = 0.5,
+    channel: Optional[grpc.Channel] = None,
 ) -> worker_pb2.PingResponse:
-    if tls_cert_file and tls_key_file:
-        creds = create_channel_credentials(cert_file=tls_cert_file, key_file=tls_key_file)
-        channel = grpc.secure_channel(target, creds)
-    else:
-        channel = grpc.insecure_channel(target)
-
-    stub = worker_pb2_grpc.WorkerServiceStub(channel)
-    try:
-        return stub.Ping(
-            worker_pb2.PingRequest(caller_role=caller_role, leader_epoch=int(leader_epoch)),
-            timeout=timeout_seconds,
-        )
-    finally:
-        channel.close()
+    req = worker_pb2.PingRequest(caller_role=caller_role, leader_epoch=int(leader_epoch))
+    return _call_worker(
+        target=target,
+        tls_cert_file=tls_cert_file,
+        tls_key_file=tls_key_file,
+        channel=channel,
+        invoke=lambda stub: stub.Ping(req, timeout=timeout_seconds),
+    )
 
 
 def get_status_worker(
@@ -782,21 +923,16 @@ def get_status_worker(
     tls_cert_file: str,
     tls_key_file: str,
     timeout_seconds: float = 0.5,
+    channel: Optional[grpc.Channel] = None,
 ) -> worker_pb2.GetStatusResponse:
-    if tls_cert_file and tls_key_file:
-        creds = create_channel_credentials(cert_file=tls_cert_file, key_file=tls_key_file)
-        channel = grpc.secure_channel(target, creds)
-    else:
-        channel = grpc.insecure_channel(target)
-
-    stub = worker_pb2_grpc.WorkerServiceStub(channel)
-    try:
-        return stub.GetStatus(
-            worker_pb2.GetStatusRequest(leader_epoch=int(leader_epoch)),
-            timeout=timeout_seconds,
-        )
-    finally:
-        channel.close()
+    req = worker_pb2.GetStatusRequest(leader_epoch=int(leader_epoch))
+    return _call_worker(
+        target=target,
+        tls_cert_file=tls_cert_file,
+        tls_key_file=tls_key_file,
+        channel=channel,
+        invoke=lambda stub: stub.GetStatus(req, timeout=timeout_seconds),
+    )
 
 
 def start_job_on_worker(
@@ -805,34 +941,44 @@ def start_job_on_worker(
     leader_epoch: int,
     job_run_id: str,
     command_name: str,
-    args_json: str,
+    args: dict | list | None,
     timeout_seconds: int,
     attempt: int,
     tls_cert_file: str,
     tls_key_file: str,
     timeout_rpc_seconds: float = 1.0,
+    channel: Optional[grpc.Channel] = None,
+    send_args_json: bool = False,
 ) -> worker_pb2.StartJobResponse:
-    if tls_cert_file and tls_key_file:
-        creds = create_channel_credentials(cert_file=tls_cert_file, key_file=tls_key_file)
-        channel = grpc.secure_channel(target, creds)
-    else:
-        channel = grpc.insecure_channel(target)
-
-    stub = worker_pb2_grpc.WorkerServiceStub(channel)
-    try:
-        return stub.StartJob(
-            worker_pb2.StartJobRequest(
-                leader_epoch=int(leader_epoch),
-                job_run_id=str(job_run_id),
-                command_name=str(command_name),
-                args_json=str(args_json or "{}"),
-                timeout_seconds=int(timeout_seconds or 0),
-                attempt=int(attempt or 0),
-            ),
-            timeout=timeout_rpc_seconds,
-        )
-    finally:
-        channel.close()
+    req = worker_pb2.StartJobRequest(
+        leader_epoch=int(leader_epoch),
+        job_run_id=str(job_run_id),
+        command_name=str(command_name),
+        timeout_seconds=int(timeout_seconds or 0),
+        attempt=int(attempt or 0),
+    )
+    if args is None:
+        args = {}
+    # Exactly one encoding per dispatch: the Struct when it round-trips exactly (it cannot carry a
+    # top-level array and stores every number as double), args_json otherwise. send_args_json
+    # (SCHEDULER_GRPC_SEND_ARGS_JSON) forces args_json for workers that predate StartJobRequest.args.
+    sent_struct = False
+    if not send_args_json and _START_JOB_HAS_STRUCT_ARGS and isinstance(args, dict) and _struct_exact(args):
+        try:
+            json_format.ParseDict(args, req.args)
+            sent_struct = True
+        except Exception:
+            req.ClearField("args")
+    if not sent_struct:
+        req.args_json = json.dumps(args, ensure_ascii=False)
+
+    return _call_worker(
+        target=target,
+        tls_cert_file=tls_cert_file,
+        tls_key_file=tls_key_file,
+        channel=channel,
+        invoke=lambda stub: stub.StartJob(req, timeout=timeout_rpc_seconds),
+    )
 
 
 def cancel_job_on_worker(
@@ -844,25 +990,20 @@ def cancel_job_on_worker(
     tls_cert_file: str,
     tls_key_file: str,
     timeout_rpc_seconds: float = 1.0,
+    channel: Optional[grpc.Channel] = None,
 ) -> worker_pb2.CancelJobResponse:
-    if tls_cert_file and tls_key_file:
-        creds = create_channel_credentials(cert_file=tls_cert_file, key_file=tls_key_file)
-        channel = grpc.secure_channel(target, creds)
-    else:
-        channel = grpc.insecure_channel(target)
-
-    stub = worker_pb2_grpc.WorkerServiceStub(channel)
-    try:
-        return stub.CancelJob(
-            worker_pb2.CancelJobRequest(
-                leader_epoch=int(leader_epoch),
-                job_run_id=str(job_run_id),
-                reason=str(reason or ""),
-            ),
-            timeout=timeout_rpc_seconds,
-        )
-    finally:
-        channel.close()
+    req = worker_pb2.CancelJobRequest(
+        leader_epoch=int(leader_epoch),
+        job_run_id=str(job_run_id),
+        reason=str(reason or ""),
+    )
+    return _call_worker(
+        target=target,
+        tls_cert_file=tls_cert_file,
+        tls_key_file=tls_key_file,
+        channel=channel,
+        invoke=lambda stub: stub.CancelJob(req, timeout=timeout_rpc_seconds),
+    )
 
 
 def reload_config_on_worker(
@@ -873,21 +1014,16 @@ def reload_config_on_worker(
     tls_cert_file: str,
     tls_key_file: str,
     timeout_rpc_seconds: float = 1.0,
+    channel: Optional[grpc.Channel] = None,
 ) -> worker_pb2.ReloadConfigResponse:
-    if tls_cert_file and tls_key_file:
-        creds = create_channel_credentials(cert_file=tls_cert_file, key_file=tls_key_file)
-        channel = grpc.secure_channel(target, creds)
-    else:
-        channel = grpc.insecure_channel(target)
-
-    stub = worker_pb2_grpc.WorkerServiceStub(channel)
-    try:
-        return stub.ReloadConfig(
-            worker_pb2.ReloadConfigRequest(
-                leader_epoch=int(leader_epoch),
-                requested_by=str(requested_by or ""),
-            ),
-            timeout=timeout_rpc_seconds,
-        )
-    finally:
-        channel.close()
+    req = worker_pb2.ReloadConfigRequest(
+        leader_epoch=int(leader_epoch),
+        requested_by=str(requested_by or ""),
+    )
+    return _call_worker(
+        target=target,
+        tls_cert_file=tls_cert_file,
+        tls_key_file=tls_key_file,
+        channel=channel,
+        invoke=lambda stub: stub.ReloadConfig(req, timeout=timeout_rpc_seconds),
+    )
@@ -22,49 +22,50 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cworker.proto\x12\x0cscheduler.v1\"8\n\x0bPingRequest\x12\x13\n\x0b\x63\x61ller_role\x18\x01 \x01(\t\x12\x14\n\x0cleader_epoch\x18\x02 \x01(\x03\"f\n\x0cPingResponse\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0f\n\x07node_id\x18\x02 \x01(\t\x12\x1d\n\x15observed_leader_epoch\x18\x03 \x01(\x03\x12\x13\n\x0bnow_unix_ms\x18\x04 \x01(\x03\"=\n\x10GetStatusRequest\x12\x13\n\x0b\x63\x61ller_role\x18\x01 \x01(\t\x12\x14\n\x0cleader_epoch\x18\x02 \x01(\x03\"\xd2\x01\n\x11GetStatusResponse\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0f\n\x07node_id\x18\x02 \x01(\t\x12\x0c\n\x04role\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65tached\x18\x04 \x01(\x08\x12\x10\n\x08\x64raining\x18\x05 \x01(\x08\x12\x0c\n\x04load\x18\x06 \x01(\x05\x12\x1a\n\x12\x63urrent_job_run_id\x18\x07 \x01(\t\x12\x1d\n\x15observed_leader_epoch\x18\x08 \x01(\x03\x12\x1e\n\x16last_heartbeat_unix_ms\x18\t \x01(\x03\"\x8e\x01\n\x0fStartJobRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x12\n\njob_run_id\x18\x02 \x01(\t\x12\x14\n\x0c\x63ommand_name\x18\x03 \x01(\t\x12\x11\n\targs_json\x18\x04 \x01(\t\x12\x17\n\x0ftimeout_seconds\x18\x05 \x01(\x05\x12\x0f\n\x07\x61ttempt\x18\x06 \x01(\x05\"\x85\x02\n\x10StartJobResponse\x12\x35\n\x06result\x18\x01 \x01(\x0e\x32%.scheduler.v1.StartJobResponse.Result\x12\x0f\n\x07message\x18\x02 \x01(\t\"\xa8\x01\n\x06Result\x12\x16\n\x12RESULT_UNSPECIFIED\x10\x00\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x01\x12\x16\n\x12REJECTED_OLD_EPOCH\x10\x02\x12\x15\n\x11REJECTED_DETACHED\x10\x03\x12\x15\n\x11REJECTED_DRAINING\x10\x04\x12\x1c\n\x18REJECTED_ALREADY_RUNNING\x10\x05\x12\x14\n\x10REJECTED_INVALID\x10\x06\"L\n\x10\x43\x61ncelJobRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x12\n\njob_run_id\x18\x02 \x01(\t\x12\x0e\n\x06reason\x18\x03 \x01(\t\"\xc9\x01\n\x11\x43\x61ncelJobResponse\x12\x36\n\x06result\x18\x01 \x01(\x0e\x32&.scheduler.v1.CancelJobResponse.Result\x12\x0f\n\x07message\x18\x02 \x01(\t\"k\n\x06Result\x12\x16\n\x12RESULT_UNSPECIFIED\x10\x00\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x01\x12\x16\n\x12REJECTED_OLD_EPOCH\x10\x02\x12\r\n\tNOT_FOUND\x10\x03\x12\x14\n\x10\x41LREADY_FINISHED\x10\x04\"4\n\x0c\x44rainRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x0e\n\x06\x65nable\x18\x02 \x01(\x08\"!\n\rDrainResponse\x12\x10\n\x08\x64raining\x18\x01 \x01(\x08\"A\n\x13ReloadConfigRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x14\n\x0crequested_by\x18\x02 \x01(\t\"M\n\x14ReloadConfigResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x10\x63\x61\x63he_generation\x18\x03 \x01(\x03\"Y\n\x1a\x43onfirmContinuationRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x12\n\njob_run_id\x18\x03 \x01(\t\"\xbe\x01\n\x1b\x43onfirmContinuationResponse\x12\x44\n\x08\x64\x65\x63ision\x18\x01 \x01(\x0e\x32\x32.scheduler.v1.ConfirmContinuationResponse.Decision\x12\x0f\n\x07message\x18\x02 \x01(\t\"H\n\x08\x44\x65\x63ision\x12\x18\n\x14\x44\x45\x43ISION_UNSPECIFIED\x10\x00\x12\x12\n\x0e\x41LLOW_CONTINUE\x10\x01\x12\x0e\n\nMUST_ABORT\x10\x02\x32\xba\x04\n\rWorkerService\x12=\n\x04Ping\x12\x19.scheduler.v1.PingRequest\x1a\x1a.scheduler.v1.PingResponse\x12L\n\tGetStatus\x12\x1e.scheduler.v1.GetStatusRequest\x1a\x1f.scheduler.v1.GetStatusResponse\x12I\n\x08StartJob\x12\x1d.scheduler.v1.StartJobRequest\x1a\x1e.scheduler.v1.StartJobResponse\x12L\n\tCancelJob\x12\x1e.scheduler.v1.CancelJobRequest\x1a\x1f.scheduler.v1.CancelJobResponse\x12@\n\x05\x44rain\x12\x1a.scheduler.v1.DrainRequest\x1a\x1b.scheduler.v1.DrainResponse\x12U\n\x0cReloadConfig\x12!.scheduler.v1.ReloadConfigRequest\x1a\".scheduler.v1.ReloadConfigResponse\x12j\n\x13\x43onfirmContinuation\x12(.scheduler.v1.ConfirmContinuationRequest\x1a).scheduler.v1.ConfirmContinuationResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cworker.proto\x12\x0cscheduler.v1\x1a\x1cgoogle/protobuf/struct.proto\"8\n\x0bPingRequest\x12\x13\n\x0b\x63\x61ller_role\x18\x01 \x01(\t\x12\x14\n\x0cleader_epoch\x18\x02 \x01(\x03\"f\n\x0cPingResponse\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0f\n\x07node_id\x18\x02 \x01(\t\x12\x1d\n\x15observed_leader_epoch\x18\x03 \x01(\x03\x12\x13\n\x0bnow_unix_ms\x18\x04 \x01(\x03\"=\n\x10GetStatusRequest\x12\x13\n\x0b\x63\x61ller_role\x18\x01 \x01(\t\x12\x14\n\x0cleader_epoch\x18\x02 \x01(\x03\"\xd2\x01\n\x11GetStatusResponse\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0f\n\x07node_id\x18\x02 \x01(\t\x12\x0c\n\x04role\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65tached\x18\x04 \x01(\x08\x12\x10\n\x08\x64raining\x18\x05 \x01(\x08\x12\x0c\n\x04load\x18\x06 \x01(\x05\x12\x1a\n\x12\x63urrent_job_run_id\x18\x07 \x01(\t\x12\x1d\n\x15observed_leader_epoch\x18\x08 \x01(\x03\x12\x1e\n\x16last_heartbeat_unix_ms\x18\t \x01(\x03\"\xb5\x01\n\x0fStartJobRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x12\n\njob_run_id\x18\x02 \x01(\t\x12\x14\n\x0c\x63ommand_name\x18\x03 \x01(\t\x12\x11\n\targs_json\x18\x04 \x01(\t\x12\x17\n\x0ftimeout_seconds\x18\x05 \x01(\x05\x12\x0f\n\x07\x61ttempt\x18\x06 \x01(\x05\x12%\n\x04\x61rgs\x18\x07 \x01(\x0b\x32\x17.google.protobuf.Struct\"\x85\x02\n\x10StartJobResponse\x12\x35\n\x06result\x18\x01 \x01(\x0e\x32%.scheduler.v1.StartJobResponse.Result\x12\x0f\n\x07message\x18\x02 \x01(\t\"\xa8\x01\n\x06Result\x12\x16\n\x12RESULT_UNSPECIFIED\x10\x00\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x01\x12\x16\n\x12REJECTED_OLD_EPOCH\x10\x02\x12\x15\n\x11REJECTED_DETACHED\x10\x03\x12\x15\n\x11REJECTED_DRAINING\x10\x04\x12\x1c\n\x18REJECTED_ALREADY_RUNNING\x10\x05\x12\x14\n\x10REJECTED_INVALID\x10\x06\"L\n\x10\x43\x61ncelJobRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x12\n\njob_run_id\x18\x02 \x01(\t\x12\x0e\n\x06reason\x18\x03 \x01(\t\"\xc9\x01\n\x11\x43\x61ncelJobResponse\x12\x36\n\x06result\x18\x01 \x01(\x0e\x32&.scheduler.v1.CancelJobResponse.Result\x12\x0f\n\x07message\x18\x02 \x01(\t\"k\n\x06Result\x12\x16\n\x12RESULT_UNSPECIFIED\x10\x00\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x01\x12\x16\n\x12REJECTED_OLD_EPOCH\x10\x02\x12\r\n\tNOT_FOUND\x10\x03\x12\x14\n\x10\x41LREADY_FINISHED\x10\x04\"4\n\x0c\x44rainRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x0e\n\x06\x65nable\x18\x02 \x01(\x08\"!\n\rDrainResponse\x12\x10\n\x08\x64raining\x18\x01 \x01(\x08\"A\n\x13ReloadConfigRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x14\n\x0crequested_by\x18\x02 \x01(\t\"M\n\x14ReloadConfigResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x10\x63\x61\x63he_generation\x18\x03 \x01(\x03\"Y\n\x1a\x43onfirmContinuationRequest\x12\x14\n\x0cleader_epoch\x18\x01 \x01(\x03\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x12\n\njob_run_id\x18\x03 \x01(\t\"\xbe\x01\n\x1b\x43onfirmContinuationResponse\x12\x44\n\x08\x64\x65\x63ision\x18\x01 \x01(\x0e\x32\x32.scheduler.v1.ConfirmContinuationResponse.Decision\x12\x0f\n\x07message\x18\x02 \x01(\t\"H\n\x08\x44\x65\x63ision\x12\x18\n\x14\x44\x45\x43ISION_UNSPECIFIED\x10\x00\x12\x12\n\x0e\x41LLOW_CONTINUE\x10\x01\x12\x0e\n\nMUST_ABORT\x10\x02\x32\xba\x04\n\rWorkerService\x12=\n\x04Ping\x12\x19.scheduler.v1.PingRequest\x1a\x1a.scheduler.v1.PingResponse\x12L\n\tGetStatus\x12\x1e.scheduler.v1.GetStatusRequest\x1a\x1f.scheduler.v1.GetStatusResponse\x12I\n\x08StartJob\x12\x1d.scheduler.v1.StartJobRequest\x1a\x1e.scheduler.v1.StartJobResponse\x12L\n\tCancelJob\x12\x1e.scheduler.v1.CancelJobRequest\x1a\x1f.scheduler.v1.CancelJobResponse\x12@\n\x05\x44rain\x12\x1a.scheduler.v1.DrainRequest\x1a\x1b.scheduler.v1.DrainResponse\x12U\n\x0cReloadConfig\x12!.scheduler.v1.ReloadConfigRequest\x1a\".scheduler.v1.ReloadConfigResponse\x12j\n\x13\x43onfirmContinuation\x12(.scheduler.v1.ConfirmContinuationRequest\x1a).scheduler.v1.ConfirmContinuationResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'worker_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_PINGREQUEST']._serialized_start=30
-  _globals['_PINGREQUEST']._serialized_end=86
-  _globals['_PINGRESPONSE']._serialized_start=88
-  _globals['_PINGRESPONSE']._serialized_end=190
-  _globals['_GETSTATUSREQUEST']._serialized_start=192
-  _globals['_GETSTATUSREQUEST']._serialized_end=253
-  _globals['_GETSTATUSRESPONSE']._serialized_start=256
-  _globals['_GETSTATUSRESPONSE']._serialized_end=466
-  _globals['_STARTJOBREQUEST']._serialized_start=469
-  _globals['_STARTJOBREQUEST']._serialized_end=611
-  _globals['_STARTJOBRESPONSE']._serialized_start=614
-  _globals['_STARTJOBRESPONSE']._serialized_end=875
-  _globals['_STARTJOBRESPONSE_RESULT']._serialized_start=707
-  _globals['_STARTJOBRESPONSE_RESULT']._serialized_end=875
-  _globals['_CANCELJOBREQUEST']._serialized_start=877
-  _globals['_CANCELJOBREQUEST']._serialized_end=953
-  _globals['_CANCELJOBRESPONSE']._serialized_start=956
-  _globals['_CANCELJOBRESPONSE']._serialized_end=1157
-  _globals['_CANCELJOBRESPONSE_RESULT']._serialized_start=1050
-  _globals['_CANCELJOBRESPONSE_RESULT']._serialized_end=1157
-  _globals['_DRAINREQUEST']._serialized_start=1159
-  _globals['_DRAINREQUEST']._serialized_end=1211
-  _globals['_DRAINRESPONSE']._serialized_start=1213
-  _globals['_DRAINRESPONSE']._serialized_end=1246
-  _globals['_RELOADCONFIGREQUEST']._serialized_start=1248
-  _globals['_RELOADCONFIGREQUEST']._serialized_end=1313
-  _globals['_RELOADCONFIGRESPONSE']._serialized_start=1315
-  _globals['_RELOADCONFIGRESPONSE']._serialized_end=1392
-  _globals['_CONFIRMCONTINUATIONREQUEST']._serialized_start=1394
-  _globals['_CONFIRMCONTINUATIONREQUEST']._serialized_end=1483
-  _globals['_CONFIRMCONTINUATIONRESPONSE']._serialized_start=1486
-  _globals['_CONFIRMCONTINUATIONRESPONSE']._serialized_end=1676
-  _globals['_CONFIRMCONTINUATIONRESPONSE_DECISION']._serialized_start=1604
-  _globals['_CONFIRMCONTINUATIONRESPONSE_DECISION']._serialized_end=1676
-  _globals['_WORKERSERVICE']._serialized_start=1679
-  _globals['_WORKERSERVICE']._serialized_end=2249
+  _globals['_PINGREQUEST']._serialized_start=60
+  _globals['_PINGREQUEST']._serialized_end=116
+  _globals['_PINGRESPONSE']._serialized_start=118
+  _globals['_PINGRESPONSE']._serialized_end=220
+  _globals['_GETSTATUSREQUEST']._serialized_start=222
+  _globals['_GETSTATUSREQUEST']._serialized_end=283
+  _globals['_GETSTATUSRESPONSE']._serialized_start=286
+  _globals['_GETSTATUSRESPONSE']._serialized_end=496
+  _globals['_STARTJOBREQUEST']._serialized_start=499
+  _globals['_STARTJOBREQUEST']._serialized_end=680
+  _globals['_STARTJOBRESPONSE']._serialized_start=683
+  _globals['_STARTJOBRESPONSE']._serialized_end=944
+  _globals['_STARTJOBRESPONSE_RESULT']._serialized_start=776
+  _globals['_STARTJOBRESPONSE_RESULT']._serialized_end=944
+  _globals['_CANCELJOBREQUEST']._serialized_start=946
+  _globals['_CANCELJOBREQUEST']._serialized_end=1022
+  _globals['_CANCELJOBRESPONSE']._serialized_start=1025
+  _globals['_CANCELJOBRESPONSE']._serialized_end=1226
+  _globals['_CANCELJOBRESPONSE_RESULT']._serialized_start=1119
+  _globals['_CANCELJOBRESPONSE_RESULT']._serialized_end=1226
+  _globals['_DRAINREQUEST']._serialized_start=1228
+  _globals['_DRAINREQUEST']._serialized_end=1280
+  _globals['_DRAINRESPONSE']._serialized_start=1282
+  _globals['_DRAINRESPONSE']._serialized_end=1315
+  _globals['_RELOADCONFIGREQUEST']._serialized_start=1317
+  _globals['_RELOADCONFIGREQUEST']._serialized_end=1382
+  _globals['_RELOADCONFIGRESPONSE']._serialized_start=1384
+  _globals['_RELOADCONFIGRESPONSE']._serialized_end=1461
+  _globals['_CONFIRMCONTINUATIONREQUEST']._serialized_start=1463
+  _globals['_CONFIRMCONTINUATIONREQUEST']._serialized_end=1552
+  _globals['_CONFIRMCONTINUATIONRESPONSE']._serialized_start=1555
+  _globals['_CONFIRMCONTINUATIONRESPONSE']._serialized_end=1745
+  _globals['_CONFIRMCONTINUATIONRESPONSE_DECISION']._serialized_start=1673
+  _globals['_CONFIRMCONTINUATIONRESPONSE_DECISION']._serialized_end=1745
+  _globals['_WORKERSERVICE']._serialized_start=1748
+  _globals['_WORKERSERVICE']._serialized_end=2318
 # @@protoc_insertion_point(module_scope)
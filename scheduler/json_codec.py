@@ -0,0 +1,56 @@
+"""JSON encode/decode for JSONField columns and HTTP bodies, backed by orjson when installed.
+
+Falls back to the stdlib codec when orjson is missing or rejects a value
+(e.g. integers beyond 64 bits), so stored JSON is the same either way.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONEncoder(json.JSONEncoder):
+    def encode(self, o):
+        if orjson is not None:
+            try:
+                return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            except TypeError:
+                pass
+        return super().encode(o)
+
+
+class FastJSONDecoder(json.JSONDecoder):
+    def decode(self, s, *args, **kwargs):
+        if orjson is not None:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass
+        return super().decode(s, *args, **kwargs)
+
+
+def loads(data):
+    """json.loads() for bytes/str request and response bodies (no separate UTF-8 decode with orjson)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_bytes(obj, *, default=None) -> bytes:
+    """UTF-8 JSON bytes, as json.dumps(obj, ensure_ascii=False, default=default).encode("utf-8")."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, default=default).encode("utf-8")
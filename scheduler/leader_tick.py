@@ -5,7 +5,8 @@ from datetime import timedelta
 
 from django.db import IntegrityError
 from django.db import transaction
-from django.db.models import Count
+from django.db.models import Case, Count, F, TextField, Value, When
+from django.db.models.functions import Concat
 from django.utils import timezone
 
 from scheduler.models import JobDefinition, JobRun
@@ -146,6 +147,81 @@ def _ensure_job_run(job_definition: JobDefinition, scheduled_for) -> bool:
         return False
 
 
+def _append_error_summary(line: str):
+    """SQL expression appending `line` to JobRun.error_summary (newline-separated)."""
+    return Case(
+        When(error_summary="", then=Value(line)),
+        default=Concat(F("error_summary"), Value("\n" + line), output_field=TextField()),
+        output_field=TextField(),
+    )
+
+
+def apply_reconcile_status(*, running, status_by_worker: dict[str, str], confirm_seconds: int, now=None) -> None:
+    """Apply one reconcile round: ``status_by_worker`` maps worker_id -> current job_run_id ("" = idle).
+
+    Only workers that answered are acted on. RUNNING rows whose CONFIRMING deadline passed are
+    orphaned; RUNNING rows the worker does not report enter CONFIRMING.
+    """
+
+    # Set-based transitions (one UPDATE per kind instead of one transaction per row).
+    # Each UPDATE re-checks state in its WHERE, so concurrent changes are never overwritten.
+    now_dt = now or timezone.now()
+    answered = list(status_by_worker.keys())
+    if answered:
+        # If deadline exceeded, orphan regardless of worker active.
+        orphan_reason = "orphaned: confirming deadline exceeded (worker status mismatch)"
+        JobRun.objects.filter(
+            state=JobRun.State.RUNNING,
+            continuation_state=JobRun.ContinuationState.CONFIRMING,
+            continuation_check_deadline_at__lte=now_dt,
+            assigned_worker_id__in=answered,
+        ).update(
+            state=JobRun.State.ORPHANED,
+            error_summary=_append_error_summary(orphan_reason),
+            assigned_worker_id="",
+            assigned_at=None,
+            started_at=None,
+            finished_at=None,
+            exit_code=None,
+            continuation_state=JobRun.ContinuationState.NONE,
+            continuation_check_started_at=None,
+            continuation_check_deadline_at=None,
+            version=F("version") + 1,
+            attempt=F("attempt") + 1,
+            updated_at=now_dt,
+        )
+
+    confirming_ids_by_reason: dict[str, list[int]] = {}
+    for jr in running:
+        wid = jr.assigned_worker_id
+        if wid not in status_by_worker:
+            continue
+        if jr.continuation_state == JobRun.ContinuationState.CONFIRMING:
+            continue
+
+        cur = status_by_worker.get(wid) or ""
+        if not cur:
+            reason = "confirming: worker reports no current job"
+        elif cur != str(jr.id):
+            reason = f"confirming: worker reports different job_run_id={cur}"
+        else:
+            continue
+        confirming_ids_by_reason.setdefault(reason, []).append(int(jr.id))
+
+    confirm_seconds = max(1, int(confirm_seconds or 0))
+    for reason, ids in confirming_ids_by_reason.items():
+        JobRun.objects.filter(id__in=ids, state=JobRun.State.RUNNING).exclude(
+            continuation_state=JobRun.ContinuationState.CONFIRMING
+        ).update(
+            continuation_state=JobRun.ContinuationState.CONFIRMING,
+            continuation_check_started_at=now_dt,
+            continuation_check_deadline_at=now_dt + timedelta(seconds=confirm_seconds),
+            error_summary=_append_error_summary(reason),
+            version=F("version") + 1,
+            updated_at=now_dt,
+        )
+
+
 def run_leader_tick_snapshot(
     *,
     redis_url: str,
@@ -200,7 +276,8 @@ def run_leader_tick_snapshot(
                     scheduled_for__isnull=False,
                     scheduled_for__lt=cutoff,
                 )
-                .order_by("scheduled_for", "id")[:500]
+                .order_by("scheduled_for", "id")
+                .only("id", "scheduled_for", "error_summary", "version")[:500]
             )
             for jr in stale:
                 jr.state = JobRun.State.SKIPPED
@@ -244,6 +321,7 @@ def run_leader_tick_snapshot(
             )
             .exclude(assigned_worker_id="")
             .order_by("assigned_at", "id")
+            .only("id", "assigned_worker_id", "error_summary", "version", "attempt")
         )
         for jr in stuck_assigned:
             if jr.assigned_worker_id in active_worker_set:
@@ -263,6 +341,15 @@ def run_leader_tick_snapshot(
             .filter(state=JobRun.State.RUNNING)
             .exclude(assigned_worker_id="")
             .order_by("started_at", "id")
+            .only(
+                "id",
+                "assigned_worker_id",
+                "continuation_state",
+                "continuation_check_deadline_at",
+                "error_summary",
+                "version",
+                "attempt",
+            )
         )
         for jr in running:
             if jr.continuation_state == JobRun.ContinuationState.NONE:
@@ -412,6 +499,7 @@ def run_leader_tick_snapshot(
                     )
                     .exclude(assigned_worker_id="")
                     .order_by("assigned_at", "id")
+                    .only("id", "assigned_worker_id", "assigned_at", "error_summary", "version")
                 )
                 if max_per_tick > 0:
                     candidates = candidates[:max_per_tick]
@@ -440,7 +528,9 @@ def run_leader_tick_snapshot(
                     assigned_counts[best] = int(assigned_counts.get(best, 0)) + 1
                     rebalanced_job_runs += 1
 
-            # Assign only runs in the current window (including the immediate lookahead)
+            # Assign only runs in the current window (including the immediate lookahead).
+            # SKIP LOCKED claims a disjoint slice (rows held elsewhere are left for the next tick);
+            # the claimed rows are then written with one UPDATE per chosen worker instead of per row.
             pending = (
                 JobRun.objects.select_for_update(skip_locked=True)
                 .filter(
@@ -449,27 +539,33 @@ def run_leader_tick_snapshot(
                     scheduled_for__lte=window_end,
                 )
                 .order_by("scheduled_for", "id")
+                .values_list("id", "state")
             )
 
             # Keep leader tick cheap even if backlog is large.
             pending = pending[:500]
 
-            for jr in pending:
-                is_reassign = jr.state == JobRun.State.ORPHANED
-                assigned_worker_id = _pick_worker(int(jr.id))
-                jr.assigned_worker_id = assigned_worker_id
-                jr.assigned_at = now
-                jr.state = JobRun.State.ASSIGNED
-                jr.leader_epoch = int(leader_epoch)
-                jr.version = int(jr.version) + 1
-                jr.save(update_fields=["assigned_worker_id", "assigned_at", "state", "leader_epoch", "version", "updated_at"])
+            ids_by_worker: dict[str, list[int]] = {}
+            for jr_id, jr_state in pending:
+                assigned_worker_id = _pick_worker(int(jr_id))
+                ids_by_worker.setdefault(assigned_worker_id, []).append(int(jr_id))
                 assigned_job_runs += 1
-                if is_reassign:
+                if jr_state == JobRun.State.ORPHANED:
                     reassigned_job_runs += 1
 
                 # Update in-memory load snapshot so the batch balances well.
                 assigned_counts[assigned_worker_id] = int(assigned_counts.get(assigned_worker_id, 0)) + 1
 
+            for assigned_worker_id, ids in ids_by_worker.items():
+                JobRun.objects.filter(id__in=ids).update(
+                    assigned_worker_id=assigned_worker_id,
+                    assigned_at=now,
+                    state=JobRun.State.ASSIGNED,
+                    leader_epoch=int(leader_epoch),
+                    version=F("version") + 1,
+                    updated_at=now,
+                )
+
         pending_runs = JobRun.objects.filter(state=JobRun.State.PENDING).count()
 
     return LeaderTickSnapshot(
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from scheduler.conf import get_int
+from scheduler.models import AdminActionLog, ConfigReloadRequest
+
+
+def _delete_in_batches(qs, *, batch_size: int) -> int:
+    """Delete rows matching qs by id batches so each statement/lock stays short."""
+    total = 0
+    while True:
+        ids = list(qs.order_by("id").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        deleted, _ = qs.model.objects.filter(id__in=ids).delete()
+        total += int(deleted)
+        if len(ids) < batch_size:
+            break
+    return total
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete AdminActionLog rows older than SCHEDULER_AUDIT_RETENTION_DAYS and finished ConfigReloadRequest rows "
+        "older than SCHEDULER_CONFIG_RELOAD_RETENTION_DAYS (in small batches)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Override retention days (defaults to SCHEDULER_AUDIT_RETENTION_DAYS; 0 disables)",
+        )
+        parser.add_argument(
+            "--reload-days",
+            type=int,
+            default=None,
+            help="Override reload request retention days (defaults to SCHEDULER_CONFIG_RELOAD_RETENTION_DAYS; 0 disables)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Rows deleted per statement (keeps each transaction/lock short)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, int(options["batch_size"]))
+        now = timezone.now()
+
+        raw_days = options.get("days")
+        days = int(raw_days) if raw_days is not None else get_int(key="SCHEDULER_AUDIT_RETENTION_DAYS", default=365, fresh=True)
+        if days <= 0:
+            self.stdout.write("audit_prune disabled (retention_days=0)")
+        else:
+            cutoff = now - timedelta(days=days)
+            total = _delete_in_batches(AdminActionLog.objects.filter(created_at__lt=cutoff), batch_size=batch_size)
+            self.stdout.write(f"audit_prune deleted={total} cutoff={cutoff.isoformat()} retention_days={days}")
+
+        raw_reload_days = options.get("reload_days")
+        reload_days = (
+            int(raw_reload_days)
+            if raw_reload_days is not None
+            else get_int(key="SCHEDULER_CONFIG_RELOAD_RETENTION_DAYS", default=30, fresh=True)
+        )
+        if reload_days <= 0:
+            self.stdout.write("reload_prune disabled (retention_days=0)")
+        else:
+            cutoff = now - timedelta(days=reload_days)
+            # PENDING requests are still to be applied by the leader; never prune them.
+            qs = ConfigReloadRequest.objects.filter(requested_at__lt=cutoff).exclude(
+                status=ConfigReloadRequest.Status.PENDING
+            )
+            total = _delete_in_batches(qs, batch_size=batch_size)
+            self.stdout.write(f"reload_prune deleted={total} cutoff={cutoff.isoformat()} retention_days={reload_days}")
@@ -3,11 +3,26 @@ from __future__ import annotations
 import json
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from scheduler.conf import list_all_scheduler_setting_keys
 from scheduler.models import SchedulerSettingHelp
 
 
+_HELP_DEFAULT_FIELDS = [
+    "title",
+    "description",
+    "impact",
+    "editable",
+    "input_type",
+    "enum_values_json",
+    "constraints_json",
+    "examples_json",
+    "is_secret",
+    "updated_at",
+]
+
+
 def _is_secret_key(key: str) -> bool:
     u = str(key or "").upper()
     return ("SECRET" in u) or ("TOKEN" in u) or ("PASSWORD" in u)
@@ -38,31 +53,41 @@ class Command(BaseCommand):
             return
 
         if options.get("apply_defaults"):
-            updated = 0
-            created = 0
+            default_rows = []
             for k, spec in DEFAULT_HELP.items():
                 if not k.startswith("SCHEDULER_"):
                     continue
                 if k in {"SCHEDULER_NODE_ID"}:
                     continue
-                defaults = {
-                    "title": str(spec.get("title") or ""),
-                    "description": str(spec.get("description") or ""),
-                    "impact": str(spec.get("impact") or ""),
-                    "editable": bool(spec.get("editable", True)),
-                    "input_type": str(spec.get("input_type") or "text"),
-                    "enum_values_json": list(spec.get("enum_values") or []),
-                    "constraints_json": dict(spec.get("constraints") or {}),
-                    "examples_json": list(spec.get("examples") or []),
-                    "is_secret": _is_secret_key(k) or bool(spec.get("is_secret", False)),
-                }
-                _, was_created = SchedulerSettingHelp.objects.update_or_create(key=k, defaults=defaults)
-                created += 1 if was_created else 0
-                updated += 0 if was_created else 1
+                default_rows.append(
+                    SchedulerSettingHelp(
+                        key=k,
+                        title=str(spec.get("title") or ""),
+                        description=str(spec.get("description") or ""),
+                        impact=str(spec.get("impact") or ""),
+                        editable=bool(spec.get("editable", True)),
+                        input_type=str(spec.get("input_type") or "text"),
+                        enum_values_json=list(spec.get("enum_values") or []),
+                        constraints_json=dict(spec.get("constraints") or {}),
+                        examples_json=list(spec.get("examples") or []),
+                        is_secret=_is_secret_key(k) or bool(spec.get("is_secret", False)),
+                    )
+                )
+            # One upsert (INSERT ... ON CONFLICT (key) DO UPDATE) instead of a SELECT+UPDATE/INSERT per key.
+            with transaction.atomic():
+                SchedulerSettingHelp.objects.bulk_create(
+                    default_rows,
+                    batch_size=100,
+                    update_conflicts=True,
+                    unique_fields=["key"],
+                    update_fields=_HELP_DEFAULT_FIELDS,
+                )
+            created = sum(1 for r in default_rows if r.key not in existing)
+            updated = len(default_rows) - created
             self.stdout.write(self.style.SUCCESS(f"help_defaults: created={created} updated={updated}"))
+            existing.update(r.key for r in default_rows)
 
         # Create any remaining missing keys as blank placeholders.
-        existing = set(SchedulerSettingHelp.objects.values_list("key", flat=True))
         missing = [k for k in keys if k not in existing]
         rows = []
         for k in missing:
@@ -82,7 +107,8 @@ class Command(BaseCommand):
             )
 
         if rows:
-            SchedulerSettingHelp.objects.bulk_create(rows)
+            # ignore_conflicts: a row created concurrently (e.g. from the ops UI) is left as-is.
+            SchedulerSettingHelp.objects.bulk_create(rows, batch_size=100, ignore_conflicts=True)
         self.stdout.write(self.style.SUCCESS(f"created={len(rows)}"))
 
 
@@ -95,6 +121,14 @@ DEFAULT_HELP: dict[str, dict] = {
         "constraints": {"min": 1, "max": 50},
         "examples": [1, 2, 4],
     },
+    "SCHEDULER_POLL_INTERVAL_SECONDS_MAX": {
+        "title": "Leader idle poll interval max (seconds)",
+        "description": "処理対象（PENDING/ASSIGNED等）が無いとき、Leaderのループ間隔を指数的に延ばす上限（秒）。イベント取込/再実行でJobRunが作られるとRedis通知で即座に復帰します。",
+        "impact": "大きいほどアイドル時のDB/Redis負荷は下がりますが、Redis通知が届かない場合の反映遅延が最大この秒数になります。時間起動はassign_ahead_secondsの先読みで作成されるため、この値はそれより十分小さくしてください。",
+        "input_type": "text",
+        "constraints": {"min": 1, "max": 60},
+        "examples": [5, 10],
+    },
     "SCHEDULER_MIN_ONLINE_WORKERS": {
         "title": "Minimum online workers",
         "description": "Redis heartbeatで判定した『オンラインworker数』の最低値。スケールアウト/インの運用に合わせて調整します。",
@@ -207,6 +241,13 @@ DEFAULT_HELP: dict[str, dict] = {
         "input_type": "text",
         "examples": ["http://localhost:9090"],
     },
+    "SCHEDULER_PROMETHEUS_RECORDING_RULES": {
+        "title": "Use Prometheus recording rules",
+        "description": "Ops Dashboardのメトリクス集計に、recording rule（dev-prometheus/rules.yml の scheduler_recording グループ）で事前計算済みの系列を使うかどうか。",
+        "impact": "Prometheus側の評価コストが下がります。ルールが未ロードのPrometheusで有効にすると、ダッシュボードのメトリクスが空になります。",
+        "input_type": "bool",
+        "examples": [True, False],
+    },
     "SCHEDULER_ALERTMANAGER_URL": {
         "title": "Alertmanager base URL",
         "description": "Ops DashboardからアラートのSilence（無効化）を行うためのAlertmanager URL（例: http://localhost:9093）。",
@@ -253,6 +294,13 @@ DEFAULT_HELP: dict[str, dict] = {
         "constraints": {"min": 1, "max": 65535},
         "examples": [50150],
     },
+    "SCHEDULER_GRPC_SEND_ARGS_JSON": {
+        "title": "Send StartJob args_json",
+        "description": "StartJobの引数をStructではなくJSON文字列(args_json)で送る互換モード。StartJobRequest.args未対応の旧Workerが混在する間だけ有効にする。",
+        "impact": "有効だとディスパッチ毎にJSONエンコードが発生します。全Worker更新後は無効にしてください。",
+        "input_type": "bool",
+        "examples": [False],
+    },
     "SCHEDULER_TLS_CERT_FILE": {
         "title": "TLS cert file",
         "description": "gRPC(mTLS)で使用するサーバ証明書（PEM）のパス。",
@@ -435,6 +483,22 @@ DEFAULT_HELP: dict[str, dict] = {
         "constraints": {"min": 0},
         "examples": [168],
     },
+    "SCHEDULER_AUDIT_RETENTION_DAYS": {
+        "title": "Audit log retention days",
+        "description": "監査ログ（AdminActionLog）の保持日数。scheduler_prune_audit_log（日次ジョブ「System: Prune audit log」。初期状態は無効のため、Ops UIで有効化した場合のみ）が古い行をバッチ削除します。0で無効。",
+        "impact": "短くすると過去の操作履歴を追えなくなります。長くするとテーブルが肥大化し一覧/検索が遅くなります。",
+        "input_type": "text",
+        "constraints": {"min": 0},
+        "examples": [90, 365],
+    },
+    "SCHEDULER_CONFIG_RELOAD_RETENTION_DAYS": {
+        "title": "Config reload request retention days",
+        "description": "設定リロード要求（ConfigReloadRequest）のうち完了済み（APPLIED/FAILED）を保持する日数。scheduler_prune_audit_log（日次ジョブ）が監査ログと一緒に削除します。0で無効。",
+        "impact": "短くすると過去のリロード結果（各Workerの反映状況）を追えなくなります。",
+        "input_type": "text",
+        "constraints": {"min": 0},
+        "examples": [30],
+    },
     "SCHEDULER_EVENTS_API_TOKEN": {
         "title": "Events ingest token",
         "description": "/api/events/ingest/ の認証トークン。",
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import concurrent.futures
 import random
 import signal
 import threading
@@ -9,31 +9,45 @@ import uuid
 from datetime import timedelta
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db.models import Count
-from django.db import transaction
+from django.db.models import Count, F
 from django.utils import timezone
 
 from scheduler.conf import get_scheduler_config, reload_scheduler_settings_cache
 from scheduler.grpc import worker_pb2
 from scheduler.grpc.ports import PortRange, find_available_tcp_port
 from scheduler.grpc.runtime import (
+    CoordinationSnapshot,
     WorkerRuntimeState,
+    close_all_channels,
     ping_worker,
+    prune_channels,
     reload_config_on_worker,
     start_job_on_worker,
     start_worker_grpc_server,
 )
 from scheduler.grpc.runtime import get_status_worker
-from scheduler.leader_tick import run_leader_tick_snapshot
+from scheduler.leader_tick import _append_error_summary, apply_reconcile_status, run_leader_tick_snapshot
 from scheduler.models import ConfigReloadRequest, JobRun
 from scheduler.redis_coordination import (
     CoordinationSettings,
     RedisCoordinator,
     TickStatus,
+    config_reload_channel,
+    jobrun_ready_channel,
     list_workers,
+    list_workers_cached,
+    run_notification_listener,
 )
 
 
+def _targets_map(workers) -> dict[str, str]:
+    return {
+        w.worker_id: f"{w.grpc_host}:{w.grpc_port}"
+        for w in workers
+        if w.grpc_host and w.grpc_port and w.heartbeat_ttl_seconds > 0
+    }
+
+
 class Command(BaseCommand):
     help = "Run a scheduler worker process (M1: heartbeat + leader election + epoch)."
 
@@ -132,17 +146,20 @@ class Command(BaseCommand):
         )
 
         stop_requested = False
+        # Wakes the main loop early from an idle backoff sleep (stop / role change).
+        loop_wake = threading.Event()
 
         def _request_stop(*_args):
             nonlocal stop_requested
             stop_requested = True
+            loop_wake.set()
 
         signal.signal(signal.SIGINT, _request_stop)
         signal.signal(signal.SIGTERM, _request_stop)
 
         interval_seconds = float(options["interval_seconds"])
         run_seconds = int(options["run_seconds"])
-        deadline = time.time() + run_seconds if run_seconds > 0 else None
+        deadline = time.monotonic() + run_seconds if run_seconds > 0 else None
 
         coordinator = RedisCoordinator(
             redis_url=cfg.redis_url,
@@ -177,12 +194,12 @@ class Command(BaseCommand):
                 f"The port may already be in use. Try a different --grpc-port. ({e})"
             )
         self.stdout.write("grpc_server=started")
-        last_leader_tick_at = 0.0
-        last_leader_ping_at = 0.0
-        last_leader_ping_summary_at = 0.0
-        last_leader_dispatch_at = 0.0
-        last_leader_reconcile_at = 0.0
-        last_leader_reload_at = 0.0
+        last_leader_tick_at = float("-inf")
+        last_leader_ping_at = float("-inf")
+        last_leader_ping_summary_at = float("-inf")
+        last_leader_dispatch_at = float("-inf")
+        last_leader_reconcile_at = float("-inf")
+        last_leader_reload_at = float("-inf")
 
         # Pipeline knobs (keep the main loop responsive).
         leader_ping_batch_size = 2
@@ -190,10 +207,30 @@ class Command(BaseCommand):
         leader_dispatch_time_budget_seconds = 0.3
         leader_reconcile_worker_batch_size = 2
         leader_reconcile_jobrun_batch_size = 50
+        # ConfigReloadRequest is normally picked up via pub/sub; poll the DB only as a fallback.
+        leader_reload_fallback_seconds = 60.0
 
         ping_cursor = 0
         reconcile_cursor = 0
 
+        # Idle backoff: followers, and a leader with no reachable workers or no due work, wake less often.
+        # The leader cap is SCHEDULER_POLL_INTERVAL_SECONDS_MAX; jobrun_ready notifications cut it short.
+        idle_ticks = 0
+        idle_follower_max_sleep_seconds = 30.0
+        leader_has_work = True
+
+        # One list_workers() scan shared by dispatch / reload / ping / reconcile (2s TTL).
+        workers_cache: dict[str, object] = {"workers": None, "targets": {}}
+
+        def _cached_workers():
+            workers = list_workers_cached(cfg.redis_url, max_age_seconds=2.0)
+            if workers is not workers_cache["workers"]:
+                workers_cache["workers"] = workers
+                workers_cache["targets"] = _targets_map(workers)
+                # Drop pooled gRPC channels for workers that left the cluster.
+                prune_channels(active_targets=workers_cache["targets"].values())
+            return workers, workers_cache["targets"]
+
         # Coordination tick must remain cheap and frequent (docs/architecture.md).
         # Leader work (DB / RPC) can be heavy; run tick in a dedicated thread so
         # heartbeat / lock TTLs don't expire and cause role flapping.
@@ -213,7 +250,7 @@ class Command(BaseCommand):
             while True:
                 if stop_requested:
                     break
-                if deadline is not None and time.time() >= deadline:
+                if deadline is not None and time.monotonic() >= deadline:
                     break
 
                 try:
@@ -236,17 +273,15 @@ class Command(BaseCommand):
                 else:
                     role = "WORKER"
 
-                with runtime_lock:
-                    if status.is_leader:
-                        runtime_state.role = "leader"
-                    elif status.is_subleader:
-                        runtime_state.role = "subleader"
-                    else:
-                        runtime_state.role = "worker"
-                    runtime_state.cluster_epoch = int(status.cluster_epoch)
-                    runtime_state.leader_epoch = int(status.leader_epoch or 0)
-                    runtime_state.leader_worker_id = status.leader_worker_id or ""
-                    runtime_state.last_heartbeat_unix_ms = int(time.time() * 1000)
+                # Publish a fresh immutable snapshot; a single attribute store is atomic,
+                # so RPC handlers never contend with the tick for runtime_lock.
+                runtime_state.coordination = CoordinationSnapshot(
+                    role=role.lower(),
+                    cluster_epoch=int(status.cluster_epoch),
+                    leader_epoch=int(status.leader_epoch or 0),
+                    leader_worker_id=status.leader_worker_id or "",
+                    last_heartbeat_unix_ms=int(time.time() * 1000),
+                )
 
                 if (
                     role != local_last_role
@@ -267,114 +302,35 @@ class Command(BaseCommand):
                     local_last_role = role
                     local_last_epoch = status.leader_epoch
                     local_last_cluster_epoch = status.cluster_epoch
+                    loop_wake.set()
 
                 time.sleep(coordination_interval_seconds)
 
         coordination_thread = threading.Thread(target=_coordination_loop, name="coordination", daemon=True)
         coordination_thread.start()
 
-        def _mark_skipped_if_assigned(*, job_run_id: int, reason: str) -> bool:
-            now_dt = timezone.now()
-            with transaction.atomic():
-                try:
-                    jr = JobRun.objects.select_for_update().get(id=job_run_id)
-                except JobRun.DoesNotExist:
-                    return False
-
-                if jr.state != JobRun.State.ASSIGNED:
-                    return False
-                if jr.started_at is not None:
-                    return False
-
-                jr.state = JobRun.State.SKIPPED
-                jr.finished_at = now_dt
-                jr.error_summary = (jr.error_summary + "\n" if jr.error_summary else "") + f"skipped: {reason}"
-                jr.version = int(jr.version) + 1
-                jr.save(update_fields=["state", "finished_at", "error_summary", "version", "updated_at"])
-                return True
-
-        def _mark_confirming_if_running(*, job_run_id: int, reason: str, confirm_seconds: int) -> bool:
-            now_dt = timezone.now()
-            confirm_seconds = max(1, int(confirm_seconds or 0))
-            with transaction.atomic():
-                try:
-                    jr = JobRun.objects.select_for_update().get(id=job_run_id)
-                except JobRun.DoesNotExist:
-                    return False
-
-                if jr.state != JobRun.State.RUNNING:
-                    return False
-                if jr.continuation_state == JobRun.ContinuationState.CONFIRMING:
-                    return False
-
-                jr.continuation_state = JobRun.ContinuationState.CONFIRMING
-                jr.continuation_check_started_at = now_dt
-                jr.continuation_check_deadline_at = now_dt + timedelta(seconds=confirm_seconds)
-                jr.error_summary = (jr.error_summary + "\n" if jr.error_summary else "") + f"confirming: {reason}"
-                jr.version = int(jr.version) + 1
-                jr.save(
-                    update_fields=[
-                        "continuation_state",
-                        "continuation_check_started_at",
-                        "continuation_check_deadline_at",
-                        "error_summary",
-                        "version",
-                        "updated_at",
-                    ]
-                )
-                return True
-
-        def _orphan_if_confirming_deadline_exceeded(*, job_run_id: int, reason: str) -> bool:
-            now_dt = timezone.now()
-            with transaction.atomic():
-                try:
-                    jr = JobRun.objects.select_for_update().get(id=job_run_id)
-                except JobRun.DoesNotExist:
-                    return False
-
-                if jr.state != JobRun.State.RUNNING:
-                    return False
-                if jr.continuation_state != JobRun.ContinuationState.CONFIRMING:
-                    return False
-                if not jr.continuation_check_deadline_at or jr.continuation_check_deadline_at > now_dt:
-                    return False
-
-                jr.state = JobRun.State.ORPHANED
-                jr.error_summary = (jr.error_summary + "\n" if jr.error_summary else "") + f"orphaned: {reason}"
-                jr.assigned_worker_id = ""
-                jr.assigned_at = None
-                jr.started_at = None
-                jr.finished_at = None
-                jr.exit_code = None
-                jr.continuation_state = JobRun.ContinuationState.NONE
-                jr.continuation_check_started_at = None
-                jr.continuation_check_deadline_at = None
-                jr.version = int(jr.version) + 1
-                jr.attempt = int(jr.attempt) + 1
-                jr.save(
-                    update_fields=[
-                        "state",
-                        "error_summary",
-                        "assigned_worker_id",
-                        "assigned_at",
-                        "started_at",
-                        "finished_at",
-                        "exit_code",
-                        "continuation_state",
-                        "continuation_check_started_at",
-                        "continuation_check_deadline_at",
-                        "version",
-                        "attempt",
-                        "updated_at",
-                    ]
-                )
-                return True
+        # Redis pub/sub wake-ups (published by the Ops UI); the leader loop polls the DB only when woken.
+        reload_wake = threading.Event()
+        notification_thread = threading.Thread(
+            target=run_notification_listener,
+            kwargs={
+                "redis_url": cfg.redis_url,
+                "wake_events": {config_reload_channel(): reload_wake, jobrun_ready_channel(): loop_wake},
+                "should_stop": lambda: stop_requested or (deadline is not None and time.monotonic() >= deadline),
+            },
+            name="notifications",
+            daemon=True,
+        )
+        notification_thread.start()
 
         try:
             while True:
+                # One monotonic sample per iteration drives every interval check below
+                # (immune to wall-clock jumps; wall time is only used for heartbeats/logs).
+                now = time.monotonic()
                 if stop_requested:
                     break
-                if deadline is not None and time.time() >= deadline:
+                if deadline is not None and now >= deadline:
                     break
 
                 # Refresh cached config view (DB overrides can change).
@@ -395,7 +351,7 @@ class Command(BaseCommand):
                     time.sleep(min(0.05, interval_seconds))
                     continue
 
-                if status.is_leader and (time.time() - last_leader_tick_at) >= interval_seconds:
+                if status.is_leader and (now - last_leader_tick_at) >= interval_seconds:
                     effective_epoch = int(status.leader_epoch or status.cluster_epoch or 0)
                     snapshot = run_leader_tick_snapshot(
                         redis_url=cfg.redis_url,
@@ -428,17 +384,23 @@ class Command(BaseCommand):
                             ]
                         )
                     )
-                    last_leader_tick_at = time.time()
+                    last_leader_tick_at = now
+                    leader_has_work = any(
+                        (
+                            snapshot.pending_job_runs,
+                            snapshot.created_job_runs,
+                            snapshot.assigned_job_runs,
+                            snapshot.orphaned_job_runs,
+                            snapshot.confirming_job_runs,
+                            snapshot.reassigned_job_runs,
+                            snapshot.rebalanced_job_runs,
+                        )
+                    )
 
                 # Phase F MVP: leader dispatches assigned runs via StartJob
-                if status.is_leader and (time.time() - last_leader_dispatch_at) >= max(1.0, interval_seconds):
+                if status.is_leader and (now - last_leader_dispatch_at) >= max(1.0, interval_seconds):
                     effective_epoch = int(status.leader_epoch or status.cluster_epoch or 0)
-                    workers = list_workers(cfg.redis_url)
-                    targets = {
-                        w.worker_id: f"{w.grpc_host}:{w.grpc_port}"
-                        for w in workers
-                        if w.grpc_host and w.grpc_port and w.heartbeat_ttl_seconds > 0
-                    }
+                    _, targets = _cached_workers()
 
                     running_counts = {
                         row["assigned_worker_id"]: int(row["c"])
@@ -448,9 +410,29 @@ class Command(BaseCommand):
                         .annotate(c=Count("id"))
                     }
 
+                    # Skip overly late runs (avoid executing backlog after downtime) in one statement,
+                    # so the dispatch budget below is spent on viable rows only.
+                    if int(getattr(cfg, "skip_late_runs_after_seconds", 0) or 0) > 0:
+                        now_dt = timezone.now()
+                        cutoff = now_dt - timedelta(seconds=int(cfg.skip_late_runs_after_seconds))
+                        reason = f"skipped: scheduled_for too old (cutoff={cutoff.isoformat()})"
+                        skipped = JobRun.objects.filter(
+                            state=JobRun.State.ASSIGNED,
+                            started_at__isnull=True,
+                            scheduled_for__lt=cutoff,
+                        ).update(
+                            state=JobRun.State.SKIPPED,
+                            finished_at=now_dt,
+                            error_summary=_append_error_summary(reason),
+                            version=F("version") + 1,
+                            updated_at=now_dt,
+                        )
+                        if skipped:
+                            self.stdout.write(f"skip_job late count={skipped} cutoff={cutoff.isoformat()}")
+
                     # Grab a small batch to keep the loop cheap.
-                    assigned = (
-                        JobRun.objects.select_related("job_definition")
+                    assigned = list(
+                        JobRun.dispatch.with_definition()
                         .filter(
                             state=JobRun.State.ASSIGNED,
                             assigned_worker_id__isnull=False,
@@ -458,13 +440,15 @@ class Command(BaseCommand):
                         .exclude(assigned_worker_id="")
                         .order_by("scheduled_for", "id")[:20]
                     )
+                    if assigned:
+                        leader_has_work = True
 
-                    dispatch_deadline = time.time() + float(leader_dispatch_time_budget_seconds)
+                    dispatch_deadline = time.monotonic() + float(leader_dispatch_time_budget_seconds)
                     rpc_calls = 0
                     for jr in assigned:
                         if rpc_calls >= int(leader_dispatch_rpc_budget):
                             break
-                        if time.time() >= dispatch_deadline:
+                        if time.monotonic() >= dispatch_deadline:
                             break
 
                         target = targets.get(jr.assigned_worker_id)
@@ -479,24 +463,6 @@ class Command(BaseCommand):
                         if jr.started_at is not None:
                             continue
 
-                        # Skip overly late runs (avoid executing backlog after downtime).
-                        if (
-                            int(getattr(cfg, "skip_late_runs_after_seconds", 0) or 0) > 0
-                            and jr.scheduled_for is not None
-                        ):
-                            now_dt = timezone.now()
-                            cutoff = now_dt - timedelta(seconds=int(cfg.skip_late_runs_after_seconds))
-                            if jr.scheduled_for < cutoff:
-                                ok = _mark_skipped_if_assigned(
-                                    job_run_id=int(jr.id),
-                                    reason=f"scheduled_for too old (scheduled_for={jr.scheduled_for.isoformat()} cutoff={cutoff.isoformat()})",
-                                )
-                                if ok:
-                                    self.stdout.write(
-                                        f"skip_job late job_run_id={jr.id} scheduled_for={jr.scheduled_for.isoformat()}"
-                                    )
-                                continue
-
                         jd = jr.job_definition
                         try:
                             rpc_calls += 1
@@ -505,12 +471,13 @@ class Command(BaseCommand):
                                 leader_epoch=effective_epoch,
                                 job_run_id=str(jr.id),
                                 command_name=str(jd.command_name),
-                                args_json=json.dumps(jd.default_args_json or {}, ensure_ascii=False),
+                                args=jd.default_args_json or {},
                                 timeout_seconds=int(jd.timeout_seconds or 0),
                                 attempt=int(jr.attempt or 0),
                                 tls_cert_file=cfg.tls_cert_file,
                                 tls_key_file=cfg.tls_key_file,
                                 timeout_rpc_seconds=1.0,
+                                send_args_json=cfg.grpc_send_args_json,
                             )
                             if resp.result == worker_pb2.StartJobResponse.ACCEPTED:
                                 self.stdout.write(
@@ -521,53 +488,76 @@ class Command(BaseCommand):
                                 f"start_job target={target} job_run_id={jr.id} error={type(e).__name__}"
                             )
 
-                    last_leader_dispatch_at = time.time()
+                    last_leader_dispatch_at = now
 
                 # Config reload (M6'): UI creates ConfigReloadRequest; leader applies it to all active workers.
-                if status.is_leader and (time.time() - last_leader_reload_at) >= max(1.0, interval_seconds):
-                    req = (
+                if status.is_leader and (
+                    reload_wake.is_set() or (now - last_leader_reload_at) >= leader_reload_fallback_seconds
+                ):
+                    reload_wake.clear()
+                    # One request per tick so dispatch is not held up; fetch two to know whether more
+                    # are queued (rows created during the fan-out arrive via their own publish).
+                    pending_reloads = list(
                         ConfigReloadRequest.objects.filter(status=ConfigReloadRequest.Status.PENDING)
-                        .order_by("requested_at", "id")
-                        .first()
+                        .order_by("requested_at", "id")[:2]
                     )
+                    req = pending_reloads[0] if pending_reloads else None
                     if req is not None:
                         effective_epoch = int(status.leader_epoch or status.cluster_epoch or 0)
 
                         leader_gen = reload_scheduler_settings_cache()
-                        workers = list_workers(cfg.redis_url)
-                        targets = {
-                            w.worker_id: f"{w.grpc_host}:{w.grpc_port}"
-                            for w in workers
-                            if w.grpc_host and w.grpc_port and w.heartbeat_ttl_seconds > 0
-                        }
+                        _, targets = _cached_workers()
 
                         results: dict[str, dict] = {}
                         ok_count = 0
-                        for wid, target in targets.items():
-                            try:
-                                resp = reload_config_on_worker(
-                                    target=target,
-                                    leader_epoch=effective_epoch,
-                                    requested_by=str(req.requested_by or ""),
-                                    tls_cert_file=cfg.tls_cert_file,
-                                    tls_key_file=cfg.tls_key_file,
-                                    timeout_rpc_seconds=1.0,
-                                )
-                                results[wid] = {
-                                    "target": target,
-                                    "ok": bool(resp.ok),
-                                    "message": str(resp.message or ""),
-                                    "cache_generation": int(resp.cache_generation or 0),
-                                }
-                                if resp.ok:
-                                    ok_count += 1
-                            except Exception as e:
-                                results[wid] = {
-                                    "target": target,
-                                    "ok": False,
-                                    "message": f"{type(e).__name__}",
-                                    "cache_generation": 0,
+                        # Fan out: one slow/unreachable worker must not serialize the whole reload.
+                        # One thread per target so every RPC starts at once: the as_completed() wait
+                        # below then only expires on calls that really outlived their deadline, never
+                        # on ones still queued behind a capped pool.
+                        if targets:
+                            with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as ex:
+                                futs = {
+                                    ex.submit(
+                                        reload_config_on_worker,
+                                        target=target,
+                                        leader_epoch=effective_epoch,
+                                        requested_by=str(req.requested_by or ""),
+                                        tls_cert_file=cfg.tls_cert_file,
+                                        tls_key_file=cfg.tls_key_file,
+                                        timeout_rpc_seconds=1.0,
+                                    ): (wid, target)
+                                    for wid, target in targets.items()
                                 }
+                                try:
+                                    for fut in concurrent.futures.as_completed(futs, timeout=2.0):
+                                        wid, target = futs[fut]
+                                        try:
+                                            resp = fut.result()
+                                            results[wid] = {
+                                                "target": target,
+                                                "ok": bool(resp.ok),
+                                                "message": str(resp.message or ""),
+                                                "cache_generation": int(resp.cache_generation or 0),
+                                            }
+                                            if resp.ok:
+                                                ok_count += 1
+                                        except Exception as e:
+                                            results[wid] = {
+                                                "target": target,
+                                                "ok": False,
+                                                "message": f"{type(e).__name__}",
+                                                "cache_generation": 0,
+                                            }
+                                except concurrent.futures.TimeoutError:
+                                    pass
+                            for wid, target in targets.items():
+                                if wid not in results:
+                                    results[wid] = {
+                                        "target": target,
+                                        "ok": False,
+                                        "message": "TimeoutError",
+                                        "cache_generation": 0,
+                                    }
 
                         total = len(targets)
                         all_ok = (total == 0) or (ok_count == total)
@@ -595,15 +585,17 @@ class Command(BaseCommand):
                             f"config_reload request_id={req.id} status={req.status} ok={ok_count}/{total}"
                         )
 
-                    last_leader_reload_at = time.time()
+                    if len(pending_reloads) > 1:
+                        # More queued: handle the next one on the following tick, not after the fallback.
+                        reload_wake.set()
+                        loop_wake.set()
+                    # Restart the fallback timer from the end of the (possibly slow) fan-out.
+                    last_leader_reload_at = time.monotonic()
 
                 # M2: leader pings all known workers
-                if status.is_leader and (time.time() - last_leader_ping_at) >= max(1.0, interval_seconds):
-                    workers = [
-                        w
-                        for w in list_workers(cfg.redis_url)
-                        if w.grpc_host and w.grpc_port and w.heartbeat_ttl_seconds > 0
-                    ]
+                if status.is_leader and (now - last_leader_ping_at) >= max(1.0, interval_seconds):
+                    all_workers, reachable = _cached_workers()
+                    workers = [w for w in all_workers if w.worker_id in reachable]
                     # Ensure stable ordering so round-robin is fair across ticks.
                     workers.sort(key=lambda w: str(w.worker_id or ""))
                     ok_count = 0
@@ -650,8 +642,7 @@ class Command(BaseCommand):
 
                     # Success logs are intentionally throttled to avoid blocking stdout,
                     # which can starve coordination tick and cause TTL expiration.
-                    now_ts = time.time()
-                    if err_count > 0 or (now_ts - last_leader_ping_summary_at) >= 15.0:
+                    if err_count > 0 or (now - last_leader_ping_summary_at) >= 15.0:
                         checked_s = ",".join(checked_worker_ids) if checked_worker_ids else ""
                         ok_s = ",".join(ok_worker_ids) if ok_worker_ids else ""
                         err_s = ",".join(err_worker_ids) if err_worker_ids else ""
@@ -668,17 +659,25 @@ class Command(BaseCommand):
                                 ]
                             )
                         )
-                        last_leader_ping_summary_at = now_ts
-                    last_leader_ping_at = time.time()
+                        last_leader_ping_summary_at = now
+                    last_leader_ping_at = now
 
                 # Reconcile: DB says RUNNING, but worker reports no current job (common after worker restart).
-                if status.is_leader and (time.time() - last_leader_reconcile_at) >= max(1.0, interval_seconds):
+                if status.is_leader and (now - last_leader_reconcile_at) >= max(1.0, interval_seconds):
                     effective_epoch = int(status.leader_epoch or status.cluster_epoch or 0)
-                    workers = [
-                        w
-                        for w in list_workers(cfg.redis_url)
-                        if w.grpc_host and w.grpc_port and w.heartbeat_ttl_seconds > 0
-                    ]
+                    all_workers, reachable = _cached_workers()
+                    # Only workers that DB says are RUNNING something can need reconciling;
+                    # GetStatus against idle workers can never change a JobRun.
+                    busy_worker_ids = set(
+                        JobRun.objects.filter(state=JobRun.State.RUNNING)
+                        .exclude(assigned_worker_id="")
+                        .values_list("assigned_worker_id", flat=True)
+                        .distinct()
+                    )
+                    workers = sorted(
+                        (w for w in all_workers if w.worker_id in reachable and w.worker_id in busy_worker_ids),
+                        key=lambda w: str(w.worker_id or ""),
+                    )
                     total_workers = len(workers)
                     if total_workers > 0:
                         bs = max(1, int(leader_reconcile_worker_batch_size))
@@ -697,19 +696,31 @@ class Command(BaseCommand):
                     }
 
                     status_by_worker: dict[str, str] = {}
-                    for wid, target in targets.items():
-                        try:
-                            resp = get_status_worker(
-                                target=target,
-                                leader_epoch=effective_epoch,
-                                tls_cert_file=cfg.tls_cert_file,
-                                tls_key_file=cfg.tls_key_file,
-                                timeout_seconds=0.5,
-                            )
-                            status_by_worker[wid] = (resp.current_job_run_id or "").strip()
-                        except Exception:
-                            # If we can't query status, don't make a strong decision here.
-                            continue
+                    # Fan out: wall time is one RPC timeout regardless of batch size (one thread per
+                    # target, so no call waits in the pool's queue past the as_completed() deadline).
+                    if targets:
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as ex:
+                            futs = {
+                                ex.submit(
+                                    get_status_worker,
+                                    target=target,
+                                    leader_epoch=effective_epoch,
+                                    tls_cert_file=cfg.tls_cert_file,
+                                    tls_key_file=cfg.tls_key_file,
+                                    timeout_seconds=0.5,
+                                ): wid
+                                for wid, target in targets.items()
+                            }
+                            try:
+                                for fut in concurrent.futures.as_completed(futs, timeout=1.0):
+                                    try:
+                                        resp = fut.result()
+                                    except Exception:
+                                        # If we can't query status, don't make a strong decision here.
+                                        continue
+                                    status_by_worker[futs[fut]] = (resp.current_job_run_id or "").strip()
+                            except concurrent.futures.TimeoutError:
+                                pass
 
                     # Check a small batch of RUNNING jobs for the reconciled workers only.
                     running = (
@@ -718,38 +729,31 @@ class Command(BaseCommand):
                         .order_by("started_at", "id")[: int(leader_reconcile_jobrun_batch_size)]
                     )
 
-                    for jr in running:
-                        wid = jr.assigned_worker_id
-                        if wid not in status_by_worker:
-                            continue
-
-                        cur = status_by_worker.get(wid) or ""
-                        if jr.continuation_state == JobRun.ContinuationState.CONFIRMING:
-                            # If deadline exceeded, orphan regardless of worker active.
-                            _orphan_if_confirming_deadline_exceeded(
-                                job_run_id=int(jr.id),
-                                reason="confirming deadline exceeded (worker status mismatch)",
-                            )
-                            continue
-
-                        if not cur:
-                            _mark_confirming_if_running(
-                                job_run_id=int(jr.id),
-                                reason="worker reports no current job",
-                                confirm_seconds=int(cfg.continuation_confirm_seconds),
-                            )
-                            continue
-
-                        if cur != str(jr.id):
-                            _mark_confirming_if_running(
-                                job_run_id=int(jr.id),
-                                reason=f"worker reports different job_run_id={cur}",
-                                confirm_seconds=int(cfg.continuation_confirm_seconds),
-                            )
+                    apply_reconcile_status(
+                        running=running,
+                        status_by_worker=status_by_worker,
+                        confirm_seconds=int(cfg.continuation_confirm_seconds or 0),
+                    )
 
-                    last_leader_reconcile_at = time.time()
+                    last_leader_reconcile_at = now
 
-                time.sleep(interval_seconds)
+                if not status.is_leader:
+                    idle_ticks += 1
+                    idle_cap = idle_follower_max_sleep_seconds
+                elif not leader_has_work or not _cached_workers()[1]:
+                    idle_ticks += 1
+                    idle_cap = float(max(1, int(getattr(cfg, "poll_interval_seconds_max", 10) or 10)))
+                else:
+                    idle_ticks = 0
+                    idle_cap = interval_seconds
+                sleep_s = min(interval_seconds * (2 ** min(idle_ticks, 5)), max(interval_seconds, idle_cap))
+                if deadline is not None:
+                    sleep_s = max(0.0, min(sleep_s, deadline - time.monotonic()))
+                if loop_wake.wait(timeout=sleep_s):
+                    # Role / epoch changed, new runs were created, or stop requested: resume at the base interval.
+                    loop_wake.clear()
+                    idle_ticks = 0
+                    leader_has_work = True
         finally:
             stop_requested = True
             try:
@@ -760,4 +764,5 @@ class Command(BaseCommand):
                 grpc_server.stop(grace=None)
             except Exception:
                 pass
+            close_all_channels()
             coordinator.shutdown()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import hmac
+import os
+import threading
 import time
 
 from django.http import HttpResponse
@@ -161,6 +164,31 @@ def _build_metrics() -> _Metrics:
 
 METRICS = _build_metrics()
 
+# Module-level aliases for the observe_* hot path (plain global lookups instead of
+# attribute access on METRICS). None when prometheus_client is unavailable.
+_STARTED = METRICS.job_runs_started_total
+_FINISHED = METRICS.job_runs_finished_total
+_DURATION = METRICS.job_run_duration_seconds
+_CPU = METRICS.job_run_cpu_seconds_total
+_IO_READ = METRICS.job_run_io_read_bytes_total
+_IO_WRITE = METRICS.job_run_io_write_bytes_total
+_PEAK_RSS = METRICS.job_run_peak_rss_bytes
+_CURRENT_JOB = METRICS.worker_current_job
+
+
+# Label children for the bounded (command_name[, result]) metrics, so hot paths skip
+# prometheus_client's label validation/lookup + lock. Not used for per-job_run_id or
+# per-worker series, which get removed / have unbounded cardinality.
+_LABEL_CHILDREN: dict[tuple[int, tuple[str, ...]], object] = {}
+
+
+def _labeled(metric, *values: str):
+    key = (id(metric), values)
+    child = _LABEL_CHILDREN.get(key)
+    if child is None:
+        child = _LABEL_CHILDREN.setdefault(key, metric.labels(*values))  # type: ignore[attr-defined]
+    return child
+
 
 _DB_SYNC_CACHE: dict[str, object] = {
     "ts": 0.0,
@@ -171,6 +199,20 @@ _DB_SYNC_CACHE: dict[str, object] = {
 }
 
 
+# key -> (fetched_at, value). Settings read by the metric syncs, refreshed at most every `ttl` seconds.
+_CONF: dict[str, tuple[float, str]] = {}
+
+
+def _conf(key: str, default: str = "", ttl: float = 30.0) -> str:
+    now = time.time()
+    hit = _CONF.get(key)
+    if hit is not None and (now - hit[0]) < ttl:
+        return hit[1]
+    val = get_str(key=key, default=default, fresh=True)
+    _CONF[key] = (now, val)
+    return val
+
+
 _REDIS_SYNC_CACHE: dict[str, object] = {
     "ts": 0.0,
     "leader_worker_id": None,
@@ -195,25 +237,29 @@ def _sync_metrics_from_redis() -> None:
     _REDIS_SYNC_CACHE["ts"] = now
 
     try:
-        from scheduler.redis_coordination import list_workers
+        from scheduler.redis_coordination import list_workers_cached
     except Exception:
         return
 
-    redis_url = get_str(key="SCHEDULER_REDIS_URL", default="", fresh=True).strip()
+    redis_url = _conf("SCHEDULER_REDIS_URL", "").strip()
     if not redis_url:
         return
 
     try:
-        workers = list_workers(redis_url)
-        online = sum(1 for w in workers if int(w.heartbeat_ttl_seconds) > 0)
-        leader_ok = any((w.is_leader and int(w.heartbeat_ttl_seconds) > 0) for w in workers)
+        workers = list_workers_cached(redis_url, max_age_seconds=2.0)
 
-        # Role-change detection (best-effort)
+        # Single pass: online count, leader presence, and role holders (for role-change detection).
+        online = 0
+        leader_ok = False
         leader_worker_id = None
         subleader_worker_id = None
         for w in workers:
+            alive = int(w.heartbeat_ttl_seconds) > 0
+            if alive:
+                online += 1
             if w.is_leader:
                 leader_worker_id = w.worker_id
+                leader_ok = leader_ok or alive
             if w.is_subleader:
                 subleader_worker_id = w.worker_id
 
@@ -231,12 +277,12 @@ def _sync_metrics_from_redis() -> None:
         _REDIS_SYNC_CACHE["subleader_worker_id"] = subleader_worker_id
 
         # Alert enable flags (from Settings)
-        role_change_enabled_raw = get_str(key="SCHEDULER_ALERT_ROLE_CHANGE_ENABLED", default="1", fresh=True).strip()
+        role_change_enabled_raw = _conf("SCHEDULER_ALERT_ROLE_CHANGE_ENABLED", "1").strip()
         role_change_enabled = 0.0 if role_change_enabled_raw in {"", "0", "false", "False", "no", "No"} else 1.0
         METRICS.alert_role_change_enabled.set(role_change_enabled)  # type: ignore[attr-defined]
 
         try:
-            min_online_raw = get_str(key="SCHEDULER_MIN_ONLINE_WORKERS", default="1", fresh=True).strip()
+            min_online_raw = _conf("SCHEDULER_MIN_ONLINE_WORKERS", "1").strip()
             min_online = int(min_online_raw) if min_online_raw else 1
         except Exception:
             min_online = 1
@@ -248,6 +294,36 @@ def _sync_metrics_from_redis() -> None:
         return
 
 
+# job_definition_id -> command_name (few, rarely renamed); refreshed every 5 minutes.
+_JD_NAME_CACHE: dict[int, str] = {}
+_JD_NAME_CACHE_META: dict[str, float] = {"ts": 0.0}
+
+
+def _command_names(job_definition_ids) -> dict[int, str]:
+    now = time.time()
+    if (now - _JD_NAME_CACHE_META["ts"]) >= 300.0:
+        _JD_NAME_CACHE.clear()
+        _JD_NAME_CACHE_META["ts"] = now
+    missing = {int(i) for i in job_definition_ids if i is not None and int(i) not in _JD_NAME_CACHE}
+    if missing:
+        from scheduler.models import JobDefinition
+
+        for jd_id, cn in JobDefinition.objects.filter(id__in=missing).values_list("id", "command_name"):
+            _JD_NAME_CACHE[int(jd_id)] = str(cn or "")
+    return _JD_NAME_CACHE
+
+
+def _id_window_upper(qs, *, limit: int) -> int | None:
+    """Highest JobRun.id among the first `limit` rows of qs (by id), or None if empty."""
+    from django.db.models import Max
+
+    edge = list(qs.order_by("id").values_list("id", flat=True)[limit - 1 : limit])
+    if edge:
+        return int(edge[0])
+    m = qs.aggregate(m=Max("id")).get("m")
+    return int(m) if m is not None else None
+
+
 def _sync_metrics_from_db() -> None:
     """Populate/advance metrics from DB state.
 
@@ -274,77 +350,90 @@ def _sync_metrics_from_db() -> None:
     except Exception:
         return
 
-    # --- Started counter (incremental by JobRun.id) ---
+    from django.db.models import Count, Max, Q, Sum
+
+    # --- Started / finished counters + histograms (incremental by JobRun.id) ---
+    # One id window and one grouped query serve both cursors; conditional aggregates
+    # keep "started since started_last_id" and "finished since finished_last_id" apart.
+    # Each cursor only advances to the highest id its own predicate matched: a run that
+    # is started but still RUNNING must stay above finished_last_id until it finishes.
     started_last = _DB_SYNC_CACHE.get("started_last_id")
     started_last_id = int(started_last) if isinstance(started_last, (int, float)) else 0
-    try:
-        qs = (
-            JobRun.objects.select_related("job_definition")
-            .filter(id__gt=started_last_id)
-            .exclude(started_at=None)
-            .only("id", "started_at", "job_definition__command_name")
-            .order_by("id")
-        )
-        max_id = started_last_id
-        for r in qs[:2000]:
-            max_id = max(max_id, int(r.id))
-            cn = ""
-            try:
-                cn = str(r.job_definition.command_name if r.job_definition_id else "")
-            except Exception:
-                cn = ""
-            observe_job_started(command_name=cn)
-        _DB_SYNC_CACHE["started_last_id"] = max_id
-    except Exception:
-        pass
-
-    # --- Finished counters + duration histogram (incremental by JobRun.id) ---
     finished_last = _DB_SYNC_CACHE.get("finished_last_id")
     finished_last_id = int(finished_last) if isinstance(finished_last, (int, float)) else 0
     try:
-        qs = (
-            JobRun.objects.select_related("job_definition")
-            .filter(id__gt=finished_last_id)
-            .exclude(finished_at=None)
-            .only(
-                "id",
-                "state",
-                "started_at",
-                "finished_at",
-                "resource_cpu_seconds_total",
-                "resource_peak_rss_bytes",
-                "resource_io_read_bytes",
-                "resource_io_write_bytes",
-                "job_definition__command_name",
-            )
-            .order_by("id")
-        )
-        max_id = finished_last_id
-        for r in qs[:2000]:
-            max_id = max(max_id, int(r.id))
-            cn = ""
-            try:
-                cn = str(r.job_definition.command_name if r.job_definition_id else "")
-            except Exception:
-                cn = ""
-            try:
-                dur = 0.0
-                if r.started_at and r.finished_at:
-                    dur = max(0.0, float((r.finished_at - r.started_at).total_seconds()))
-                observe_job_finished(command_name=cn, result=str(r.state), duration_seconds=dur)
-
-                # Resource usage (best-effort; may be null)
-                observe_job_resources(
-                    command_name=cn,
-                    result=str(r.state),
-                    cpu_seconds_total=float(r.resource_cpu_seconds_total) if r.resource_cpu_seconds_total is not None else None,
-                    peak_rss_bytes=int(r.resource_peak_rss_bytes) if r.resource_peak_rss_bytes is not None else None,
-                    io_read_bytes=int(r.resource_io_read_bytes) if r.resource_io_read_bytes is not None else None,
-                    io_write_bytes=int(r.resource_io_write_bytes) if r.resource_io_write_bytes is not None else None,
+        started_q = Q(id__gt=started_last_id, started_at__isnull=False)
+        finished_q = Q(id__gt=finished_last_id, finished_at__isnull=False)
+        qs = JobRun.objects.filter(started_q | finished_q)
+        upper = _id_window_upper(qs, limit=2000)
+        if upper is not None:
+            window = qs.filter(id__lte=upper)
+
+            rows = list(
+                window.values("job_definition_id", "state")
+                .annotate(
+                    started_c=Count("id", filter=started_q),
+                    finished_c=Count("id", filter=finished_q),
+                    cpu=Sum("resource_cpu_seconds_total", filter=finished_q),
+                    io_read=Sum("resource_io_read_bytes", filter=finished_q),
+                    io_write=Sum("resource_io_write_bytes", filter=finished_q),
+                    started_max=Max("id", filter=started_q),
+                    finished_max=Max("id", filter=finished_q),
                 )
-            except Exception:
-                continue
-        _DB_SYNC_CACHE["finished_last_id"] = max_id
+                .order_by()
+            )
+            names = _command_names(row["job_definition_id"] for row in rows)
+
+            # Counters: one labeled inc per (command, result) group instead of one per row.
+            started_by_cn: dict[str, int] = {}
+            for row in rows:
+                cn = names.get(row["job_definition_id"], "")
+                if row["started_c"]:
+                    started_by_cn[cn] = started_by_cn.get(cn, 0) + int(row["started_c"])
+                if not row["finished_c"]:
+                    continue
+                rs = str(row.get("state") or "")
+                try:
+                    _labeled(METRICS.job_runs_finished_total, cn, rs).inc(int(row["finished_c"]))  # type: ignore[attr-defined]
+                    if METRICS.job_run_cpu_seconds_total is not None and row.get("cpu") is not None:
+                        _labeled(METRICS.job_run_cpu_seconds_total, cn, rs).inc(float(row["cpu"]))  # type: ignore[attr-defined]
+                    if METRICS.job_run_io_read_bytes_total is not None and row.get("io_read") is not None:
+                        _labeled(METRICS.job_run_io_read_bytes_total, cn, rs).inc(float(row["io_read"]))  # type: ignore[attr-defined]
+                    if METRICS.job_run_io_write_bytes_total is not None and row.get("io_write") is not None:
+                        _labeled(METRICS.job_run_io_write_bytes_total, cn, rs).inc(float(row["io_write"]))  # type: ignore[attr-defined]
+                except Exception:
+                    continue
+            for cn, c in started_by_cn.items():
+                _labeled(METRICS.job_runs_started_total, cn).inc(c)  # type: ignore[attr-defined]
+
+            # Histograms still need per-row observations; read plain tuples, not model instances.
+            if any(row["finished_c"] for row in rows):
+                for jd_id, rs, started_at, finished_at, peak_rss in window.filter(finished_q).values_list(
+                    "job_definition_id",
+                    "state",
+                    "started_at",
+                    "finished_at",
+                    "resource_peak_rss_bytes",
+                ).iterator():
+                    cn = names.get(jd_id, "")
+                    rs = str(rs or "")
+                    try:
+                        dur = 0.0
+                        if started_at and finished_at:
+                            dur = max(0.0, float((finished_at - started_at).total_seconds()))
+                        if METRICS.job_run_duration_seconds is not None:
+                            _labeled(METRICS.job_run_duration_seconds, cn, rs).observe(dur)  # type: ignore[attr-defined]
+                        if METRICS.job_run_peak_rss_bytes is not None and peak_rss is not None:
+                            _labeled(METRICS.job_run_peak_rss_bytes, cn, rs).observe(float(peak_rss))  # type: ignore[attr-defined]
+                    except Exception:
+                        continue
+
+            _DB_SYNC_CACHE["started_last_id"] = max(
+                [started_last_id, *(int(row["started_max"]) for row in rows if row["started_max"] is not None)]
+            )
+            _DB_SYNC_CACHE["finished_last_id"] = max(
+                [finished_last_id, *(int(row["finished_max"]) for row in rows if row["finished_max"] is not None)]
+            )
     except Exception:
         pass
 
@@ -352,33 +441,24 @@ def _sync_metrics_from_db() -> None:
     if METRICS.worker_current_job is None:
         return
     try:
-        running_rows = (
-            JobRun.objects.select_related("job_definition")
-            .filter(state=JobRun.State.RUNNING)
-            .only("id", "assigned_worker_id")
-        )
+        # Plain tuples (no model instances / job_definition join); LIMIT is applied in SQL.
+        running_rows = JobRun.objects.filter(state__in=[JobRun.State.RUNNING]).values_list("id", "assigned_worker_id")
         current: dict[int, str] = {}
-        for r in running_rows[:5000]:
-            try:
-                current[int(r.id)] = str(r.assigned_worker_id or "")
-            except Exception:
-                continue
+        for job_run_id, worker_id in running_rows[:5000].iterator(chunk_size=1000):
+            current[int(job_run_id)] = str(worker_id or "")
 
         prev = _DB_SYNC_CACHE.get("running")
         prev_map: dict[int, str] = prev if isinstance(prev, dict) else {}
 
-        # Turn off gauges for no-longer-running jobs
-        for job_run_id, worker_id in list(prev_map.items()):
-            if job_run_id not in current:
-                set_worker_current_job(worker_id=str(worker_id or ""), job_run_id=str(job_run_id), running=False)
-                prev_map.pop(job_run_id, None)
-
-        # Turn on gauges for currently running jobs
-        for job_run_id, worker_id in current.items():
+        # Only touch series that changed: (job_run_id, worker_id) pairs that went away / appeared.
+        prev_items = prev_map.items()
+        cur_items = current.items()
+        for job_run_id, worker_id in prev_items - cur_items:
+            set_worker_current_job(worker_id=str(worker_id or ""), job_run_id=str(job_run_id), running=False)
+        for job_run_id, worker_id in cur_items - prev_items:
             set_worker_current_job(worker_id=str(worker_id or ""), job_run_id=str(job_run_id), running=True)
-            prev_map[job_run_id] = worker_id
 
-        _DB_SYNC_CACHE["running"] = prev_map
+        _DB_SYNC_CACHE["running"] = current
     except Exception:
         return
 
@@ -396,11 +476,11 @@ def _sync_metrics_from_db() -> None:
 
         # Threshold/enable from Settings
         try:
-            th_raw = get_str(key="SCHEDULER_WORKER_HIGH_LOAD_THRESHOLD", default="10", fresh=True).strip() or "10"
+            th_raw = _conf("SCHEDULER_WORKER_HIGH_LOAD_THRESHOLD", "10").strip() or "10"
             th = max(0, int(th_raw))
         except Exception:
             th = 10
-        en_raw = get_str(key="SCHEDULER_ALERT_HIGH_LOAD_ENABLED", default="1", fresh=True).strip()
+        en_raw = _conf("SCHEDULER_ALERT_HIGH_LOAD_ENABLED", "1").strip()
         en = 0.0 if en_raw in {"", "0", "false", "False", "no", "No"} else 1.0
         METRICS.worker_high_load_threshold.set(float(th))  # type: ignore[attr-defined]
         METRICS.alert_high_load_enabled.set(float(en))  # type: ignore[attr-defined]
@@ -408,24 +488,20 @@ def _sync_metrics_from_db() -> None:
         running_counts: dict[str, int] = {}
         assigned_counts: dict[str, int] = {}
 
+        # One grouped query over the active partial index instead of one per state.
         for row in (
-            JobRun.objects.filter(state=JobRun.State.RUNNING)
-            .exclude(assigned_worker_id=None)
-            .values("assigned_worker_id")
+            JobRun.objects.filter(state__in=[JobRun.State.ASSIGNED, JobRun.State.RUNNING])
+            .exclude(assigned_worker_id="")
+            .values("assigned_worker_id", "state")
             .annotate(c=Count("id"))
+            .order_by()
         ):
             wid = str(row.get("assigned_worker_id") or "").strip()
-            if wid:
+            if not wid:
+                continue
+            if row.get("state") == JobRun.State.RUNNING:
                 running_counts[wid] = int(row.get("c") or 0)
-
-        for row in (
-            JobRun.objects.filter(state=JobRun.State.ASSIGNED)
-            .exclude(assigned_worker_id=None)
-            .values("assigned_worker_id")
-            .annotate(c=Count("id"))
-        ):
-            wid = str(row.get("assigned_worker_id") or "").strip()
-            if wid:
+            else:
                 assigned_counts[wid] = int(row.get("c") or 0)
 
         prev_val = _DB_SYNC_CACHE.get("worker_ids")
@@ -453,11 +529,73 @@ def _sync_metrics_from_db() -> None:
 
 
 def _metrics_token_ok(request) -> bool:
-    required = get_str(key="SCHEDULER_METRICS_TOKEN", default="", fresh=True).strip()
+    required = _conf("SCHEDULER_METRICS_TOKEN", "", ttl=10.0).strip()
     if not required:
         return True
     got = (request.headers.get("X-Scheduler-Token") or "").strip()
-    return got == required
+    return hmac.compare_digest(got.encode("utf-8"), required.encode("utf-8"))
+
+
+_SYNC_THREAD_LOCK = threading.Lock()
+_SYNC_THREAD: threading.Thread | None = None
+_SYNC_INTERVAL_SECONDS = 5.0
+
+
+def _sync_disabled() -> bool:
+    return os.environ.get("SCHEDULER_METRICS_SYNC_DISABLED", "").strip() not in {"", "0", "false", "False", "no", "No"}
+
+
+# Background sync only runs while someone is scraping; after this much idle time it pauses.
+_SCRAPE_IDLE_SECONDS = 120.0
+_LAST_SCRAPE: dict[str, float] = {"ts": 0.0}
+_SYNC_WAKE = threading.Event()
+
+
+def _note_scrape() -> None:
+    now = time.time()
+    was_idle = (now - _LAST_SCRAPE["ts"]) > _SCRAPE_IDLE_SECONDS
+    _LAST_SCRAPE["ts"] = now
+    if was_idle:
+        # Resume immediately; this scrape still sees the pre-idle values (next one is fresh).
+        _SYNC_WAKE.set()
+
+
+def _sync_loop() -> None:
+    from django.db import close_old_connections
+
+    while True:
+        if (time.time() - _LAST_SCRAPE["ts"]) > _SCRAPE_IDLE_SECONDS:
+            _SYNC_WAKE.wait()
+            _SYNC_WAKE.clear()
+            continue
+        try:
+            close_old_connections()
+            _sync_metrics_from_db()
+            _sync_metrics_from_redis()
+        except Exception:
+            pass
+        finally:
+            try:
+                close_old_connections()
+            except Exception:
+                pass
+        _SYNC_WAKE.wait(timeout=_SYNC_INTERVAL_SECONDS)
+        _SYNC_WAKE.clear()
+
+
+def _ensure_sync_thread() -> bool:
+    """Start the background DB/Redis sync once per process. Returns False when disabled."""
+    global _SYNC_THREAD
+    if _sync_disabled():
+        return False
+    if _SYNC_THREAD is not None:
+        return True
+    with _SYNC_THREAD_LOCK:
+        if _SYNC_THREAD is None:
+            t = threading.Thread(target=_sync_loop, name="scheduler-metrics-sync", daemon=True)
+            t.start()
+            _SYNC_THREAD = t
+    return True
 
 
 def metrics_view(request):
@@ -467,30 +605,34 @@ def metrics_view(request):
     if not _metrics_token_ok(request):
         return HttpResponse("unauthorized", status=401, content_type="text/plain; charset=utf-8")
 
-    _sync_metrics_from_db()
-    _sync_metrics_from_redis()
+    # Scrapes only render; syncing runs on a background thread (started lazily so
+    # worker processes importing this module don't spawn it).
+    _note_scrape()
+    if not _ensure_sync_thread():
+        _sync_metrics_from_db()
+        _sync_metrics_from_redis()
 
     body = generate_latest()
     return HttpResponse(body, content_type=CONTENT_TYPE_LATEST)
 
 
 def observe_job_started(*, command_name: str) -> None:
-    if METRICS.job_runs_started_total is None:
+    if _STARTED is None:
         return
     try:
-        METRICS.job_runs_started_total.labels(command_name=str(command_name or "")).inc()  # type: ignore[attr-defined]
+        _labeled(_STARTED, str(command_name or "")).inc()  # type: ignore[attr-defined]
     except Exception:
         return
 
 
 def observe_job_finished(*, command_name: str, result: str, duration_seconds: float) -> None:
-    if METRICS.job_runs_finished_total is None or METRICS.job_run_duration_seconds is None:
+    if _FINISHED is None or _DURATION is None:
         return
     try:
         cn = str(command_name or "")
         rs = str(result or "")
-        METRICS.job_runs_finished_total.labels(command_name=cn, result=rs).inc()  # type: ignore[attr-defined]
-        METRICS.job_run_duration_seconds.labels(command_name=cn, result=rs).observe(float(duration_seconds))  # type: ignore[attr-defined]
+        _labeled(_FINISHED, cn, rs).inc()  # type: ignore[attr-defined]
+        _labeled(_DURATION, cn, rs).observe(float(duration_seconds))  # type: ignore[attr-defined]
     except Exception:
         return
 
@@ -504,33 +646,28 @@ def observe_job_resources(
     io_read_bytes: int | None,
     io_write_bytes: int | None,
 ) -> None:
-    if (
-        METRICS.job_run_cpu_seconds_total is None
-        or METRICS.job_run_io_read_bytes_total is None
-        or METRICS.job_run_io_write_bytes_total is None
-        or METRICS.job_run_peak_rss_bytes is None
-    ):
+    if _CPU is None or _IO_READ is None or _IO_WRITE is None or _PEAK_RSS is None:
         return
     try:
         cn = str(command_name or "")
         rs = str(result or "")
         if cpu_seconds_total is not None:
-            METRICS.job_run_cpu_seconds_total.labels(command_name=cn, result=rs).inc(float(cpu_seconds_total))  # type: ignore[attr-defined]
+            _labeled(_CPU, cn, rs).inc(float(cpu_seconds_total))  # type: ignore[attr-defined]
         if io_read_bytes is not None:
-            METRICS.job_run_io_read_bytes_total.labels(command_name=cn, result=rs).inc(float(io_read_bytes))  # type: ignore[attr-defined]
+            _labeled(_IO_READ, cn, rs).inc(float(io_read_bytes))  # type: ignore[attr-defined]
         if io_write_bytes is not None:
-            METRICS.job_run_io_write_bytes_total.labels(command_name=cn, result=rs).inc(float(io_write_bytes))  # type: ignore[attr-defined]
+            _labeled(_IO_WRITE, cn, rs).inc(float(io_write_bytes))  # type: ignore[attr-defined]
         if peak_rss_bytes is not None:
-            METRICS.job_run_peak_rss_bytes.labels(command_name=cn, result=rs).observe(float(peak_rss_bytes))  # type: ignore[attr-defined]
+            _labeled(_PEAK_RSS, cn, rs).observe(float(peak_rss_bytes))  # type: ignore[attr-defined]
     except Exception:
         return
 
 
 def set_worker_current_job(*, worker_id: str, job_run_id: str, running: bool) -> None:
-    if METRICS.worker_current_job is None:
+    if _CURRENT_JOB is None:
         return
     try:
-        g = METRICS.worker_current_job.labels(worker_id=str(worker_id or ""), job_run_id=str(job_run_id or ""))  # type: ignore[attr-defined]
+        g = _CURRENT_JOB.labels(worker_id=str(worker_id or ""), job_run_id=str(job_run_id or ""))  # type: ignore[attr-defined]
         g.set(1.0 if running else 0.0)
     except Exception:
         return
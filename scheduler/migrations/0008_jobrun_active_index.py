@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+from ._concurrent import add_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0007_jobrun_resource_usage"),
+    ]
+
+    operations = [
+        add_index_concurrently(
+            "jobrun",
+            models.Index(
+                condition=models.Q(("state__in", ["ASSIGNED", "RUNNING"])),
+                fields=["state", "assigned_worker_id", "started_at"],
+                name="sched_jobrun_active_wkr_start",
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+"""Audit log retention: (action, -created_at) index and the prune job definition.
+
+The "System: Prune audit log" JobDefinition (scheduler_prune_audit_log, daily 03:30) is
+created DISABLED: pruning deletes AdminActionLog rows, so operators opt in by enabling
+it in the Ops UI after checking SCHEDULER_AUDIT_RETENTION_DAYS.
+"""
+
+from __future__ import annotations
+
+from django.db import migrations, models
+
+from ._concurrent import add_index_concurrently, remove_index_concurrently
+
+
+_PRUNE_JOB_NAME = "System: Prune audit log"
+
+
+def seed_prune_job(apps, schema_editor):
+    JobDefinition = apps.get_model("scheduler", "JobDefinition")
+    if JobDefinition.objects.filter(command_name="scheduler_prune_audit_log").exists():
+        return
+    JobDefinition.objects.create(
+        name=_PRUNE_JOB_NAME,
+        # Opt-in: never start deleting audit rows in an existing environment on upgrade.
+        enabled=False,
+        type="time",
+        command_name="scheduler_prune_audit_log",
+        default_args_json={},
+        schedule={"kind": "daily", "time": "03:30"},
+        timeout_seconds=600,
+        max_retries=0,
+        retry_backoff_seconds=0,
+        concurrency_policy="forbid",
+    )
+
+
+def unseed_prune_job(apps, schema_editor):
+    JobDefinition = apps.get_model("scheduler", "JobDefinition")
+    JobDefinition.objects.filter(name=_PRUNE_JOB_NAME, command_name="scheduler_prune_audit_log").delete()
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0008_jobrun_active_index"),
+    ]
+
+    operations = [
+        add_index_concurrently(
+            "adminactionlog",
+            models.Index(fields=["action", "-created_at"], name="sched_audit_action_created"),
+        ),
+        remove_index_concurrently(
+            "adminactionlog",
+            models.Index(fields=["action"], name="sched_audit_action"),
+        ),
+        migrations.RunPython(seed_prune_job, unseed_prune_job),
+    ]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+from ._concurrent import add_index_concurrently, remove_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0009_audit_log_retention"),
+    ]
+
+    operations = [
+        add_index_concurrently(
+            "jobrun",
+            models.Index(
+                condition=models.Q(("state__in", ["PENDING", "ORPHANED", "ASSIGNED"])),
+                fields=["state", "scheduled_for"],
+                name="sched_jobrun_due_partial",
+            ),
+        ),
+        remove_index_concurrently(
+            "jobrun",
+            models.Index(fields=["state", "scheduled_for"], name="sched_jobrun_state_scheduled"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+from ._concurrent import remove_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0010_jobrun_due_partial_index"),
+    ]
+
+    operations = [
+        # Nothing reads events by processed_at, and ingest stores every event already processed.
+        remove_index_concurrently(
+            "event",
+            models.Index(fields=["processed_at", "created_at"], name="sched_event_proc_created"),
+        ),
+    ]
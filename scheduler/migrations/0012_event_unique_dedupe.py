@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+_INDEX_NAME = "sched_event_unique_dedupe_nn"
+
+_CONSTRAINT = models.UniqueConstraint(
+    condition=models.Q(("dedupe_key__isnull", False)),
+    fields=("event_type", "dedupe_key"),
+    name=_INDEX_NAME,
+)
+
+
+def clear_duplicate_dedupe_keys(apps, schema_editor):
+    """Keep dedupe_key only on the newest row per (event_type, dedupe_key).
+
+    ingest_event returned the newest match, so that row keeps answering the lookup;
+    older duplicates (left by concurrent ingests) become plain events.
+    """
+    Event = apps.get_model("scheduler", "Event")
+    dupes = (
+        Event.objects.filter(dedupe_key__isnull=False)
+        .values("event_type", "dedupe_key")
+        .annotate(n=models.Count("id"), keep_id=models.Max("id"))
+        .filter(n__gt=1)
+    )
+    for row in dupes.iterator():
+        Event.objects.filter(event_type=row["event_type"], dedupe_key=row["dedupe_key"]).exclude(
+            id=row["keep_id"]
+        ).update(dedupe_key=None)
+
+
+def add_unique_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        # A failed CONCURRENTLY build (e.g. a duplicate inserted mid-build) leaves an INVALID index
+        # behind that IF NOT EXISTS would silently accept; drop it so a rerun rebuilds it.
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_INDEX_NAME}")
+        schema_editor.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY {_INDEX_NAME} "
+            "ON scheduler_events (event_type, dedupe_key) WHERE dedupe_key IS NOT NULL"
+        )
+    else:
+        schema_editor.add_constraint(apps.get_model("scheduler", "Event"), _CONSTRAINT)
+
+
+def drop_unique_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_INDEX_NAME}")
+    else:
+        schema_editor.remove_constraint(apps.get_model("scheduler", "Event"), _CONSTRAINT)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0011_drop_event_proc_created_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_duplicate_dedupe_keys, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[migrations.AddConstraint(model_name="event", constraint=_CONSTRAINT)],
+            database_operations=[migrations.RunPython(add_unique_index, drop_unique_index)],
+        ),
+    ]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+from ._concurrent import add_index_concurrently, remove_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0012_event_unique_dedupe"),
+    ]
+
+    operations = [
+        add_index_concurrently(
+            "jobrun",
+            models.Index(
+                condition=models.Q(("state__in", ["PENDING", "ORPHANED", "ASSIGNED"])),
+                fields=["state", "scheduled_for", "id"],
+                include=["assigned_worker_id", "job_definition", "attempt", "version", "leader_epoch", "started_at"],
+                name="sched_jobrun_dispatch_cov",
+            ),
+        ),
+        remove_index_concurrently(
+            "jobrun",
+            models.Index(
+                condition=models.Q(("state__in", ["PENDING", "ORPHANED", "ASSIGNED"])),
+                fields=["state", "scheduled_for"],
+                name="sched_jobrun_due_partial",
+            ),
+        ),
+    ]
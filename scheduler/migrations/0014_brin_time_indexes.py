@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from ._concurrent import add_index_concurrently, remove_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0013_jobrun_dispatch_covering_index"),
+    ]
+
+    operations = [
+        add_index_concurrently(
+            "adminactionlog",
+            models.Index(fields=["created_at"], name="sched_audit_created_brin"),
+            postgres_index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="sched_audit_created_brin", pages_per_range=32
+            ),
+        ),
+        remove_index_concurrently(
+            "adminactionlog",
+            models.Index(fields=["created_at"], name="sched_audit_created_at"),
+        ),
+        add_index_concurrently(
+            "configreloadrequest",
+            models.Index(fields=["requested_at"], name="sched_reload_requested_brin"),
+            postgres_index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["requested_at"], name="sched_reload_requested_brin", pages_per_range=32
+            ),
+        ),
+        remove_index_concurrently(
+            "configreloadrequest",
+            models.Index(fields=["requested_at"], name="sched_reload_requested_at"),
+        ),
+    ]
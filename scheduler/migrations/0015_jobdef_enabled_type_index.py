@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+from ._concurrent import add_index_concurrently, remove_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("scheduler", "0014_brin_time_indexes"),
+    ]
+
+    operations = [
+        add_index_concurrently(
+            "jobdefinition",
+            models.Index(
+                condition=models.Q(("enabled", True)),
+                fields=["type"],
+                name="sched_jobdef_enabled_type",
+            ),
+        ),
+        remove_index_concurrently(
+            "jobdefinition",
+            models.Index(fields=["enabled"], name="sched_jobdef_enabled"),
+        ),
+        remove_index_concurrently(
+            "jobdefinition",
+            models.Index(fields=["type"], name="sched_jobdef_type"),
+        ),
+    ]
@@ -0,0 +1,114 @@
+# Python-side codec only; no database change.
+
+from __future__ import annotations
+
+from django.db import migrations, models
+
+import scheduler.json_codec
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scheduler", "0015_jobdef_enabled_type_index"),
+    ]
+
+    # encoder/decoder are Python-side only: state-only operations, so no backend
+    # rebuilds a table (SQLite would otherwise remake every table for an AlterField).
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="jobdefinition",
+                    name="default_args_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=dict,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="jobdefinition",
+                    name="schedule",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=dict,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="event",
+                    name="payload_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=dict,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="schedulersetting",
+                    name="value_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=dict,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="schedulersettinghelp",
+                    name="enum_values_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=list,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="schedulersettinghelp",
+                    name="constraints_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=dict,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="schedulersettinghelp",
+                    name="examples_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=list,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="adminactionlog",
+                    name="payload_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=dict,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="configreloadrequest",
+                    name="result_json",
+                    field=models.JSONField(
+                        blank=True,
+                        decoder=scheduler.json_codec.FastJSONDecoder,
+                        default=dict,
+                        encoder=scheduler.json_codec.FastJSONEncoder,
+                    ),
+                ),
+            ],
+            database_operations=[],
+        ),
+    ]
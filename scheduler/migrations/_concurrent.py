@@ -0,0 +1,60 @@
+"""Index operations that build/drop CONCURRENTLY on PostgreSQL.
+
+Migrations using these must set ``atomic = False``. On other backends (SQLite in
+dev) the regular schema editor path is used, so the resulting schema is the same.
+For PostgreSQL-only index types (BRIN/GIN), pass the plain ``models.Index``
+as ``index`` (that is what the model state and other backends get) and the
+PostgreSQL-only index as ``postgres_index`` (same name). Keeping BRIN/GIN out
+of the migration state matters on SQLite: any later table remake re-emits the
+state's indexes, and SQLite cannot parse their ``WITH (...)`` options.
+"""
+
+from __future__ import annotations
+
+from django.db import migrations
+
+
+def _is_postgres(schema_editor) -> bool:
+    return schema_editor.connection.vendor == "postgresql"
+
+
+def _create(model, index, schema_editor, postgres_index=None) -> None:
+    if _is_postgres(schema_editor):
+        schema_editor.execute((postgres_index or index).create_sql(model, schema_editor, concurrently=True))
+    else:
+        schema_editor.add_index(model, index)
+
+
+def _drop(model, index, schema_editor, postgres_index=None) -> None:
+    if _is_postgres(schema_editor):
+        schema_editor.execute((postgres_index or index).remove_sql(model, schema_editor, concurrently=True))
+    else:
+        schema_editor.remove_index(model, index)
+
+
+def add_index_concurrently(model_name: str, index, *, postgres_index=None) -> migrations.SeparateDatabaseAndState:
+    def forwards(apps, schema_editor):
+        _create(apps.get_model("scheduler", model_name), index, schema_editor, postgres_index)
+
+    def backwards(apps, schema_editor):
+        _drop(apps.get_model("scheduler", model_name), index, schema_editor, postgres_index)
+
+    return migrations.SeparateDatabaseAndState(
+        state_operations=[migrations.AddIndex(model_name=model_name, index=index)],
+        database_operations=[migrations.RunPython(forwards, backwards)],
+    )
+
+
+def remove_index_concurrently(model_name: str, index, *, postgres_index=None) -> migrations.SeparateDatabaseAndState:
+    """``index`` must match the definition being removed (needed to recreate it on reverse)."""
+
+    def forwards(apps, schema_editor):
+        _drop(apps.get_model("scheduler", model_name), index, schema_editor, postgres_index)
+
+    def backwards(apps, schema_editor):
+        _create(apps.get_model("scheduler", model_name), index, schema_editor, postgres_index)
+
+    return migrations.SeparateDatabaseAndState(
+        state_operations=[migrations.RemoveIndex(model_name=model_name, name=index.name)],
+        database_operations=[migrations.RunPython(forwards, backwards)],
+    )
@@ -2,6 +2,51 @@ from __future__ import annotations
 
 from django.db import models
 
+from scheduler.json_codec import FastJSONDecoder, FastJSONEncoder
+
+
+# Columns the runtime paths (dispatch / start / finish) actually read. Everything else
+# (schedule, error_summary, resource_*, continuation_*, timestamps) stays deferred.
+JOB_DEFINITION_LOOKUP_FIELDS = (
+    "id",
+    "enabled",
+    "type",
+    "command_name",
+    "default_args_json",
+    "timeout_seconds",
+    "concurrency_policy",
+)
+JOB_RUN_DISPATCH_FIELDS = (
+    "id",
+    "job_definition",
+    "state",
+    "scheduled_for",
+    "assigned_worker_id",
+    "attempt",
+    "version",
+    "leader_epoch",
+    "started_at",
+)
+
+
+class JobDefinitionLookupManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().only(*JOB_DEFINITION_LOOKUP_FIELDS)
+
+
+class JobRunDispatchManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().only(*JOB_RUN_DISPATCH_FIELDS)
+
+    def with_definition(self):
+        """Dispatch projection joined with the lookup projection of job_definition."""
+        return (
+            super()
+            .get_queryset()
+            .select_related("job_definition")
+            .only(*JOB_RUN_DISPATCH_FIELDS, *(f"job_definition__{f}" for f in JOB_DEFINITION_LOOKUP_FIELDS))
+        )
+
 
 class JobDefinition(models.Model):
     class JobType(models.TextChoices):
@@ -18,9 +63,9 @@ class JobDefinition(models.Model):
     type = models.CharField(max_length=16, choices=JobType.choices)
 
     command_name = models.CharField(max_length=200)
-    default_args_json = models.JSONField(default=dict, blank=True)
+    default_args_json = models.JSONField(default=dict, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
 
-    schedule = models.JSONField(default=dict, blank=True)
+    schedule = models.JSONField(default=dict, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
 
     timeout_seconds = models.IntegerField(default=0)
     max_retries = models.IntegerField(default=0)
@@ -35,11 +80,14 @@ class JobDefinition(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    lookup = JobDefinitionLookupManager()
+
     class Meta:
         db_table = "scheduler_job_definitions"
         indexes = [
-            models.Index(fields=["enabled"], name="sched_jobdef_enabled"),
-            models.Index(fields=["type"], name="sched_jobdef_type"),
+            # Runtime lookups are always "enabled jobs (of a type)"; disabled defs stay out of the index.
+            models.Index(fields=["type"], name="sched_jobdef_enabled_type", condition=models.Q(enabled=True)),
         ]
 
     def __str__(self) -> str:
@@ -62,6 +110,10 @@ class JobRun(models.Model):
         NONE = "NONE", "NONE"
         CONFIRMING = "CONFIRMING", "CONFIRMING"
 
+    # id stays the app-wide BigAutoField: only the leader and ingest insert rows, so the
+    # sequence is not a contention point, and its insert order is what the dispatch index
+    # (scheduled_for, id) and id-batched scans rely on. It is never updated after insert.
+    # Revisit (UUIDv7) only if rows start being created without a shared DB sequence.
     job_definition = models.ForeignKey(JobDefinition, on_delete=models.CASCADE)
 
     scheduled_for = models.DateTimeField(null=True, blank=True)
@@ -99,6 +151,9 @@ class JobRun(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    dispatch = JobRunDispatchManager()
+
     class Meta:
         db_table = "scheduler_job_runs"
         constraints = [
@@ -108,9 +163,23 @@ class JobRun(models.Model):
             )
         ]
         indexes = [
-            models.Index(fields=["state", "scheduled_for"], name="sched_jobrun_state_scheduled"),
+            # Due-work polling (PENDING/ORPHANED/ASSIGNED by scheduled_for, id); excludes finished history.
+            # INCLUDE carries the remaining JOB_RUN_DISPATCH_FIELDS so the worker's dispatch poll can be
+            # answered from the index (PostgreSQL; other backends ignore include).
+            models.Index(
+                fields=["state", "scheduled_for", "id"],
+                include=["assigned_worker_id", "job_definition", "attempt", "version", "leader_epoch", "started_at"],
+                name="sched_jobrun_dispatch_cov",
+                condition=models.Q(state__in=["PENDING", "ORPHANED", "ASSIGNED"]),
+            ),
             models.Index(fields=["assigned_worker_id", "state"], name="sched_jobrun_worker_state"),
             models.Index(fields=["created_at"], name="sched_jobrun_created_at"),
+            # Active rows only (reconcile / metrics / dispatch); stays small as history grows.
+            models.Index(
+                fields=["state", "assigned_worker_id", "started_at"],
+                name="sched_jobrun_active_wkr_start",
+                condition=models.Q(state__in=["ASSIGNED", "RUNNING"]),
+            ),
         ]
 
     def __str__(self) -> str:
@@ -119,7 +188,7 @@ class JobRun(models.Model):
 
 class Event(models.Model):
     event_type = models.CharField(max_length=128)
-    payload_json = models.JSONField(default=dict, blank=True)
+    payload_json = models.JSONField(default=dict, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
     dedupe_key = models.CharField(max_length=256, null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -127,8 +196,13 @@ class Event(models.Model):
 
     class Meta:
         db_table = "scheduler_events"
-        indexes = [
-            models.Index(fields=["processed_at", "created_at"], name="sched_event_proc_created"),
+        constraints = [
+            # Idempotent ingest: at most one event per (event_type, dedupe_key); NULL keys are exempt.
+            models.UniqueConstraint(
+                fields=["event_type", "dedupe_key"],
+                name="sched_event_unique_dedupe_nn",
+                condition=models.Q(dedupe_key__isnull=False),
+            ),
         ]
 
     def __str__(self) -> str:
@@ -137,7 +211,7 @@ class Event(models.Model):
 
 class SchedulerSetting(models.Model):
     key = models.CharField(max_length=128, unique=True)
-    value_json = models.JSONField(default=dict, blank=True)
+    value_json = models.JSONField(default=dict, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -166,9 +240,9 @@ class SchedulerSettingHelp(models.Model):
 
     editable = models.BooleanField(default=True)
     input_type = models.CharField(max_length=16, choices=InputType.choices, default=InputType.TEXT)
-    enum_values_json = models.JSONField(default=list, blank=True)
-    constraints_json = models.JSONField(default=dict, blank=True)
-    examples_json = models.JSONField(default=list, blank=True)
+    enum_values_json = models.JSONField(default=list, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
+    constraints_json = models.JSONField(default=dict, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
+    examples_json = models.JSONField(default=list, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
     is_secret = models.BooleanField(default=False)
 
     updated_at = models.DateTimeField(auto_now=True)
@@ -184,14 +258,16 @@ class AdminActionLog(models.Model):
     actor = models.CharField(max_length=150, blank=True)
     action = models.CharField(max_length=128)
     target = models.CharField(max_length=256, blank=True)
-    payload_json = models.JSONField(default=dict, blank=True)
+    payload_json = models.JSONField(default=dict, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "scheduler_admin_action_logs"
         indexes = [
-            models.Index(fields=["created_at"], name="sched_audit_created_at"),
-            models.Index(fields=["action"], name="sched_audit_action"),
+            # Append-only time column, only range-scanned (retention prune): built as
+            # BRIN (pages_per_range=32) on PostgreSQL by migration 0014, b-tree elsewhere.
+            models.Index(fields=["created_at"], name="sched_audit_created_brin"),
+            models.Index(fields=["action", "-created_at"], name="sched_audit_action_created"),
         ]
 
     def __str__(self) -> str:
@@ -213,13 +289,14 @@ class ConfigReloadRequest(models.Model):
     leader_worker_id = models.CharField(max_length=128, blank=True)
     leader_epoch = models.BigIntegerField(null=True, blank=True)
 
-    result_json = models.JSONField(default=dict, blank=True)
+    result_json = models.JSONField(default=dict, blank=True, encoder=FastJSONEncoder, decoder=FastJSONDecoder)
 
     class Meta:
         db_table = "scheduler_config_reload_requests"
         indexes = [
             models.Index(fields=["status", "requested_at"], name="sched_reload_status_req"),
-            models.Index(fields=["requested_at"], name="sched_reload_requested_at"),
+            # BRIN on PostgreSQL (migration 0014), b-tree elsewhere.
+            models.Index(fields=["requested_at"], name="sched_reload_requested_brin"),
         ]
 
     def __str__(self) -> str:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
-from typing import Optional
+from functools import partial
+from typing import Callable, Optional
 
 import redis
 
@@ -18,6 +21,11 @@ def _k_leader_epoch() -> str:
     return "scheduler:leader:epoch"
 
 
+def _k_cluster_version() -> str:
+    # Bumped whenever leader/subleader ownership changes.
+    return "scheduler:cluster:version"
+
+
 def _k_worker_heartbeat(worker_id: str) -> str:
     return f"scheduler:worker:{worker_id}:heartbeat"
 
@@ -26,6 +34,43 @@ def _k_worker_info(worker_id: str) -> str:
     return f"scheduler:worker:{worker_id}:info"
 
 
+def _k_workers_by_last_seen() -> str:
+    # ZSET worker_id -> last_seen, written with every heartbeat; list_workers reads it in order.
+    return "scheduler:workers:by_last_seen"
+
+
+def config_reload_channel() -> str:
+    return "scheduler:config_reload"
+
+
+def settings_changed_channel() -> str:
+    return "scheduler:settings_changed"
+
+
+def jobrun_ready_channel() -> str:
+    return "scheduler:jobrun_ready"
+
+
+_POOL_CACHE: dict[str, redis.ConnectionPool] = {}
+_POOL_CACHE_LOCK = threading.Lock()
+
+
+def _client(redis_url: str) -> redis.Redis:
+    """Client on a process-wide ConnectionPool per URL (short-lived calls reuse sockets).
+
+    Replies are raw bytes: callers decode only the text fields they keep
+    (numbers go straight to int()/float(), which accept bytes).
+    """
+    pool = _POOL_CACHE.get(redis_url)
+    if pool is None:
+        with _POOL_CACHE_LOCK:
+            pool = _POOL_CACHE.get(redis_url)
+            if pool is None:
+                pool = redis.ConnectionPool.from_url(redis_url)
+                _POOL_CACHE[redis_url] = pool
+    return redis.Redis(connection_pool=pool)
+
+
 @dataclass(frozen=True)
 class WorkerInfo:
     worker_id: str
@@ -45,62 +90,274 @@ class ClusterLeadership:
 
 
 def get_cluster_leadership(redis_url: str) -> ClusterLeadership:
-    r = redis.Redis.from_url(redis_url, decode_responses=True)
-    leader_worker_id = r.get(_k_leader_lock())
-    raw_epoch = r.get(_k_leader_epoch())
+    r = _client(redis_url)
+    raw_leader, raw_epoch = r.mget(_k_leader_lock(), _k_leader_epoch())
     cluster_epoch = int(raw_epoch) if raw_epoch else 0
-    return ClusterLeadership(leader_worker_id=leader_worker_id, cluster_epoch=cluster_epoch)
-
+    return ClusterLeadership(leader_worker_id=_text(raw_leader) or None, cluster_epoch=cluster_epoch)
+
+
+# SCAN COUNT hint for the client-side fallback; the default (10) means one cursor round trip per ~10 keys.
+SCAN_COUNT = 500
+
+
+# Single round trip: leader/subleader locks + every worker info hash + heartbeat TTL.
+# Workers come from the by_last_seen ZSET, newest first, so no SCAN and no client-side sort.
+# A member whose heartbeat is already gone (TTL -2) is dropped from the ZSET and skipped.
+# Returns a flat array: leader, subleader, then 6 slots per worker
+# (worker_id, node_id, grpc_host, grpc_port, last_seen, heartbeat_ttl).
+# Workers from before the ZSET never ZADD themselves, so they are not listed until restarted
+# (a rolling deploy needs one full restart cycle; see docs/architecture.md 5.1).
+# Requires single-node Redis: the per-worker key names are built from ARGV inside the script, which
+# Redis Cluster rejects (keys not declared in KEYS may live in another slot). On Cluster the script
+# errors and list_workers() falls back to _list_workers_scan().
+_LUA_LIST_WORKERS = """
+local out = {redis.call('GET', KEYS[1]) or '', redis.call('GET', KEYS[2]) or ''}
+for _, wid in ipairs(redis.call('ZREVRANGE', KEYS[3], 0, -1)) do
+  local ttl = redis.call('TTL', ARGV[1] .. wid .. ARGV[2])
+  if ttl == -2 then
+    redis.call('ZREM', KEYS[3], wid)
+  else
+    local f = redis.call('HMGET', ARGV[3] .. wid .. ARGV[4], 'worker_id', 'node_id', 'grpc_host', 'grpc_port', 'last_seen')
+    if f[1] then
+      out[#out + 1] = f[1]
+      out[#out + 1] = f[2] or ''
+      out[#out + 1] = f[3] or ''
+      out[#out + 1] = f[4] or ''
+      out[#out + 1] = f[5] or ''
+      out[#out + 1] = ttl
+    end
+  end
+end
+return out
+"""
 
-def list_workers(redis_url: str) -> list[WorkerInfo]:
-    r = redis.Redis.from_url(redis_url, decode_responses=True)
-    leader_worker_id = r.get(_k_leader_lock())
-    subleader_worker_id = r.get(_k_subleader_lock())
+# Key layout as prefix + worker_id + suffix (same as _k_worker_heartbeat / _k_worker_info).
+_HB_PREFIX, _HB_SUFFIX = _k_worker_heartbeat("\0").split("\0")
+_INFO_PREFIX, _INFO_SUFFIX = _k_worker_info("\0").split("\0")
+
+
+def _worker_id_from_info_key(key: str) -> str:
+    return key[len(_INFO_PREFIX) : len(key) - len(_INFO_SUFFIX)]
+
+# Script objects (and their SHA1) are built once per process and shared by every client;
+# callers always pass client= so the registering client is never the one used.
+_SCRIPTS: dict[str, "redis.commands.core.Script"] = {}
+_SCRIPTS_LOCK = threading.Lock()
+
+
+def _script(r: redis.Redis, source: str):
+    script = _SCRIPTS.get(source)
+    if script is None:
+        with _SCRIPTS_LOCK:
+            script = _SCRIPTS.get(source)
+            if script is None:
+                script = r.register_script(source)
+                _SCRIPTS[source] = script
+    return script
+
+
+def _text(raw) -> str:
+    return raw.decode() if raw else ""
+
+
+def _parse_float(raw) -> Optional[float]:
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_int(raw, default: int = 0) -> int:
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+def _worker_info_from_fields(
+    *,
+    worker_id: str,
+    node_id: str,
+    grpc_host: str,
+    raw_grpc_port,
+    raw_last_seen,
+    ttl,
+    leader_worker_id: Optional[str],
+    subleader_worker_id: Optional[str],
+) -> Optional[WorkerInfo]:
+    if not worker_id or not raw_last_seen:
+        return None
+
+    last_seen = _parse_float(raw_last_seen)
+    if last_seen is None:
+        return None
+
+    grpc_port = _parse_int(raw_grpc_port) if raw_grpc_port else 0
+    heartbeat_ttl_seconds = max(0, _parse_int(ttl))
+
+    return WorkerInfo(
+        worker_id=worker_id,
+        node_id=node_id,
+        grpc_host=grpc_host,
+        grpc_port=grpc_port,
+        last_seen=last_seen,
+        heartbeat_ttl_seconds=heartbeat_ttl_seconds,
+        is_leader=(leader_worker_id == worker_id),
+        is_subleader=(subleader_worker_id == worker_id),
+    )
+
+
+def _list_workers_lua(r: redis.Redis) -> list[WorkerInfo]:
+    raw = _script(r, _LUA_LIST_WORKERS)(
+        keys=[_k_leader_lock(), _k_subleader_lock(), _k_workers_by_last_seen()],
+        args=[_HB_PREFIX, _HB_SUFFIX, _INFO_PREFIX, _INFO_SUFFIX],
+        client=r,
+    )
+    leader_worker_id = _text(raw[0]) or None
+    subleader_worker_id = _text(raw[1]) or None
 
     workers: list[WorkerInfo] = []
-    for key in r.scan_iter(match="scheduler:worker:*:info"):
-        data = r.hgetall(key)
-        worker_id = data.get("worker_id")
-        node_id = data.get("node_id", "")
-        grpc_host = data.get("grpc_host", "")
-        raw_grpc_port = data.get("grpc_port")
-        raw_last_seen = data.get("last_seen")
+    for i in range(2, len(raw) - 5, 6):
+        w = _worker_info_from_fields(
+            worker_id=_text(raw[i]),
+            node_id=_text(raw[i + 1]),
+            grpc_host=_text(raw[i + 2]),
+            raw_grpc_port=raw[i + 3],
+            raw_last_seen=raw[i + 4],
+            ttl=raw[i + 5],
+            leader_worker_id=leader_worker_id,
+            subleader_worker_id=subleader_worker_id,
+        )
+        if w is not None:
+            workers.append(w)
+    return workers
 
-        if not worker_id or not raw_last_seen:
-            continue
 
-        try:
-            last_seen = float(raw_last_seen)
-        except ValueError:
-            continue
+def _list_workers_scan(r: redis.Redis) -> list[WorkerInfo]:
+    # Same data as the Lua path in two pipelines (plus SCAN cursors) instead of 2 + 2N round trips:
+    # the locks and every heartbeat TTL first, then the info hashes of live workers only.
+    try:
+        # TYPE (Redis 6+) drops non-hash keys server-side.
+        keys = [_text(k) for k in r.scan_iter(match="scheduler:worker:*:info", count=SCAN_COUNT, _type="HASH")]
+    except redis.exceptions.ResponseError:
+        keys = [_text(k) for k in r.scan_iter(match="scheduler:worker:*:info", count=SCAN_COUNT)]
+
+    pipe = r.pipeline(transaction=False)
+    pipe.get(_k_leader_lock())
+    pipe.get(_k_subleader_lock())
+    for key in keys:
+        pipe.ttl(_k_worker_heartbeat(_worker_id_from_info_key(key)))
+    res = pipe.execute()
+    leader_worker_id, subleader_worker_id = _text(res[0]) or None, _text(res[1]) or None
+    live = [(key, ttl) for key, ttl in zip(keys, res[2:]) if ttl != -2]
+
+    pipe = r.pipeline(transaction=False)
+    for key, _ttl in live:
+        pipe.hgetall(key)
+    infos = pipe.execute() if live else []
+    ttls = [ttl for _key, ttl in live]
 
-        grpc_port = 0
-        if raw_grpc_port:
-            try:
-                grpc_port = int(raw_grpc_port)
-            except ValueError:
-                grpc_port = 0
-
-        ttl = r.ttl(_k_worker_heartbeat(worker_id))
-        heartbeat_ttl_seconds = int(ttl) if ttl is not None and ttl > 0 else 0
-
-        workers.append(
-            WorkerInfo(
-                worker_id=worker_id,
-                node_id=node_id,
-                grpc_host=grpc_host,
-                grpc_port=grpc_port,
-                last_seen=last_seen,
-                heartbeat_ttl_seconds=heartbeat_ttl_seconds,
-                is_leader=(leader_worker_id == worker_id),
-                is_subleader=(subleader_worker_id == worker_id),
-            )
+    workers: list[WorkerInfo] = []
+    for data, ttl in zip(infos, ttls):
+        worker_id = _text(data.get(b"worker_id"))
+        w = _worker_info_from_fields(
+            worker_id=worker_id,
+            node_id=_text(data.get(b"node_id")),
+            grpc_host=_text(data.get(b"grpc_host")),
+            raw_grpc_port=data.get(b"grpc_port"),
+            raw_last_seen=data.get(b"last_seen"),
+            ttl=ttl if worker_id else None,
+            leader_worker_id=leader_worker_id,
+            subleader_worker_id=subleader_worker_id,
         )
-
+        if w is not None:
+            workers.append(w)
     workers.sort(key=lambda w: w.last_seen, reverse=True)
     return workers
 
 
+def list_workers(redis_url: str) -> list[WorkerInfo]:
+    r = _client(redis_url)
+    try:
+        workers = _list_workers_lua(r)
+    except redis.exceptions.ConnectionError:
+        raise
+    except Exception:
+        # e.g. scripting disabled / cluster mode: fall back to client-side SCAN.
+        workers = _list_workers_scan(r)
+    return workers
+
+
+_WORKERS_CACHE: dict[str, tuple[float, list[WorkerInfo]]] = {}
+_WORKERS_CACHE_LOCK = threading.Lock()
+
+
+def list_workers_cached(redis_url: str, *, max_age_seconds: float = 2.0) -> list[WorkerInfo]:
+    """list_workers() memoized per redis_url for a short TTL (shared within the process).
+
+    The returned list is shared; callers must not mutate it.
+    """
+    now = time.monotonic()
+    with _WORKERS_CACHE_LOCK:
+        hit = _WORKERS_CACHE.get(redis_url)
+    if hit is not None and (now - hit[0]) < max_age_seconds:
+        return hit[1]
+    workers = list_workers(redis_url)
+    with _WORKERS_CACHE_LOCK:
+        _WORKERS_CACHE[redis_url] = (now, workers)
+    return workers
+
+
+
+def publish_config_reload(redis_url: str, request_id: int) -> None:
+    r = _client(redis_url)
+    r.publish(config_reload_channel(), str(request_id))
+
+
+def publish_settings_changed(redis_url: str, key: str) -> None:
+    r = _client(redis_url)
+    r.publish(settings_changed_channel(), str(key))
+
+
+def publish_jobrun_ready(redis_url: str) -> None:
+    """Wake an idle leader after PENDING JobRuns were created outside the leader tick."""
+    r = _client(redis_url)
+    r.publish(jobrun_ready_channel(), "1")
+
+
+def run_notification_listener(
+    *,
+    redis_url: str,
+    wake_events: dict,
+    should_stop: Callable[[], bool],
+) -> None:
+    """Block on Redis pub/sub and set the threading.Event mapped to each channel.
+
+    Notifications are best-effort (pub/sub is fire-and-forget); callers keep a
+    slow fallback poll. After a connection error every event is set once so
+    the caller re-checks anything that may have been missed.
+    """
+    while not should_stop():
+        try:
+            r = redis.Redis.from_url(redis_url, decode_responses=True)
+            pubsub = r.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(*wake_events.keys())
+            try:
+                while not should_stop():
+                    msg = pubsub.get_message(timeout=1.0)
+                    if not msg or msg.get("type") != "message":
+                        continue
+                    ev = wake_events.get(msg.get("channel"))
+                    if ev is not None:
+                        ev.set()
+            finally:
+                pubsub.close()
+        except Exception:
+            for ev in wake_events.values():
+                ev.set()
+            time.sleep(1.0)
+
+
 @dataclass(frozen=True)
 class CoordinationSettings:
     heartbeat_ttl_seconds: int = 15
@@ -118,12 +375,51 @@ class TickStatus:
     cluster_epoch: int
 
 
-_LUA_RENEW_LOCK = """
+# Leader renewal that also returns what the tick reports: {renewed, epoch, subleader}.
+_LUA_RENEW_LEADER = """
 if redis.call('GET', KEYS[1]) == ARGV[1] then
-  return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+  redis.call('PEXPIRE', KEYS[1], ARGV[2])
+  return {1, redis.call('GET', KEYS[2]) or '', redis.call('GET', KEYS[3]) or ''}
 else
-  return 0
+  return {0, '', ''}
+end
+"""
+
+
+# Non-leader path in one step: keep/take the subleader lock, and if it is ours and no leader
+# holds the lock, promote (leader lock + epoch bump + subleader release).
+# Returns {role, epoch} with role in leader/subleader/none.
+_LUA_ACQUIRE = """
+local sub = redis.call('GET', KEYS[2])
+if sub == ARGV[1] then
+  redis.call('PEXPIRE', KEYS[2], ARGV[3])
+elseif not sub then
+  redis.call('SET', KEYS[2], ARGV[1], 'PX', ARGV[3])
+  sub = ARGV[1]
 end
+if sub ~= ARGV[1] then
+  return {'none', 0}
+end
+if redis.call('GET', KEYS[1]) then
+  return {'subleader', 0}
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+local epoch = redis.call('INCR', KEYS[3])
+redis.call('DEL', KEYS[2])
+return {'leader', epoch}
+"""
+
+
+# Heartbeat refresh as one atomic step: the heartbeat key and the info hash never expire apart,
+# and HSET + EXPIRE run inside the script, so the info hash is never observable without a TTL.
+# Also keeps the by_last_seen ZSET current and evicts members silent for 2x the heartbeat TTL.
+_LUA_HEARTBEAT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('HSET', KEYS[2], 'worker_id', ARGV[3], 'node_id', ARGV[4], 'grpc_host', ARGV[5], 'grpc_port', ARGV[6], 'last_seen', ARGV[1])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+redis.call('ZADD', KEYS[3], ARGV[1], ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', tonumber(ARGV[1]) - 2 * tonumber(ARGV[2]))
+return 1
 """
 
 
@@ -159,101 +455,147 @@ class RedisCoordinator:
 
         self._is_subleader = False
 
-        self._renew_lock = self._redis.register_script(_LUA_RENEW_LOCK)
-        self._release_lock = self._redis.register_script(_LUA_RELEASE_LOCK)
+        # Last full tick result, used by the fast path while cluster_version is unchanged.
+        self._last_status: Optional[TickStatus] = None
+        self._last_cluster_version: Optional[str] = None
+        self._last_full_tick_at = 0.0
+
+        self._renew_leader = partial(_script(self._redis, _LUA_RENEW_LEADER), client=self._redis)
+        self._release_lock = partial(_script(self._redis, _LUA_RELEASE_LOCK), client=self._redis)
+        self._heartbeat = partial(_script(self._redis, _LUA_HEARTBEAT), client=self._redis)
+        self._acquire = partial(_script(self._redis, _LUA_ACQUIRE), client=self._redis)
+
+        # worker_id / node / gRPC address are fixed for the process: build the heartbeat
+        # keys and the constant script arguments once instead of on every tick.
+        self._heartbeat_keys = [
+            _k_worker_heartbeat(worker_id),
+            _k_worker_info(worker_id),
+            _k_workers_by_last_seen(),
+        ]
+        self._heartbeat_static_args = [
+            str(settings.heartbeat_ttl_seconds),
+            worker_id,
+            node_id,
+            grpc_host,
+            str(grpc_port),
+        ]
+
+    def _write_heartbeat(self, pipe, *, now: float) -> None:
+        self._heartbeat(
+            keys=self._heartbeat_keys,
+            args=[str(now), *self._heartbeat_static_args],
+            client=pipe,
+        )
+
+    def _bump_cluster_version(self) -> None:
+        try:
+            self._redis.incr(_k_cluster_version())
+        except Exception:
+            pass
+
+    def _try_fast_tick(self, *, now: float) -> Optional[TickStatus]:
+        """Heartbeat-only tick when ownership has not changed since the last full tick.
+
+        SubLeader always takes the full path: it must notice an expired leader lock
+        (which does not bump cluster_version) to fail over promptly.
+        """
+        if self._last_status is None or self._is_subleader:
+            return None
+        if (now - self._last_full_tick_at) >= (self._settings.heartbeat_ttl_seconds / 3.0):
+            return None
+
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.get(_k_cluster_version())
+        self._write_heartbeat(pipe, now=now)
+        current_version = pipe.execute()[0]
+        if current_version != self._last_cluster_version:
+            return None
+
+        if self._is_leader:
+            renewed, _epoch, _subleader = self._renew_leader(
+                keys=[_k_leader_lock(), _k_leader_epoch(), _k_subleader_lock()],
+                args=[self._worker_id, str(self._settings.leader_lock_ttl_seconds * 1000)],
+            )
+            if int(renewed) <= 0:
+                return None
+        return self._last_status
 
     def tick(self, *, now: float) -> TickStatus:
-        # Heartbeat
-        self._redis.set(
-            _k_worker_heartbeat(self._worker_id),
-            str(now),
-            ex=self._settings.heartbeat_ttl_seconds,
-        )
-        self._redis.hset(
-            _k_worker_info(self._worker_id),
-            mapping={
-                "worker_id": self._worker_id,
-                "node_id": self._node_id,
-                "grpc_host": self._grpc_host,
-                "grpc_port": str(self._grpc_port),
-                "last_seen": str(now),
-            },
-        )
-        self._redis.expire(_k_worker_info(self._worker_id), self._settings.heartbeat_ttl_seconds)
+        fast = self._try_fast_tick(now=now)
+        if fast is not None:
+            return fast
+
+        was_leader = self._is_leader
+        was_subleader = self._is_subleader
 
         leader_lock_key = _k_leader_lock()
         subleader_lock_key = _k_subleader_lock()
 
-        # If this process restarted with the same worker_id, it may already own locks.
-        current_leader = self._redis.get(leader_lock_key)
+        # One round trip: version (read first so a concurrent change is seen next tick),
+        # heartbeat writes, and the leader lock/epoch the branches below decide on.
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.get(_k_cluster_version())
+        self._write_heartbeat(pipe, now=now)
+        pipe.get(leader_lock_key)
+        pipe.get(_k_leader_epoch())
+        res = pipe.execute()
+        cluster_version = res[0]
+        current_leader, raw_epoch = res[-2:]
+
+        # If this process restarted with the same worker_id, it may already own the leader lock.
+        # (An owned subleader lock is picked up by the acquire script below.)
         if not self._is_leader and current_leader == self._worker_id:
             self._is_leader = True
-            raw_epoch = self._redis.get(_k_leader_epoch())
             self._leader_epoch = int(raw_epoch) if raw_epoch else None
 
-        current_subleader = self._redis.get(subleader_lock_key)
-        if not self._is_leader and not self._is_subleader and current_subleader == self._worker_id:
-            self._is_subleader = True
-
         # Leader maintenance / acquisition
+        leader_view = None
         if self._is_leader:
-            renewed = int(
-                self._renew_lock(
-                    keys=[leader_lock_key],
-                    args=[self._worker_id, str(self._settings.leader_lock_ttl_seconds * 1000)],
-                )
+            renewed, renew_epoch, renew_subleader = self._renew_leader(
+                keys=[leader_lock_key, _k_leader_epoch(), subleader_lock_key],
+                args=[self._worker_id, str(self._settings.leader_lock_ttl_seconds * 1000)],
             )
-            if renewed <= 0:
+            if int(renewed) <= 0:
                 # Lost leadership
                 self._is_leader = False
                 self._leader_epoch = None
-        else:
-            # SubLeader maintenance / acquisition (only when not leader)
-            if self._is_subleader:
-                renewed = int(
-                    self._renew_lock(
-                        keys=[subleader_lock_key],
-                        args=[self._worker_id, str(self._settings.subleader_lock_ttl_seconds * 1000)],
-                    )
-                )
-                if renewed <= 0:
-                    self._is_subleader = False
             else:
-                acquired = self._redis.set(
-                    subleader_lock_key,
-                    self._worker_id,
-                    nx=True,
-                    ex=self._settings.subleader_lock_ttl_seconds,
-                )
-                if acquired:
-                    self._is_subleader = True
-
-            # Only SubLeader tries to acquire leadership aggressively.
-            if self._is_subleader and not current_leader:
-                acquired = self._redis.set(
-                    leader_lock_key,
+                leader_view = (self._worker_id, renew_subleader or None, renew_epoch)
+        else:
+            # SubLeader maintenance / acquisition, and promotion when the leader lock is free
+            # (only SubLeader tries to acquire leadership), in one atomic script call.
+            role, new_epoch = self._acquire(
+                keys=[leader_lock_key, subleader_lock_key, _k_leader_epoch()],
+                args=[
                     self._worker_id,
-                    nx=True,
-                    ex=self._settings.leader_lock_ttl_seconds,
-                )
-                if acquired:
-                    self._is_leader = True
-                    self._leader_epoch = int(self._redis.incr(_k_leader_epoch()))
-                    # Once promoted, release subleader role.
-                    self._is_subleader = False
-                    try:
-                        self._release_lock(keys=[subleader_lock_key], args=[self._worker_id])
-                    except Exception:
-                        pass
-
-        leader_worker_id = self._redis.get(leader_lock_key)
-        subleader_worker_id = self._redis.get(subleader_lock_key)
-        leader_epoch = self._leader_epoch if self._is_leader else None
+                    str(self._settings.leader_lock_ttl_seconds * 1000),
+                    str(self._settings.subleader_lock_ttl_seconds * 1000),
+                ],
+            )
+            if role == "leader":
+                self._is_leader = True
+                self._leader_epoch = int(new_epoch)
+                # Promotion released the subleader lock.
+                self._is_subleader = False
+            else:
+                self._is_subleader = role == "subleader"
 
-        raw_cluster_epoch = self._redis.get(_k_leader_epoch())
+        if leader_view is not None:
+            # A successful renewal already read the epoch and subleader atomically.
+            leader_worker_id, subleader_worker_id, raw_cluster_epoch = leader_view
+        else:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.get(leader_lock_key)
+            pipe.get(subleader_lock_key)
+            pipe.get(_k_leader_epoch())
+            leader_worker_id, subleader_worker_id, raw_cluster_epoch = pipe.execute()
+        leader_epoch = self._leader_epoch if self._is_leader else None
         cluster_epoch = int(raw_cluster_epoch) if raw_cluster_epoch else 0
 
-        return TickStatus(
+        if self._is_leader != was_leader or self._is_subleader != was_subleader:
+            self._bump_cluster_version()
+
+        status = TickStatus(
             is_leader=self._is_leader,
             is_subleader=self._is_subleader,
             leader_epoch=leader_epoch,
@@ -261,8 +603,13 @@ class RedisCoordinator:
             subleader_worker_id=subleader_worker_id,
             cluster_epoch=cluster_epoch,
         )
+        self._last_status = status
+        self._last_cluster_version = cluster_version
+        self._last_full_tick_at = now
+        return status
 
     def shutdown(self) -> None:
+        held_role = self._is_leader or self._is_subleader
         if self._is_leader:
             try:
                 self._release_lock(keys=[_k_leader_lock()], args=[self._worker_id])
@@ -275,3 +622,6 @@ class RedisCoordinator:
                 self._release_lock(keys=[_k_subleader_lock()], args=[self._worker_id])
             finally:
                 self._is_subleader = False
+
+        if held_role:
+            self._bump_cluster_version()
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from scheduler.conf import notify_settings_changed
+from scheduler.models import SchedulerSetting
+
+
+# Every ORM write of a SchedulerSetting (Ops UI, Django admin, shell, fixtures) invalidates the
+# fresh=True snapshots, so a revoked token stops being accepted as soon as the write commits.
+# QuerySet.update() sends no signal; call notify_settings_changed() after one.
+@receiver(post_save, sender=SchedulerSetting, dispatch_uid="scheduler_setting_saved")
+@receiver(post_delete, sender=SchedulerSetting, dispatch_uid="scheduler_setting_deleted")
+def _scheduler_setting_changed(sender, instance: SchedulerSetting, **kwargs) -> None:
+    key = str(instance.key or "")
+    transaction.on_commit(lambda: notify_settings_changed(key))
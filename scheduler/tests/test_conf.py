@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from scheduler import conf
+from scheduler.models import SchedulerSetting
+
+
+class FreshOverridesTests(SimpleTestCase):
+    def setUp(self):
+        conf._fresh_cache = None
+        conf._fresh_changed.clear()
+        patcher = mock.patch.object(conf, "_ensure_fresh_listener", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, conf, "_fresh_cache", None)
+
+    def test_failed_load_keeps_previous_snapshot_uncached(self):
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value={"A": 1}):
+            self.assertEqual(conf._get_fresh_overrides(), {"A": 1})
+        conf._fresh_changed.set()
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value=None):
+            self.assertEqual(conf._get_fresh_overrides(), {"A": 1})
+        self.assertTrue(conf._fresh_changed.is_set())
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value={"A": 2}):
+            self.assertEqual(conf._get_fresh_overrides(), {"A": 2})
+
+    def test_failed_first_load_is_not_cached(self):
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value=None):
+            self.assertEqual(conf._get_fresh_overrides(), {})
+        self.assertIsNone(conf._fresh_cache)
+
+    def test_snapshot_expires_after_max_age(self):
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value={"A": 1}):
+            conf._get_fresh_overrides()
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value={"A": 2}) as load:
+            self.assertEqual(conf._get_fresh_overrides(), {"A": 1})
+            load.assert_not_called()
+            later = time.monotonic() + conf._FRESH_MAX_AGE_NO_LISTENER_SECONDS + 1.0
+            with mock.patch.object(conf.time, "monotonic", return_value=later):
+                self.assertEqual(conf._get_fresh_overrides(), {"A": 2})
+
+    def test_notify_drops_snapshot(self):
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value={"A": 1}):
+            conf._get_fresh_overrides()
+        conf.notify_settings_changed("A")
+        with mock.patch.object(conf, "_load_settings_overrides_from_db", return_value={"A": 2}):
+            self.assertEqual(conf._get_fresh_overrides(), {"A": 2})
+
+
+@override_settings(SCHEDULER_REDIS_URL="")
+class SettingWriteInvalidationTests(TestCase):
+    """ORM writes outside the Ops views (admin, shell) must invalidate fresh reads too."""
+
+    key = "SCHEDULER_TEST_FRESH_TOKEN"
+
+    def setUp(self):
+        conf._fresh_cache = None
+        conf._fresh_changed.clear()
+        self.addCleanup(setattr, conf, "_fresh_cache", None)
+
+    def test_save_invalidates_fresh_snapshot(self):
+        SchedulerSetting.objects.create(key=self.key, value_json={"value": "old"})
+        self.assertEqual(conf._get_fresh_overrides().get(self.key), "old")
+
+        setting = SchedulerSetting.objects.get(key=self.key)
+        setting.value_json = {"value": "new"}
+        with self.captureOnCommitCallbacks(execute=True):
+            setting.save()
+
+        self.assertEqual(conf._get_fresh_overrides().get(self.key), "new")
+
+    def test_delete_invalidates_fresh_snapshot(self):
+        SchedulerSetting.objects.create(key=self.key, value_json={"value": "old"})
+        self.assertEqual(conf._get_fresh_overrides().get(self.key), "old")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SchedulerSetting.objects.filter(key=self.key).delete()
+
+        self.assertNotIn(self.key, conf._get_fresh_overrides())
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from unittest import mock, skipIf
+
+from django.test import SimpleTestCase
+
+try:
+    from scheduler.grpc import runtime
+except ImportError:  # pragma: no cover - grpc/protobuf not installed
+    runtime = None
+
+
+@skipIf(runtime is None, "grpc not installed")
+class StructExactTests(SimpleTestCase):
+    def test_int_boundary(self):
+        self.assertTrue(runtime._struct_exact({"n": 2**53}))
+        self.assertTrue(runtime._struct_exact({"n": -(2**53)}))
+        self.assertFalse(runtime._struct_exact({"n": 2**53 + 1}))
+        self.assertFalse(runtime._struct_exact({"n": -(2**53) - 1}))
+
+    def test_float_boundary(self):
+        self.assertTrue(runtime._struct_exact({"f": 1.5}))
+        self.assertFalse(runtime._struct_exact({"f": 1.0}))
+        self.assertFalse(runtime._struct_exact({"f": 0.0}))
+
+    def test_nested_and_non_numbers(self):
+        self.assertTrue(runtime._struct_exact({"a": [1, "x", None, True, {"b": -3}]}))
+        self.assertFalse(runtime._struct_exact({"a": [1, {"b": 2**60}]}))
+        self.assertFalse(runtime._struct_exact({1: "non-str key"}))
+
+
+@skipIf(runtime is None, "grpc not installed")
+class StartJobArgsEncodingTests(SimpleTestCase):
+    def _sent(self, args, **kwargs):
+        with mock.patch.object(runtime, "_call_worker") as call:
+            runtime.start_job_on_worker(
+                target="127.0.0.1:1",
+                leader_epoch=1,
+                job_run_id="1",
+                command_name="noop",
+                args=args,
+                timeout_seconds=0,
+                attempt=0,
+                tls_cert_file="",
+                tls_key_file="",
+                **kwargs,
+            )
+        stub = mock.Mock()
+        call.call_args.kwargs["invoke"](stub)
+        return stub.StartJob.call_args.args[0]
+
+    def test_exact_args_go_in_struct_only(self):
+        req = self._sent({"a": 1, "b": "x"})
+        self.assertEqual(req.args_json, "")
+        self.assertEqual(runtime._struct_value_to_python(runtime.json_format.MessageToDict(req.args)), {"a": 1, "b": "x"})
+
+    def test_inexact_args_go_in_args_json_only(self):
+        req = self._sent({"a": 2**60, "f": 1.0})
+        self.assertFalse(req.HasField("args"))
+        self.assertEqual(runtime.json.loads(req.args_json), {"a": 2**60, "f": 1.0})
+
+    def test_send_args_json_switch(self):
+        req = self._sent({"a": 1}, send_args_json=True)
+        self.assertFalse(req.HasField("args"))
+        self.assertEqual(req.args_json, '{"a": 1}')
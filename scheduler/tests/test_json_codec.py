@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from unittest import mock, skipIf
+
+from django.test import TestCase
+
+from scheduler import json_codec
+from scheduler.models import SchedulerSetting
+
+SAMPLE = {
+    "text": "ジョブ ✓",
+    "int": 2**63 - 1,
+    "neg": -42,
+    "float": 1.5,
+    "flags": [True, False, None],
+    "nested": {"list": [1, {"k": "v"}], "empty": {}},
+}
+
+
+class _CodecRoundTripMixin:
+    orjson_module = None
+
+    def setUp(self):
+        patcher = mock.patch.object(json_codec, "orjson", self.orjson_module)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_loads_dumps_round_trip(self):
+        self.assertEqual(json_codec.loads(json_codec.dumps_bytes(SAMPLE)), SAMPLE)
+        self.assertEqual(json_codec.loads(json_codec.dumps_bytes(SAMPLE).decode("utf-8")), SAMPLE)
+
+    def test_dumps_bytes_matches_stdlib_value(self):
+        self.assertEqual(json.loads(json_codec.dumps_bytes(SAMPLE)), SAMPLE)
+
+    def test_int_beyond_64_bits_falls_back(self):
+        big = {"n": 2**70}
+        self.assertEqual(json_codec.loads(json_codec.dumps_bytes(big)), big)
+        self.assertEqual(json.loads(json_codec.FastJSONEncoder().encode(big)), big)
+
+    def test_non_str_keys_and_default(self):
+        self.assertEqual(json_codec.loads(json_codec.dumps_bytes({1: "a"})), {"1": "a"})
+        self.assertEqual(
+            json_codec.loads(json_codec.dumps_bytes({"d": date(2026, 1, 2)}, default=lambda o: o.isoformat())),
+            {"d": "2026-01-02"},
+        )
+
+    def test_jsonfield_round_trip(self):
+        SchedulerSetting.objects.create(key="SCHEDULER_TEST_CODEC", value_json=SAMPLE)
+        self.assertEqual(SchedulerSetting.objects.get(key="SCHEDULER_TEST_CODEC").value_json, SAMPLE)
+
+
+class StdlibCodecTests(_CodecRoundTripMixin, TestCase):
+    orjson_module = None
+
+
+@skipIf(json_codec.orjson is None, "orjson not installed")
+class OrjsonCodecTests(_CodecRoundTripMixin, TestCase):
+    orjson_module = json_codec.orjson
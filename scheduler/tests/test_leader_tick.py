@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+from unittest import mock, skipUnless
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from scheduler.leader_tick import apply_reconcile_status, run_leader_tick_snapshot
+from scheduler.models import JobDefinition, JobRun
+from scheduler.redis_coordination import WorkerInfo
+
+
+def _worker(worker_id: str) -> WorkerInfo:
+    return WorkerInfo(
+        worker_id=worker_id,
+        node_id="n1",
+        grpc_host="127.0.0.1",
+        grpc_port=50051,
+        last_seen=0.0,
+        heartbeat_ttl_seconds=10,
+        is_leader=False,
+        is_subleader=False,
+    )
+
+
+def _tick(worker_ids: list[str]):
+    with mock.patch("scheduler.leader_tick.list_workers", return_value=[_worker(w) for w in worker_ids]):
+        return run_leader_tick_snapshot(
+            redis_url="redis://unused",
+            leader_epoch=7,
+            assign_ahead_seconds=60,
+            skip_late_runs_after_seconds=0,
+            reassign_assigned_after_seconds=10,
+            continuation_confirm_seconds=30,
+            assign_weight_leader=1,
+            assign_weight_subleader=2,
+            assign_weight_worker=3,
+            assign_running_load_weight=2,
+            rebalance_assigned_enabled=False,
+            rebalance_assigned_min_future_seconds=30,
+            rebalance_assigned_max_per_tick=50,
+            rebalance_assigned_cooldown_seconds=5,
+        )
+
+
+class ApplyReconcileStatusTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.job_def = JobDefinition.objects.create(
+            name="reconcile", type=JobDefinition.JobType.TIME, command_name="noop"
+        )
+
+    def _running(self, worker_id: str, minute: int, **fields) -> JobRun:
+        return JobRun.objects.create(
+            job_definition=self.job_def,
+            scheduled_for=self.now - timedelta(minutes=minute),
+            state=JobRun.State.RUNNING,
+            assigned_worker_id=worker_id,
+            started_at=self.now,
+            **fields,
+        )
+
+    def _apply(self, status_by_worker: dict[str, str]) -> None:
+        running = JobRun.objects.filter(state=JobRun.State.RUNNING).order_by("id")
+        apply_reconcile_status(running=running, status_by_worker=status_by_worker, confirm_seconds=30, now=self.now)
+
+    def test_unreported_runs_enter_confirming(self):
+        idle = self._running("w1", 1, error_summary="earlier")
+        other = self._running("w2", 2)
+        self._apply({"w1": "", "w2": "999999"})
+
+        idle.refresh_from_db()
+        other.refresh_from_db()
+        for jr in (idle, other):
+            self.assertEqual(jr.state, JobRun.State.RUNNING)
+            self.assertEqual(jr.continuation_state, JobRun.ContinuationState.CONFIRMING)
+            self.assertEqual(jr.continuation_check_deadline_at, self.now + timedelta(seconds=30))
+            self.assertEqual(jr.version, 1)
+        self.assertEqual(idle.error_summary, "earlier\nconfirming: worker reports no current job")
+        self.assertEqual(other.error_summary, "confirming: worker reports different job_run_id=999999")
+
+    def test_reported_and_unanswered_runs_are_untouched(self):
+        reported = self._running("w1", 1)
+        unanswered = self._running("w2", 2)
+        self._apply({"w1": str(reported.id)})
+
+        for jr in (reported, unanswered):
+            jr.refresh_from_db()
+            self.assertEqual(jr.continuation_state, JobRun.ContinuationState.NONE)
+            self.assertEqual(jr.version, 0)
+
+    def test_confirming_past_deadline_is_orphaned(self):
+        expired = self._running(
+            "w1",
+            1,
+            continuation_state=JobRun.ContinuationState.CONFIRMING,
+            continuation_check_deadline_at=self.now - timedelta(seconds=1),
+            attempt=2,
+        )
+        pending_deadline = self._running(
+            "w1",
+            2,
+            continuation_state=JobRun.ContinuationState.CONFIRMING,
+            continuation_check_deadline_at=self.now + timedelta(seconds=10),
+        )
+        self._apply({"w1": ""})
+
+        expired.refresh_from_db()
+        self.assertEqual(expired.state, JobRun.State.ORPHANED)
+        self.assertEqual(expired.assigned_worker_id, "")
+        self.assertIsNone(expired.started_at)
+        self.assertEqual(expired.continuation_state, JobRun.ContinuationState.NONE)
+        self.assertEqual(expired.attempt, 3)
+        self.assertEqual(expired.version, 1)
+        self.assertEqual(expired.error_summary, "orphaned: confirming deadline exceeded (worker status mismatch)")
+
+        pending_deadline.refresh_from_db()
+        self.assertEqual(pending_deadline.state, JobRun.State.RUNNING)
+        self.assertEqual(pending_deadline.version, 0)
+
+    def test_confirming_of_unanswered_worker_is_not_orphaned(self):
+        jr = self._running(
+            "w2",
+            1,
+            continuation_state=JobRun.ContinuationState.CONFIRMING,
+            continuation_check_deadline_at=self.now - timedelta(seconds=1),
+        )
+        self._apply({"w1": ""})
+
+        jr.refresh_from_db()
+        self.assertEqual(jr.state, JobRun.State.RUNNING)
+
+
+class LeaderTickAssignTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        # No schedule: the tick creates no runs of its own.
+        self.job_def = JobDefinition.objects.create(
+            name="assign", type=JobDefinition.JobType.TIME, command_name="noop", schedule={}
+        )
+
+    def _run(self, minute: int, state=JobRun.State.PENDING) -> JobRun:
+        return JobRun.objects.create(
+            job_definition=self.job_def, scheduled_for=self.now - timedelta(minutes=minute), state=state
+        )
+
+    def test_claimed_runs_are_assigned_with_one_update_per_worker(self):
+        runs = [self._run(m) for m in range(1, 5)] + [self._run(5, JobRun.State.ORPHANED)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            snap = _tick(["w1", "w2"])
+
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('UPDATE "scheduler_job_runs"')]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(snap.assigned_job_runs, 5)
+        self.assertEqual(snap.reassigned_job_runs, 1)
+
+        by_worker: dict[str, int] = {}
+        for jr in JobRun.objects.filter(id__in=[r.id for r in runs]):
+            self.assertEqual(jr.state, JobRun.State.ASSIGNED)
+            self.assertEqual(jr.leader_epoch, 7)
+            self.assertEqual(jr.version, 1)
+            self.assertIsNotNone(jr.assigned_at)
+            by_worker[jr.assigned_worker_id] = by_worker.get(jr.assigned_worker_id, 0) + 1
+        self.assertEqual(sorted(by_worker.values()), [2, 3])
+
+    def test_runs_outside_the_window_stay_pending(self):
+        future = JobRun.objects.create(
+            job_definition=self.job_def, scheduled_for=self.now + timedelta(hours=1), state=JobRun.State.PENDING
+        )
+        _tick(["w1"])
+
+        future.refresh_from_db()
+        self.assertEqual(future.state, JobRun.State.PENDING)
+        self.assertEqual(future.version, 0)
+
+
+@skipUnless(connection.vendor == "postgresql", "SKIP LOCKED needs PostgreSQL")
+class LeaderTickSkipLockedTests(TransactionTestCase):
+    def test_rows_locked_elsewhere_are_left_for_the_next_tick(self):
+        job_def = JobDefinition.objects.create(
+            name="skip locked", type=JobDefinition.JobType.TIME, command_name="noop", schedule={}
+        )
+        now = timezone.now()
+        locked = JobRun.objects.create(job_definition=job_def, scheduled_for=now - timedelta(minutes=2))
+        free = JobRun.objects.create(job_definition=job_def, scheduled_for=now - timedelta(minutes=1))
+
+        held = threading.Event()
+        release = threading.Event()
+
+        def _hold_lock():
+            from django.db import connection as thread_connection
+
+            try:
+                with transaction.atomic():
+                    list(JobRun.objects.select_for_update().filter(id=locked.id))
+                    held.set()
+                    release.wait(timeout=10)
+            finally:
+                thread_connection.close()
+
+        t = threading.Thread(target=_hold_lock)
+        t.start()
+        try:
+            self.assertTrue(held.wait(timeout=10))
+            snap = _tick(["w1"])
+        finally:
+            release.set()
+            t.join()
+
+        self.assertEqual(snap.assigned_job_runs, 1)
+        locked.refresh_from_db()
+        free.refresh_from_db()
+        self.assertEqual(locked.state, JobRun.State.PENDING)
+        self.assertEqual(free.state, JobRun.State.ASSIGNED)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest import skipIf
+
+from django.test import TestCase
+from django.utils import timezone
+
+from scheduler import metrics
+from scheduler.models import JobDefinition, JobRun
+
+try:
+    from prometheus_client import REGISTRY
+except Exception:  # pragma: no cover
+    REGISTRY = None
+
+
+@skipIf(metrics.METRICS.job_runs_finished_total is None, "prometheus_client not installed")
+class SyncMetricsFromDbTests(TestCase):
+    command_name = "test_metrics_sync_cmd"
+
+    def setUp(self):
+        metrics._DB_SYNC_CACHE.update({"ts": 0.0, "started_last_id": 0, "finished_last_id": 0, "running": {}})
+        metrics._JD_NAME_CACHE.clear()
+        self.job_def = JobDefinition.objects.create(
+            name="metrics sync", type=JobDefinition.JobType.TIME, command_name=self.command_name
+        )
+
+    def _sync(self) -> None:
+        metrics._DB_SYNC_CACHE["ts"] = 0.0  # bypass the 5s throttle
+        metrics._sync_metrics_from_db()
+
+    def _finished(self, result: str) -> float:
+        v = REGISTRY.get_sample_value(
+            "scheduler_job_runs_finished_total", {"command_name": self.command_name, "result": result}
+        )
+        return float(v or 0.0)
+
+    def test_run_finishing_after_a_sync_is_counted(self):
+        now = timezone.now()
+        run = JobRun.objects.create(
+            job_definition=self.job_def,
+            scheduled_for=now,
+            state=JobRun.State.RUNNING,
+            started_at=now,
+        )
+        self._sync()
+        before = self._finished("SUCCEEDED")
+
+        run.state = JobRun.State.SUCCEEDED
+        run.finished_at = now + timedelta(seconds=3)
+        run.save(update_fields=["state", "finished_at"])
+        self._sync()
+
+        self.assertEqual(self._finished("SUCCEEDED") - before, 1.0)
+
+    def test_cursors_advance_only_to_their_own_matches(self):
+        now = timezone.now()
+        running = JobRun.objects.create(
+            job_definition=self.job_def, scheduled_for=now, state=JobRun.State.RUNNING, started_at=now
+        )
+        self._sync()
+
+        self.assertEqual(metrics._DB_SYNC_CACHE["started_last_id"], running.id)
+        self.assertEqual(metrics._DB_SYNC_CACHE["finished_last_id"], 0)
@@ -21,13 +21,20 @@ _LEGACY_GROUP_NAMES = {
 }
 
 
+_GROUPS_ENSURED = False
+
+
 def ensure_ops_groups() -> None:
     """Ensure fixed Ops role groups exist.
 
     This is intentionally safe to call at startup; it no-ops if auth tables
-    are not ready yet.
+    are not ready yet. Once all groups exist, later calls in the process return
+    without touching the DB.
     """
 
+    global _GROUPS_ENSURED
+    if _GROUPS_ENSURED:
+        return
     try:
         from django.contrib.auth.models import Group
         from django.db.utils import OperationalError, ProgrammingError
@@ -39,28 +46,57 @@ def ensure_ops_groups() -> None:
                 return
     except Exception:
         return
+    _GROUPS_ENSURED = True
+
+
+def _group_names(user) -> frozenset[str]:
+    # One query per user object (i.e. per request for request.user); role checks and
+    # template filters then answer from the memoized set.
+    names = getattr(user, "_ops_group_names_cache", None)
+    if names is None:
+        names = frozenset(user.groups.values_list("name", flat=True))
+        user._ops_group_names_cache = names
+    return names
+
+
+# Role group name + its legacy aliases, as sets for a disjointness test against the user's groups.
+_ROLE_GROUP_CANDIDATES = {
+    role: frozenset([role, *_LEGACY_GROUP_NAMES.get(role, [])])
+    for role in (OPS_ROLES.APP_OPERATOR, OPS_ROLES.OPS_ADMIN, OPS_ROLES.SUPERUSER)
+}
 
 
-def _in_group(user, group_name: str) -> bool:
+def _in_group(names: frozenset[str], group_name: str) -> bool:
+    candidates = _ROLE_GROUP_CANDIDATES.get(group_name) or frozenset((group_name,))
+    return not candidates.isdisjoint(names)
+
+
+def _roles(user) -> frozenset[str]:
+    """Effective roles ("super" / "admin" / "app"); higher roles imply the lower ones.
+
+    Django superusers resolve from the attribute alone, without touching the DB.
+    """
     if not user or not getattr(user, "is_authenticated", False):
-        return False
-    names = [group_name] + list(_LEGACY_GROUP_NAMES.get(group_name, []))
-    return user.groups.filter(name__in=names).exists()
+        return frozenset()
+    if getattr(user, "is_superuser", False):
+        return frozenset(("super", "admin", "app"))
+    names = _group_names(user)
+    if _in_group(names, OPS_ROLES.SUPERUSER):
+        return frozenset(("super", "admin", "app"))
+    if _in_group(names, OPS_ROLES.OPS_ADMIN):
+        return frozenset(("admin", "app"))
+    if _in_group(names, OPS_ROLES.APP_OPERATOR):
+        return frozenset(("app",))
+    return frozenset()
 
 
 def is_superuser(user) -> bool:
-    if not user or not getattr(user, "is_authenticated", False):
-        return False
-    return bool(getattr(user, "is_superuser", False)) or _in_group(user, OPS_ROLES.SUPERUSER)
+    return "super" in _roles(user)
 
 
 def is_ops_admin(user) -> bool:
-    if not user or not getattr(user, "is_authenticated", False):
-        return False
-    return is_superuser(user) or _in_group(user, OPS_ROLES.OPS_ADMIN)
+    return "admin" in _roles(user)
 
 
 def is_app_operator(user) -> bool:
-    if not user or not getattr(user, "is_authenticated", False):
-        return False
-    return is_ops_admin(user) or _in_group(user, OPS_ROLES.APP_OPERATOR)
+    return "app" in _roles(user)
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import concurrent.futures
+import hmac
 import json
 import math
+import queue
+import random
 import smtplib
+import threading
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
 from datetime import timedelta
@@ -11,49 +17,104 @@ from email.message import EmailMessage
 from pathlib import Path
 from typing import Optional
 
+import urllib3
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import Group
 from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
-from django.db import IntegrityError, transaction
-from django.db.models import Count, Max, Sum
+from django.db import IntegrityError, close_old_connections, connections, transaction
+from django.db.models import Aggregate, BigIntegerField, Count, Exists, F, Max, OuterRef, Sum
 from django.db.models.functions import TruncMinute
 
 from scheduler.conf import (
     get_scheduler_config,
-    get_setting_with_source,
+    get_many_with_source,
     list_all_scheduler_setting_keys,
+    get_many_str,
     get_str,
 )
+from scheduler import json_codec
 from scheduler.help_seed import ensure_setting_help_rows
-from scheduler.redis_coordination import get_cluster_leadership, list_workers
+from scheduler.redis_coordination import (
+    get_cluster_leadership,
+    list_workers,
+    publish_config_reload,
+    publish_jobrun_ready,
+)
 from scheduler.models import AdminActionLog, ConfigReloadRequest, JobDefinition, JobRun, SchedulerSetting, SchedulerSettingHelp
 
 from scheduler_ops.roles import OPS_ROLES, ensure_ops_groups, is_app_operator, is_ops_admin, is_superuser
 
 
-_PROM_CACHE: dict[str, object] = {"ts": 0.0, "data": None}
+_PROM_CACHE: dict[str, object] = {"expires": 0.0, "data": None}
+_PROM_LOCK = threading.Lock()
 _HEALTH_CACHE: dict[str, object] = {"offline_since": None}
-_ALERTS_CACHE: dict[str, object] = {"ts": 0.0, "data": None}
+_ALERTS_CACHE: dict[str, object] = {"expires": 0.0, "data": None}
+_ALERTS_LOCK = threading.Lock()
+
+# Prometheus result caches: per-process TTL, jittered so gunicorn workers do not all
+# expire (and re-query Prometheus) on the same tick.
+_PROM_CACHE_TTL_SECONDS = 10.0
+_PROM_CACHE_TTL_JITTER_SECONDS = 2.0
+
+
+# Process-wide keep-alive pool (per host) for Prometheus / Slack / Teams calls.
+_HTTP = urllib3.PoolManager(maxsize=16, retries=False)
+
+
+def _http_request(method: str, url: str, *, timeout_seconds: float, body: Optional[bytes] = None, headers: Optional[dict] = None) -> bytes:
+    """Pooled HTTP call returning the body; non-2xx raises HTTPError like urlopen() did."""
+    resp = _HTTP.request(method, url, body=body, headers=headers or {}, timeout=float(timeout_seconds))
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, str(resp.reason or ""), resp.headers, None)
+    return resp.data
+
+
+_FALSY = frozenset({"", "0", "false", "no"})
+
+
+def _truthy(s) -> bool:
+    # Setting-string booleans: empty/0/false/no (any case) are false, anything else true.
+    return str(s or "").strip().lower() not in _FALSY
 
 
 def _sanitize_json_numbers(obj):
-    """Convert non-finite floats (NaN/Inf) into None so responses are valid JSON."""
+    """Convert non-finite floats (NaN/Inf) into None so responses are valid JSON.
+
+    Dicts and lists are fixed in place (one iterative walk, nothing rebuilt);
+    tuples become lists. Returns obj (or the replacement for a top-level scalar/tuple).
+    """
     if isinstance(obj, float):
         return obj if math.isfinite(obj) else None
-    if isinstance(obj, dict):
-        return {k: _sanitize_json_numbers(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_sanitize_json_numbers(v) for v in obj]
     if isinstance(obj, tuple):
-        return [_sanitize_json_numbers(v) for v in obj]
+        obj = list(obj)
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            keys = node.keys()
+        elif isinstance(node, list):
+            keys = range(len(node))
+        else:
+            continue
+        for k in keys:
+            v = node[k]
+            if isinstance(v, float):
+                if not math.isfinite(v):
+                    node[k] = None
+            elif isinstance(v, tuple):
+                v = node[k] = list(v)
+                stack.append(v)
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
     return obj
 
 
@@ -61,15 +122,38 @@ def _prometheus_base_url() -> str:
     return get_str(key="SCHEDULER_PROMETHEUS_URL", default="", fresh=True).strip().rstrip("/")
 
 
+# Dashboard summary expressions, and the recording-rule series that precompute them
+# (group scheduler_recording in dev-prometheus/rules.yml). The recorded names are only
+# queried when SCHEDULER_PROMETHEUS_RECORDING_RULES is on, i.e. the rules are loaded.
+_PROM_SUMMARY_EXPRS = {
+    "finished_5m": "sum(increase(scheduler_job_runs_finished_total[5m])) by (result)",
+    "p95_5m": "histogram_quantile(0.95, sum(rate(scheduler_job_run_duration_seconds_bucket[5m])) by (le))",
+    "cpu_cores_5m": "sum(rate(scheduler_job_run_cpu_seconds_total[5m]))",
+    "io_read_bps_5m": "sum(rate(scheduler_job_run_io_read_bytes_total[5m]))",
+    "io_write_bps_5m": "sum(rate(scheduler_job_run_io_write_bytes_total[5m]))",
+    "mem_p95_5m": "histogram_quantile(0.95, sum(rate(scheduler_job_run_peak_rss_bytes_bucket[5m])) by (le))",
+}
+_PROM_SUMMARY_RECORDED = {
+    "finished_5m": "scheduler:job_runs_finished:increase5m",
+    "p95_5m": "scheduler:job_run_duration_seconds:p95_5m",
+    "cpu_cores_5m": "scheduler:job_run_cpu_seconds:rate5m",
+    "io_read_bps_5m": "scheduler:job_run_io_read_bytes:rate5m",
+    "io_write_bps_5m": "scheduler:job_run_io_write_bytes:rate5m",
+    "mem_p95_5m": "scheduler:job_run_peak_rss_bytes:p95_5m",
+}
+
+
+def _prometheus_recording_rules_enabled() -> bool:
+    return _truthy(get_str(key="SCHEDULER_PROMETHEUS_RECORDING_RULES", default="0", fresh=True))
+
+
 def _prometheus_query(*, base_url: str, query: str, timeout_seconds: float = 2.0) -> tuple[Optional[object], Optional[str]]:
     if not base_url:
         return None, "not configured"
     try:
         url = f"{base_url}/api/v1/query?{urllib.parse.urlencode({'query': query})}"
-        req = urllib.request.Request(url, headers={"Accept": "application/json"}, method="GET")
-        with urllib.request.urlopen(req, timeout=float(timeout_seconds)) as resp:
-            raw = resp.read()
-        payload = json.loads(raw.decode("utf-8"))
+        raw = _http_request("GET", url, headers={"Accept": "application/json"}, timeout_seconds=timeout_seconds)
+        payload = json_codec.loads(raw)
         if payload.get("status") != "success":
             return None, "query failed"
         data = payload.get("data") or {}
@@ -97,10 +181,8 @@ def _prometheus_query_range(
             "step": str(int(step_seconds)),
         }
         url = f"{base_url}/api/v1/query_range?{urllib.parse.urlencode(params)}"
-        req = urllib.request.Request(url, headers={"Accept": "application/json"}, method="GET")
-        with urllib.request.urlopen(req, timeout=float(timeout_seconds)) as resp:
-            raw = resp.read()
-        payload = json.loads(raw.decode("utf-8"))
+        raw = _http_request("GET", url, headers={"Accept": "application/json"}, timeout_seconds=timeout_seconds)
+        payload = json_codec.loads(raw)
         if payload.get("status") != "success":
             return None, "query failed"
         data = payload.get("data") or {}
@@ -109,131 +191,172 @@ def _prometheus_query_range(
         return None, f"{type(e).__name__}"
 
 
+def _cached_fetch(cache: dict[str, object], lock: threading.Lock, fetch) -> dict:
+    """Return cache["data"], refreshing it via fetch() at most once at a time.
+
+    While one thread refreshes an expired entry, the others keep returning the
+    previous (stale) result; only a cold cache makes callers wait for the refresh.
+    """
+    cached = cache.get("data")
+    if cached is not None and time.time() < float(cache.get("expires") or 0.0):  # type: ignore[arg-type]
+        return cached  # type: ignore[return-value]
+    if cached is not None:
+        if not lock.acquire(blocking=False):
+            return cached  # type: ignore[return-value]
+    else:
+        lock.acquire()
+    try:
+        cached = cache.get("data")
+        if cached is not None and time.time() < float(cache.get("expires") or 0.0):  # type: ignore[arg-type]
+            return cached  # type: ignore[return-value]
+        # fetch() returns sanitized data; hits return it as-is.
+        out = fetch()
+        ttl = _PROM_CACHE_TTL_SECONDS + random.uniform(-_PROM_CACHE_TTL_JITTER_SECONDS, _PROM_CACHE_TTL_JITTER_SECONDS)
+        cache["data"] = out
+        cache["expires"] = time.time() + ttl
+        return out
+    finally:
+        lock.release()
+
+
+def _finite_float(v) -> Optional[float]:
+    try:
+        x = float(v)
+        if not math.isfinite(x):
+            return None
+        return x
+    except Exception:
+        return None
+
+
+def _first_float(result) -> Optional[float]:
+    # Value of the first sample of an instant-query result.
+    try:
+        if not result:
+            return None
+        v = result[0].get("value")
+        if not v or len(v) < 2:
+            return None
+        return _finite_float(v[1])
+    except Exception:
+        return None
+
+
+def _finished_by_result(result) -> dict[str, float]:
+    # {result label: value} for an instant query grouped "by (result)".
+    finished: dict[str, float] = {}
+    if not isinstance(result, list):
+        return finished
+    try:
+        for row in result:
+            if not isinstance(row, dict):
+                continue
+            metric = row.get("metric") or {}
+            if not isinstance(metric, dict):
+                metric = {}
+            result_label = str(metric.get("result") or "")
+            v = row.get("value")
+            if result_label and v and len(v) >= 2:
+                fv = _finite_float(v[1])
+                if fv is not None:
+                    finished[result_label] = fv
+    except Exception:
+        return {}
+    return finished
+
+
+def _series_to_points(result) -> list[list[float]]:
+    # Returns [[unix_ms, value], ...] for the first series of a range-query result.
+    try:
+        if not result:
+            return []
+        first = result[0]
+        if not isinstance(first, dict):
+            return []
+        values = first.get("values")
+        if not isinstance(values, list):
+            return []
+        finite = _finite_float
+        return [
+            [float(pair[0]) * 1000.0, fv]
+            for pair in values
+            if pair and len(pair) >= 2 and (fv := finite(pair[1])) is not None
+        ]
+    except Exception:
+        return []
+
+
 def _prometheus_summary_cached() -> dict:
     base = _prometheus_base_url()
     if not base:
         return {"enabled": False}
+    return _cached_fetch(_PROM_CACHE, _PROM_LOCK, lambda: _prometheus_summary_fetch(base))
 
-    now = time.time()
-    ts_val = _PROM_CACHE.get("ts")
-    last_ts = float(ts_val) if isinstance(ts_val, (int, float)) else 0.0
-    cached = _PROM_CACHE.get("data")
-    if cached is not None and (now - last_ts) < 5.0:
-        sanitized = _sanitize_json_numbers(cached)
-        if sanitized is not cached:
-            _PROM_CACHE["data"] = sanitized
-        return sanitized  # type: ignore[return-value]
 
+def _prometheus_summary_fetch(base: str) -> dict:
     # Queries (keep minimal; avoid expensive per-command breakdown for MVP)
     q_running = "sum(scheduler_worker_current_job_run)"
-    q_finished_5m = "sum(increase(scheduler_job_runs_finished_total[5m])) by (result)"
-    q_p95_5m = "histogram_quantile(0.95, sum(rate(scheduler_job_run_duration_seconds_bucket[5m])) by (le))"
+    q = _PROM_SUMMARY_RECORDED if _prometheus_recording_rules_enabled() else _PROM_SUMMARY_EXPRS
+    q_finished_5m = q["finished_5m"]
+    q_p95_5m = q["p95_5m"]
 
     # Overall load (derived from per-job resource metrics recorded at completion)
-    q_cpu_cores_5m = "sum(rate(scheduler_job_run_cpu_seconds_total[5m]))"
-    q_io_read_bps_5m = "sum(rate(scheduler_job_run_io_read_bytes_total[5m]))"
-    q_io_write_bps_5m = "sum(rate(scheduler_job_run_io_write_bytes_total[5m]))"
-    q_mem_p95_5m = "histogram_quantile(0.95, sum(rate(scheduler_job_run_peak_rss_bytes_bucket[5m])) by (le))"
-
-    running_res, err1 = _prometheus_query(base_url=base, query=q_running)
-    finished_res, err2 = _prometheus_query(base_url=base, query=q_finished_5m)
-    p95_res, err3 = _prometheus_query(base_url=base, query=q_p95_5m)
-
-    cpu_res, err4 = _prometheus_query(base_url=base, query=q_cpu_cores_5m)
-    io_r_res, err5 = _prometheus_query(base_url=base, query=q_io_read_bps_5m)
-    io_w_res, err6 = _prometheus_query(base_url=base, query=q_io_write_bps_5m)
-    mem_p95_res, err7 = _prometheus_query(base_url=base, query=q_mem_p95_5m)
+    q_cpu_cores_5m = q["cpu_cores_5m"]
+    q_io_read_bps_5m = q["io_read_bps_5m"]
+    q_io_write_bps_5m = q["io_write_bps_5m"]
+    q_mem_p95_5m = q["mem_p95_5m"]
 
     # Small sparklines (last 30 minutes, 60s step)
     end_unix = time.time()
     start_unix = end_unix - (30 * 60)
-    cpu_series_res, err8 = _prometheus_query_range(
-        base_url=base,
-        query=q_cpu_cores_5m,
-        start_unix=start_unix,
-        end_unix=end_unix,
-        step_seconds=60,
-    )
-    mem_series_res, err9 = _prometheus_query_range(
-        base_url=base,
-        query=q_mem_p95_5m,
-        start_unix=start_unix,
-        end_unix=end_unix,
-        step_seconds=60,
-    )
-
-    err = err1 or err2 or err3 or err4 or err5 or err6 or err7 or err8 or err9
 
-    def _finite_float(v) -> Optional[float]:
-        try:
-            x = float(v)
-            if not math.isfinite(x):
-                return None
-            return x
-        except Exception:
-            return None
+    # The nine queries are independent: issue them concurrently so a cache miss costs
+    # about one Prometheus round trip instead of nine sequential ones.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=9) as ex:
+        instant = [
+            ex.submit(_prometheus_query, base_url=base, query=q)
+            for q in (
+                q_running,
+                q_finished_5m,
+                q_p95_5m,
+                q_cpu_cores_5m,
+                q_io_read_bps_5m,
+                q_io_write_bps_5m,
+                q_mem_p95_5m,
+            )
+        ]
+        ranged = [
+            ex.submit(
+                _prometheus_query_range,
+                base_url=base,
+                query=q,
+                start_unix=start_unix,
+                end_unix=end_unix,
+                step_seconds=60,
+            )
+            for q in (q_cpu_cores_5m, q_mem_p95_5m)
+        ]
+        (
+            (running_res, err1),
+            (finished_res, err2),
+            (p95_res, err3),
+            (cpu_res, err4),
+            (io_r_res, err5),
+            (io_w_res, err6),
+            (mem_p95_res, err7),
+        ) = [f.result() for f in instant]
+        (cpu_series_res, err8), (mem_series_res, err9) = [f.result() for f in ranged]
 
-    def _first_float(result) -> Optional[float]:
-        try:
-            if not result:
-                return None
-            v = result[0].get("value")
-            if not v or len(v) < 2:
-                return None
-            return _finite_float(v[1])
-        except Exception:
-            return None
+    err = err1 or err2 or err3 or err4 or err5 or err6 or err7 or err8 or err9
 
     running = _first_float(running_res)
     cpu_cores = _first_float(cpu_res)
     io_read_bps = _first_float(io_r_res)
     io_write_bps = _first_float(io_w_res)
     mem_p95_bytes = _first_float(mem_p95_res)
-
-    finished: dict[str, float] = {}
-    try:
-        if isinstance(finished_res, list):
-            for row in finished_res:
-                if not isinstance(row, dict):
-                    continue
-                metric = row.get("metric") or {}
-                if not isinstance(metric, dict):
-                    metric = {}
-                result_label = str(metric.get("result") or "")
-                v = row.get("value")
-                if result_label and v and len(v) >= 2:
-                    fv = _finite_float(v[1])
-                    if fv is not None:
-                        finished[result_label] = fv
-    except Exception:
-        finished = {}
-
+    finished = _finished_by_result(finished_res)
     p95 = _first_float(p95_res)
 
-    def _series_to_points(result) -> list[list[float]]:
-        # Returns [[unix_ms, value], ...] for the first series.
-        try:
-            if not result:
-                return []
-            first = result[0]
-            if not isinstance(first, dict):
-                return []
-            values = first.get("values")
-            if not isinstance(values, list):
-                return []
-            out: list[list[float]] = []
-            for pair in values:
-                if not pair or len(pair) < 2:
-                    continue
-                ts_s = float(pair[0])
-                fv = _finite_float(pair[1])
-                if fv is None:
-                    continue
-                out.append([ts_s * 1000.0, fv])
-            return out
-        except Exception:
-            return []
-
     out = {
         "enabled": True,
         "ok": err is None,
@@ -252,35 +375,23 @@ def _prometheus_summary_cached() -> dict:
             "mem_p95_bytes_5m": _series_to_points(mem_series_res),
         },
     }
-    out = _sanitize_json_numbers(out)
-    _PROM_CACHE["ts"] = now
-    _PROM_CACHE["data"] = out
-    return out
+    return _sanitize_json_numbers(out)
 
 
 def _prometheus_alerts_cached() -> dict:
     base = _prometheus_base_url()
     if not base:
         return {"enabled": False}
+    return _cached_fetch(_ALERTS_CACHE, _ALERTS_LOCK, lambda: _prometheus_alerts_fetch(base))
 
-    now = time.time()
-    ts_val = _ALERTS_CACHE.get("ts")
-    last_ts = float(ts_val) if isinstance(ts_val, (int, float)) else 0.0
-    cached = _ALERTS_CACHE.get("data")
-    if cached is not None and (now - last_ts) < 5.0:
-        sanitized = _sanitize_json_numbers(cached)
-        if sanitized is not cached:
-            _ALERTS_CACHE["data"] = sanitized
-        return sanitized  # type: ignore[return-value]
 
+def _prometheus_alerts_fetch(base: str) -> dict:
     err: Optional[str] = None
     alerts_out: list[dict] = []
     try:
         url = f"{base}/api/v1/alerts"
-        req = urllib.request.Request(url, headers={"Accept": "application/json"}, method="GET")
-        with urllib.request.urlopen(req, timeout=2.0) as resp:
-            raw = resp.read()
-        payload = json.loads(raw.decode("utf-8"))
+        raw = _http_request("GET", url, headers={"Accept": "application/json"}, timeout_seconds=2.0)
+        payload = json_codec.loads(raw)
         if payload.get("status") != "success":
             err = "alerts query failed"
         else:
@@ -314,10 +425,7 @@ def _prometheus_alerts_cached() -> dict:
         "error": None if err is None else str(err),
         "alerts": alerts_out,
     }
-    out = _sanitize_json_numbers(out)
-    _ALERTS_CACHE["ts"] = now
-    _ALERTS_CACHE["data"] = out
-    return out
+    return _sanitize_json_numbers(out)
 
 
 def _require_app_operator(view_func):
@@ -350,21 +458,60 @@ def _require_superuser(view_func):
     return _wrapped
 
 
-def _ops_group_names() -> list[str]:
-    return [OPS_ROLES.APP_OPERATOR, OPS_ROLES.OPS_ADMIN, OPS_ROLES.SUPERUSER]
+_OPS_GROUP_NAMES = (OPS_ROLES.APP_OPERATOR, OPS_ROLES.OPS_ADMIN, OPS_ROLES.SUPERUSER)
+_OPS_GROUPS_CACHE: dict[str, Group] = {}
+
+
+def _cached_ops_groups() -> dict[str, Group]:
+    """{name: Group} for the fixed Ops role groups, loaded once per process.
+
+    The groups are created by ensure_ops_groups() and never renamed; an incomplete
+    map (groups not created yet) is re-read on the next call.
+    """
+    global _OPS_GROUPS_CACHE
+    if len(_OPS_GROUPS_CACHE) < len(_OPS_GROUP_NAMES):
+        _OPS_GROUPS_CACHE = {g.name: g for g in Group.objects.filter(name__in=_OPS_GROUP_NAMES)}
+    return _OPS_GROUPS_CACHE
+
+
+# Annotation name -> ops group, for _with_ops_role_flags / _user_payload.
+_OPS_ROLE_FLAGS = {
+    "ops_role_app_operator": OPS_ROLES.APP_OPERATOR,
+    "ops_role_ops_admin": OPS_ROLES.OPS_ADMIN,
+    "ops_role_superuser": OPS_ROLES.SUPERUSER,
+}
+
+
+def _with_ops_role_flags(qs):
+    """Annotate one boolean per ops group (EXISTS subqueries) so listing users needs no group fetch."""
+    model = qs.model
+    return qs.annotate(
+        **{
+            attr: Exists(model.objects.filter(pk=OuterRef("pk"), groups__name=name))
+            for attr, name in _OPS_ROLE_FLAGS.items()
+        }
+    )
 
 
 def _user_payload(u) -> dict:
-    groups = set(u.groups.values_list("name", flat=True))
+    if hasattr(u, "ops_role_app_operator"):
+        app_operator = bool(u.ops_role_app_operator)
+        ops_admin = bool(u.ops_role_ops_admin)
+        superuser = bool(u.ops_role_superuser)
+    else:
+        groups = set(u.groups.values_list("name", flat=True))
+        app_operator = OPS_ROLES.APP_OPERATOR in groups
+        ops_admin = OPS_ROLES.OPS_ADMIN in groups
+        superuser = OPS_ROLES.SUPERUSER in groups
     return {
         "id": u.id,
         "username": u.username,
         "is_active": bool(u.is_active),
         "last_login": u.last_login.isoformat() if u.last_login else None,
         "ops_roles": {
-            "app_operator": OPS_ROLES.APP_OPERATOR in groups,
-            "ops_admin": OPS_ROLES.OPS_ADMIN in groups,
-            "superuser": OPS_ROLES.SUPERUSER in groups,
+            "app_operator": app_operator,
+            "ops_admin": ops_admin,
+            "superuser": superuser,
         },
     }
 
@@ -376,18 +523,27 @@ def index(request):
     leadership = get_cluster_leadership(cfg.redis_url)
     workers_list = list_workers(cfg.redis_url)
     active_workers = sum(1 for w in workers_list if w.heartbeat_ttl_seconds > 0)
-    min_online_workers = get_str(key="SCHEDULER_MIN_ONLINE_WORKERS", default="1", fresh=True).strip() or "1"
-
-    high_load_threshold = get_str(key="SCHEDULER_WORKER_HIGH_LOAD_THRESHOLD", default="10", fresh=True).strip() or "10"
-    high_load_enabled = get_str(key="SCHEDULER_ALERT_HIGH_LOAD_ENABLED", default="1", fresh=True).strip()
-    role_change_enabled = get_str(key="SCHEDULER_ALERT_ROLE_CHANGE_ENABLED", default="1", fresh=True).strip()
+    conf = get_many_str(
+        defaults={
+            "SCHEDULER_MIN_ONLINE_WORKERS": "1",
+            "SCHEDULER_WORKER_HIGH_LOAD_THRESHOLD": "10",
+            "SCHEDULER_ALERT_HIGH_LOAD_ENABLED": "1",
+            "SCHEDULER_ALERT_ROLE_CHANGE_ENABLED": "1",
+            "SCHEDULER_NOTIFY_SLACK_WEBHOOK_URL": "",
+            "SCHEDULER_NOTIFY_TEAMS_WEBHOOK_URL": "",
+            "SCHEDULER_NOTIFY_EMAIL_TO": "",
+        },
+        fresh=True,
+    )
+    min_online_workers = conf["SCHEDULER_MIN_ONLINE_WORKERS"].strip() or "1"
 
-    slack_url = get_str(key="SCHEDULER_NOTIFY_SLACK_WEBHOOK_URL", default="", fresh=True).strip()
-    teams_url = get_str(key="SCHEDULER_NOTIFY_TEAMS_WEBHOOK_URL", default="", fresh=True).strip()
-    email_to = get_str(key="SCHEDULER_NOTIFY_EMAIL_TO", default="", fresh=True).strip()
+    high_load_threshold = conf["SCHEDULER_WORKER_HIGH_LOAD_THRESHOLD"].strip() or "10"
+    high_load_enabled = conf["SCHEDULER_ALERT_HIGH_LOAD_ENABLED"].strip()
+    role_change_enabled = conf["SCHEDULER_ALERT_ROLE_CHANGE_ENABLED"].strip()
 
-    def _truthy(s: str) -> bool:
-        return str(s or "").strip().lower() not in {"", "0", "false", "no"}
+    slack_url = conf["SCHEDULER_NOTIFY_SLACK_WEBHOOK_URL"].strip()
+    teams_url = conf["SCHEDULER_NOTIFY_TEAMS_WEBHOOK_URL"].strip()
+    email_to = conf["SCHEDULER_NOTIFY_EMAIL_TO"].strip()
 
     return render(
         request,
@@ -411,15 +567,14 @@ def _send_slack(*, webhook_url: str, text: str) -> Optional[str]:
     if not webhook_url:
         return None
     try:
-        payload = json.dumps({"text": text}, ensure_ascii=False).encode("utf-8")
-        req = urllib.request.Request(
+        payload = json_codec.dumps_bytes({"text": text})
+        _http_request(
+            "POST",
             webhook_url,
-            data=payload,
+            body=payload,
             headers={"Content-Type": "application/json"},
-            method="POST",
+            timeout_seconds=3.0,
         )
-        with urllib.request.urlopen(req, timeout=3.0) as resp:
-            _ = resp.read(1)
         return None
     except Exception as e:
         return type(e).__name__
@@ -436,72 +591,181 @@ def _send_teams(*, webhook_url: str, text: str) -> Optional[str]:
             "title": "Scheduler Alert",
             "text": text,
         }
-        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-        req = urllib.request.Request(
+        raw = json_codec.dumps_bytes(payload)
+        _http_request(
+            "POST",
             webhook_url,
-            data=raw,
+            body=raw,
             headers={"Content-Type": "application/json"},
-            method="POST",
+            timeout_seconds=3.0,
         )
-        with urllib.request.urlopen(req, timeout=3.0) as resp:
-            _ = resp.read(1)
         return None
     except Exception as e:
         return type(e).__name__
 
 
-def _send_email(*, subject: str, body: str) -> Optional[str]:
-    to_raw = get_str(key="SCHEDULER_NOTIFY_EMAIL_TO", default="", fresh=True).strip()
+_EMAIL_SETTING_DEFAULTS = {
+    "SCHEDULER_NOTIFY_EMAIL_TO": "",
+    "SCHEDULER_NOTIFY_SMTP_HOST": "",
+    "SCHEDULER_NOTIFY_SMTP_PORT": "587",
+    "SCHEDULER_NOTIFY_SMTP_USER": "",
+    "SCHEDULER_NOTIFY_SMTP_PASSWORD": "",
+    "SCHEDULER_NOTIFY_EMAIL_FROM": "",
+    "SCHEDULER_NOTIFY_SMTP_USE_TLS": "1",
+}
+
+
+# One SMTP session per process, reused across alerts (EHLO/STARTTLS/AUTH once).
+# Re-opened when the SMTP settings change or the server has dropped it.
+_SMTP_LOCK = threading.Lock()
+_SMTP_CONN: dict[str, object] = {"key": None, "conn": None}
+
+
+def _smtp_close_locked() -> None:
+    conn = _SMTP_CONN.get("conn")
+    _SMTP_CONN["key"] = None
+    _SMTP_CONN["conn"] = None
+    if conn is not None:
+        try:
+            conn.quit()  # type: ignore[union-attr]
+        except Exception:
+            try:
+                conn.close()  # type: ignore[union-attr]
+            except Exception:
+                pass
+
+
+def _smtp_open(
+    *, host: str, port: int, user: str, password: str, use_tls: bool
+) -> tuple[Optional[smtplib.SMTP], Optional[str]]:
+    s = smtplib.SMTP(host=host, port=port, timeout=5)
+    try:
+        s.ehlo()
+        if use_tls:
+            try:
+                s.starttls()
+                s.ehlo()
+            except Exception as e:
+                s.close()
+                return None, f"starttls failed: {type(e).__name__}"
+
+        if user:
+            try:
+                s.login(user, password)
+            except Exception as e:
+                s.close()
+                return None, f"smtp auth failed: {type(e).__name__}"
+    except Exception:
+        s.close()
+        raise
+    return s, None
+
+
+def _send_email(*, conf: dict[str, str], subject: str, body: str) -> Optional[str]:
+    """Send via SMTP using settings already resolved by the caller (no DB access here)."""
+    to_raw = conf["SCHEDULER_NOTIFY_EMAIL_TO"].strip()
     if not to_raw:
         return None
 
-    host = get_str(key="SCHEDULER_NOTIFY_SMTP_HOST", default="", fresh=True).strip()
+    host = conf["SCHEDULER_NOTIFY_SMTP_HOST"].strip()
     if not host:
         return "smtp not configured"
 
-    port_raw = get_str(key="SCHEDULER_NOTIFY_SMTP_PORT", default="587", fresh=True).strip() or "587"
+    port_raw = conf["SCHEDULER_NOTIFY_SMTP_PORT"].strip() or "587"
     try:
         port = int(port_raw)
     except Exception:
         port = 587
 
-    user = get_str(key="SCHEDULER_NOTIFY_SMTP_USER", default="", fresh=True).strip()
-    password = get_str(key="SCHEDULER_NOTIFY_SMTP_PASSWORD", default="", fresh=True)
-    from_addr = get_str(key="SCHEDULER_NOTIFY_EMAIL_FROM", default="", fresh=True).strip() or user or "scheduler@localhost"
-    use_tls_raw = get_str(key="SCHEDULER_NOTIFY_SMTP_USE_TLS", default="1", fresh=True).strip()
-    use_tls = str(use_tls_raw).lower() not in {"", "0", "false", "no"}
+    user = conf["SCHEDULER_NOTIFY_SMTP_USER"].strip()
+    password = conf["SCHEDULER_NOTIFY_SMTP_PASSWORD"]
+    from_addr = conf["SCHEDULER_NOTIFY_EMAIL_FROM"].strip() or user or "scheduler@localhost"
+    use_tls = _truthy(conf["SCHEDULER_NOTIFY_SMTP_USE_TLS"])
 
     to_addrs = [a.strip() for a in to_raw.split(",") if a.strip()]
     if not to_addrs:
         return None
 
-    try:
-        msg = EmailMessage()
-        msg["Subject"] = subject
-        msg["From"] = from_addr
-        msg["To"] = ", ".join(to_addrs)
-        msg.set_content(body)
-
-        with smtplib.SMTP(host=host, port=port, timeout=5) as s:
-            s.ehlo()
-            if use_tls:
-                try:
-                    s.starttls()
-                    s.ehlo()
-                except Exception as e:
-                    return f"starttls failed: {type(e).__name__}"
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = from_addr
+    msg["To"] = ", ".join(to_addrs)
+    msg.set_content(body)
 
-            if user:
+    conn_key = (host, port, user, password, use_tls)
+    with _SMTP_LOCK:
+        try:
+            for _ in range(2):
+                conn = _SMTP_CONN.get("conn") if _SMTP_CONN.get("key") == conn_key else None
+                if conn is not None:
+                    try:
+                        if conn.noop()[0] != 250:  # type: ignore[union-attr]
+                            conn = None
+                    except Exception:
+                        conn = None
+                if conn is None:
+                    _smtp_close_locked()
+                    conn, err = _smtp_open(host=host, port=port, user=user, password=password, use_tls=use_tls)
+                    if err is not None:
+                        return err
+                    _SMTP_CONN["key"] = conn_key
+                    _SMTP_CONN["conn"] = conn
                 try:
-                    s.login(user, password)
-                except Exception as e:
-                    return f"smtp auth failed: {type(e).__name__}"
+                    conn.send_message(msg)  # type: ignore[union-attr]
+                    return None
+                except smtplib.SMTPServerDisconnected:
+                    # Dropped between the probe and the send: reconnect once.
+                    _smtp_close_locked()
+            return "send failed: SMTPServerDisconnected"
+        except Exception as e:
+            _smtp_close_locked()
+            # Keep message minimal (avoid leaking details)
+            return f"send failed: {type(e).__name__}"
+
+
+# Deferred audit rows for high-rate, best-effort events (the Alertmanager webhook): a
+# single daemon thread batches them into bulk_create. Operator actions (users, settings,
+# reloads) keep their synchronous AdminActionLog.objects.create so they are never lost.
+_AUDIT_QUEUE: queue.Queue[AdminActionLog] = queue.Queue(maxsize=10000)
+_AUDIT_BATCH_MAX = 128
+_AUDIT_BATCH_WAIT_SECONDS = 0.5
+_AUDIT_WRITER_LOCK = threading.Lock()
+_AUDIT_WRITER: Optional[threading.Thread] = None
+
+
+def _audit_writer_loop() -> None:
+    while True:
+        batch = [_AUDIT_QUEUE.get()]
+        deadline = time.monotonic() + _AUDIT_BATCH_WAIT_SECONDS
+        while len(batch) < _AUDIT_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_AUDIT_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            AdminActionLog.objects.bulk_create(batch)
+        except Exception:
+            pass
+        finally:
+            close_old_connections()
 
-            s.send_message(msg)
-        return None
-    except Exception as e:
-        # Keep message minimal (avoid leaking details)
-        return f"send failed: {type(e).__name__}"
+
+def _audit_log_deferred(**fields) -> None:
+    global _AUDIT_WRITER
+    if _AUDIT_WRITER is None:
+        with _AUDIT_WRITER_LOCK:
+            if _AUDIT_WRITER is None:
+                t = threading.Thread(target=_audit_writer_loop, name="scheduler-ops-audit-writer", daemon=True)
+                t.start()
+                _AUDIT_WRITER = t
+    try:
+        _AUDIT_QUEUE.put_nowait(AdminActionLog(**fields))
+    except queue.Full:
+        # Same best-effort contract as before: the webhook response never depends on the audit row.
+        pass
 
 
 @csrf_exempt
@@ -512,12 +776,21 @@ def api_alert_webhook(request, token: str):
     URL includes a simple token to prevent casual spoofing.
     """
 
-    required = get_str(key="SCHEDULER_ALERT_WEBHOOK_TOKEN", default="dev", fresh=True).strip() or "dev"
-    if str(token or "") != required:
+    conf = get_many_str(
+        defaults={
+            "SCHEDULER_ALERT_WEBHOOK_TOKEN": "dev",
+            "SCHEDULER_NOTIFY_SLACK_WEBHOOK_URL": "",
+            "SCHEDULER_NOTIFY_TEAMS_WEBHOOK_URL": "",
+            **_EMAIL_SETTING_DEFAULTS,
+        },
+        fresh=True,
+    )
+    required = conf["SCHEDULER_ALERT_WEBHOOK_TOKEN"].strip() or "dev"
+    if not hmac.compare_digest(str(token or "").encode("utf-8"), required.encode("utf-8")):
         return JsonResponse({"ok": False, "error": "forbidden"}, status=403)
 
     try:
-        payload = json.loads((request.body or b"{}").decode("utf-8"))
+        payload = json_codec.loads(request.body or b"{}")
     except Exception:
         payload = {}
 
@@ -543,29 +816,33 @@ def api_alert_webhook(request, token: str):
     text = "\n".join(lines)
     subject = "[Scheduler] Alert"
 
-    slack_url = get_str(key="SCHEDULER_NOTIFY_SLACK_WEBHOOK_URL", default="", fresh=True).strip()
-    teams_url = get_str(key="SCHEDULER_NOTIFY_TEAMS_WEBHOOK_URL", default="", fresh=True).strip()
+    slack_url = conf["SCHEDULER_NOTIFY_SLACK_WEBHOOK_URL"].strip()
+    teams_url = conf["SCHEDULER_NOTIFY_TEAMS_WEBHOOK_URL"].strip()
 
-    slack_err = _send_slack(webhook_url=slack_url, text=text)
-    teams_err = _send_teams(webhook_url=teams_url, text=text)
-    mail_err = _send_email(subject=subject, body=text)
+    # The three channels are independent; send them concurrently so the Alertmanager call
+    # waits for the slowest one instead of the sum. Settings were resolved above, so the
+    # worker threads never touch the DB.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as ex:
+        slack_f = ex.submit(_send_slack, webhook_url=slack_url, text=text)
+        teams_f = ex.submit(_send_teams, webhook_url=teams_url, text=text)
+        mail_f = ex.submit(_send_email, conf=conf, subject=subject, body=text)
+    slack_err = slack_f.result()
+    teams_err = teams_f.result()
+    mail_err = mail_f.result()
 
     sent = {
         "slack": bool(slack_url) and slack_err is None,
         "teams": bool(teams_url) and teams_err is None,
-        "email": bool(get_str(key="SCHEDULER_NOTIFY_EMAIL_TO", default="", fresh=True).strip()) and mail_err is None,
+        "email": bool(conf["SCHEDULER_NOTIFY_EMAIL_TO"].strip()) and mail_err is None,
     }
     errs = {"slack": slack_err, "teams": teams_err, "email": mail_err}
 
-    try:
-        AdminActionLog.objects.create(
-            actor="",
-            action="alert.webhook",
-            target="alertmanager",
-            payload_json={"sent": sent, "errors": errs},
-        )
-    except Exception:
-        pass
+    _audit_log_deferred(
+        actor="",
+        action="alert.webhook",
+        target="alertmanager",
+        payload_json={"sent": sent, "errors": errs},
+    )
 
     return JsonResponse({"ok": True, "sent": sent, "errors": errs})
 
@@ -616,32 +893,36 @@ def jobs(request):
     )
 
 
+def _recent_job_run_rows():
+    """Latest 500 JobRuns as plain dicts (one joined SELECT, no model instances).
+
+    Job definition columns come back flattened as job_definition_{name,type,schedule}.
+    """
+    return JobRun.objects.order_by("-id").values(
+        "id",
+        "state",
+        "attempt",
+        "scheduled_for",
+        "assigned_worker_id",
+        "started_at",
+        "finished_at",
+        "error_summary",
+        "log_ref",
+        "resource_cpu_seconds_total",
+        "resource_peak_rss_bytes",
+        "resource_io_read_bytes",
+        "resource_io_write_bytes",
+        "job_definition_id",
+        job_definition_name=F("job_definition__name"),
+        job_definition_type=F("job_definition__type"),
+        job_definition_schedule=F("job_definition__schedule"),
+    )[:500]
+
+
 @login_required
 @_require_app_operator
 def job_runs(request):
-    runs = (
-        JobRun.objects.select_related("job_definition")
-        .order_by("-id")
-        .only(
-            "id",
-            "state",
-            "attempt",
-            "scheduled_for",
-            "assigned_worker_id",
-            "started_at",
-            "finished_at",
-            "error_summary",
-            "log_ref",
-            "resource_cpu_seconds_total",
-            "resource_peak_rss_bytes",
-            "resource_io_read_bytes",
-            "resource_io_write_bytes",
-            "job_definition__id",
-            "job_definition__name",
-            "job_definition__type",
-            "job_definition__schedule",
-        )[:500]
-    )
+    runs = _recent_job_run_rows()
     return render(
         request,
         "scheduler_ops/job_runs.html",
@@ -683,16 +964,24 @@ def users(request):
 def api_users(request):
     ensure_ops_groups()
     User = get_user_model()
-    qs = User.objects.order_by("id").prefetch_related("groups")
-    return JsonResponse(
-        {
-            "ok": True,
-            "server_time": timezone.now().isoformat(),
-            "users": [_user_payload(u) for u in qs],
-        }
+    qs = _with_ops_role_flags(User.objects.order_by("id"))
+    # Same JSON document as before, streamed: users are fetched in chunks and encoded
+    # one by one, so neither the rows nor the full body are held in memory at once.
+    return StreamingHttpResponse(
+        _iter_users_json(qs, server_time=timezone.now().isoformat()),
+        content_type="application/json",
     )
 
 
+def _iter_users_json(qs, *, server_time: str):
+    yield b'{"ok":true,"server_time":' + json_codec.dumps_bytes(server_time) + b',"users":['
+    sep = b""
+    for u in qs.iterator(chunk_size=500):
+        yield sep + json_codec.dumps_bytes(_user_payload(u))
+        sep = b","
+    yield b"]}"
+
+
 def _set_ops_roles_for_user(*, user, roles: dict) -> None:
     ensure_ops_groups()
     wanted = set()
@@ -703,7 +992,7 @@ def _set_ops_roles_for_user(*, user, roles: dict) -> None:
     if bool((roles or {}).get("superuser")):
         wanted.add(OPS_ROLES.SUPERUSER)
 
-    ops_groups = {g.name: g for g in Group.objects.filter(name__in=_ops_group_names())}
+    ops_groups = _cached_ops_groups()
     # Remove all ops groups then add wanted.
     user.groups.remove(*[ops_groups[n] for n in ops_groups.keys()])
     user.groups.add(*[ops_groups[n] for n in wanted if n in ops_groups])
@@ -757,7 +1046,7 @@ def api_users_update(request, user_id: int):
 
     User = get_user_model()
     try:
-        u = User.objects.prefetch_related("groups").get(id=user_id)
+        u = User.objects.get(id=user_id)
     except User.DoesNotExist:
         return JsonResponse({"ok": False, "errors": ["user not found"]}, status=404)
 
@@ -767,9 +1056,11 @@ def api_users_update(request, user_id: int):
             return JsonResponse({"ok": False, "errors": ["cannot remove own superuser role"]}, status=400)
 
     u.is_active = is_active
+    update_fields = ["is_active"]
     if password:
         u.set_password(password)
-    u.save()
+        update_fields.append("password")
+    u.save(update_fields=update_fields)
     _set_ops_roles_for_user(user=u, roles=roles or {})
 
     AdminActionLog.objects.create(
@@ -815,6 +1106,16 @@ def api_users_delete(request, user_id: int):
     )
 
 
+def _json_default(o):
+    # Whatever orjson/stdlib json can't encode natively, encode as JsonResponse would.
+    return DjangoJSONEncoder().default(o)
+
+
+def _json_response(obj, *, status: int = 200) -> HttpResponse:
+    """JsonResponse equivalent encoded with json_codec (orjson when installed)."""
+    return HttpResponse(json_codec.dumps_bytes(obj, default=_json_default), status=status, content_type="application/json")
+
+
 _NON_EDITABLE_KEYS = {
     # node_id is computed per worker at startup.
     "SCHEDULER_NODE_ID",
@@ -827,8 +1128,10 @@ _ENUM_SETTINGS: dict[str, list[str]] = {
 
 
 _BOOL_SETTINGS = {
+    "SCHEDULER_GRPC_SEND_ARGS_JSON",
     "SCHEDULER_LOG_ARCHIVE_ENABLED",
     "SCHEDULER_LOG_LOCAL_DELETE_AFTER_UPLOAD",
+    "SCHEDULER_PROMETHEUS_RECORDING_RULES",
     "SCHEDULER_REBALANCE_ASSIGNED_ENABLED",
 }
 
@@ -863,25 +1166,38 @@ def _schema_from_help_row(row: SchedulerSettingHelp) -> dict:
     }
 
 
+_SETTING_HELP_FIELDS = (
+    "key",
+    "title",
+    "description",
+    "impact",
+    "editable",
+    "input_type",
+    "enum_values_json",
+    "constraints_json",
+    "examples_json",
+    "is_secret",
+    "updated_at",
+)
+
+
+def _get_schemas_with_help(keys: list[str]) -> dict[str, dict]:
+    """Schema (help row, else built-in) for each key, with one IN query for all help rows."""
+    lookup = [k for k in keys if k not in _NON_EDITABLE_KEYS]
+    help_rows = (
+        {r.key: r for r in SchedulerSettingHelp.objects.filter(key__in=lookup).only(*_SETTING_HELP_FIELDS)}
+        if lookup
+        else {}
+    )
+    out: dict[str, dict] = {}
+    for k in keys:
+        row = help_rows.get(k)
+        out[k] = _schema_from_help_row(row) if row else _setting_schema(k)
+    return out
+
+
 def _get_schema_with_help(*, key: str) -> dict:
-    if key in _NON_EDITABLE_KEYS:
-        return {"editable": False, "input_type": "readonly", "enum_values": []}
-    row = SchedulerSettingHelp.objects.filter(key=key).only(
-        "key",
-        "title",
-        "description",
-        "impact",
-        "editable",
-        "input_type",
-        "enum_values_json",
-        "constraints_json",
-        "examples_json",
-        "is_secret",
-        "updated_at",
-    ).first()
-    if row:
-        return _schema_from_help_row(row)
-    return _setting_schema(key)
+    return _get_schemas_with_help([key])[key]
 
 
 def _is_secret_key(key: str) -> bool:
@@ -911,33 +1227,17 @@ def api_settings(request):
     ensure_setting_help_rows(apply_defaults=True)
     keys = list_all_scheduler_setting_keys(fresh=True)
     db_rows = {r.key: r for r in SchedulerSetting.objects.filter(key__in=keys).only("key", "value_json", "updated_at")}
-    help_rows = {
-        r.key: r
-        for r in SchedulerSettingHelp.objects.filter(key__in=keys).only(
-            "key",
-            "title",
-            "description",
-            "impact",
-            "editable",
-            "input_type",
-            "enum_values_json",
-            "constraints_json",
-            "examples_json",
-            "is_secret",
-            "updated_at",
-        )
-    }
+    schemas = _get_schemas_with_help(keys)
 
     can_view_secrets = is_superuser(request.user)
     can_edit_help = is_superuser(request.user)
 
     items = []
+    resolved = get_many_with_source(keys=keys, default=None, fresh=True)
     for k in keys:
-        val, source = get_setting_with_source(key=k, default=None, fresh=True)
+        val, source = resolved[k]
         db_row = db_rows.get(k)
-
-        help_row = help_rows.get(k)
-        schema = _schema_from_help_row(help_row) if help_row else _setting_schema(k)
+        schema = schemas[k]
 
         is_secret = _is_secret_key(k) or bool(schema.get("is_secret"))
         if is_secret and not can_view_secrets:
@@ -974,7 +1274,7 @@ def api_settings(request):
         .first()
     )
 
-    return JsonResponse(
+    return _json_response(
         {
             "ok": True,
             "server_time": timezone.now().isoformat(),
@@ -1001,18 +1301,18 @@ def api_settings(request):
 @require_POST
 def api_settings_set(request):
     try:
-        data = json.loads(request.body.decode("utf-8") if request.body else "{}")
+        data = json_codec.loads(request.body or b"{}")
     except Exception:
         data = {}
 
     key = str(data.get("key") or "").strip()
     raw_value = data.get("value")
     if not key or not key.startswith("SCHEDULER_"):
-        return JsonResponse({"ok": False, "error": "invalid key"}, status=400)
+        return _json_response({"ok": False, "error": "invalid key"}, status=400)
 
     schema = _get_schema_with_help(key=key)
     if not schema.get("editable"):
-        return JsonResponse({"ok": False, "error": "not editable"}, status=400)
+        return _json_response({"ok": False, "error": "not editable"}, status=400)
 
     # Accept either JSON value (already parsed) or string input.
     value = raw_value
@@ -1022,7 +1322,7 @@ def api_settings_set(request):
             value = ""
         else:
             try:
-                value = json.loads(s)
+                value = json_codec.loads(s)
             except Exception:
                 value = s
 
@@ -1033,13 +1333,13 @@ def api_settings_set(request):
             if isinstance(value, (int, float)):
                 value = bool(int(value))
             elif isinstance(value, str):
-                value = value.strip().lower() not in {"", "0", "false", "no"}
+                value = _truthy(value)
             else:
-                return JsonResponse({"ok": False, "error": "invalid bool"}, status=400)
+                return _json_response({"ok": False, "error": "invalid bool"}, status=400)
     if schema.get("input_type") == "enum":
         allowed = set(schema.get("enum_values") or [])
         if str(value) not in allowed:
-            return JsonResponse({"ok": False, "error": f"invalid enum (allowed={sorted(allowed)})"}, status=400)
+            return _json_response({"ok": False, "error": f"invalid enum (allowed={sorted(allowed)})"}, status=400)
         value = str(value)
 
     # Optional constraint validation (min/max)
@@ -1051,11 +1351,11 @@ def api_settings_set(request):
             try:
                 num = int(value)
             except Exception:
-                return JsonResponse({"ok": False, "error": "invalid number"}, status=400)
+                return _json_response({"ok": False, "error": "invalid number"}, status=400)
             if min_v is not None and num < int(min_v):
-                return JsonResponse({"ok": False, "error": f"too small (min={min_v})"}, status=400)
+                return _json_response({"ok": False, "error": f"too small (min={min_v})"}, status=400)
             if max_v is not None and num > int(max_v):
-                return JsonResponse({"ok": False, "error": f"too large (max={max_v})"}, status=400)
+                return _json_response({"ok": False, "error": f"too large (max={max_v})"}, status=400)
 
     obj, _ = SchedulerSetting.objects.update_or_create(
         key=key,
@@ -1069,7 +1369,7 @@ def api_settings_set(request):
         payload_json={"value": "<redacted>" if _is_secret_key(key) else value},
     )
 
-    return JsonResponse({"ok": True, "key": obj.key, "updated_at": obj.updated_at.isoformat()})
+    return _json_response({"ok": True, "key": obj.key, "updated_at": obj.updated_at.isoformat()})
 
 
 @login_required
@@ -1077,17 +1377,17 @@ def api_settings_set(request):
 @require_POST
 def api_settings_delete(request):
     try:
-        data = json.loads(request.body.decode("utf-8") if request.body else "{}")
+        data = json_codec.loads(request.body or b"{}")
     except Exception:
         data = {}
 
     key = str(data.get("key") or "").strip()
     if not key or not key.startswith("SCHEDULER_"):
-        return JsonResponse({"ok": False, "error": "invalid key"}, status=400)
+        return _json_response({"ok": False, "error": "invalid key"}, status=400)
 
     schema = _get_schema_with_help(key=key)
     if not schema.get("editable"):
-        return JsonResponse({"ok": False, "error": "not editable"}, status=400)
+        return _json_response({"ok": False, "error": "not editable"}, status=400)
 
     SchedulerSetting.objects.filter(key=key).delete()
     AdminActionLog.objects.create(
@@ -1096,7 +1396,7 @@ def api_settings_delete(request):
         target=key,
         payload_json={},
     )
-    return JsonResponse({"ok": True})
+    return _json_response({"ok": True})
 
 
 @login_required
@@ -1113,7 +1413,12 @@ def api_settings_apply(request):
         target=str(req.id),
         payload_json={},
     )
-    return JsonResponse({"ok": True, "request_id": req.id})
+    # Wake the leader immediately; if Redis is unavailable it still picks the request up on its fallback poll.
+    try:
+        publish_config_reload(get_scheduler_config().redis_url, int(req.id))
+    except Exception:
+        pass
+    return _json_response({"ok": True, "request_id": req.id})
 
 
 @login_required
@@ -1122,15 +1427,15 @@ def api_settings_apply(request):
 def api_settings_help_set(request):
     ensure_setting_help_rows(apply_defaults=True)
     try:
-        data = json.loads(request.body.decode("utf-8") if request.body else "{}")
+        data = json_codec.loads(request.body or b"{}")
     except Exception:
         data = {}
 
     key = str(data.get("key") or "").strip()
     if not key or not key.startswith("SCHEDULER_"):
-        return JsonResponse({"ok": False, "error": "invalid key"}, status=400)
+        return _json_response({"ok": False, "error": "invalid key"}, status=400)
     if key in _NON_EDITABLE_KEYS:
-        return JsonResponse({"ok": False, "error": "not editable"}, status=400)
+        return _json_response({"ok": False, "error": "not editable"}, status=400)
 
     title = str(data.get("title") or "")
     description = str(data.get("description") or "")
@@ -1148,16 +1453,16 @@ def api_settings_help_set(request):
     constraints = data.get("constraints")
     if isinstance(constraints, str):
         s = constraints.strip()
-        constraints = json.loads(s) if s else {}
+        constraints = json_codec.loads(s) if s else {}
     if not isinstance(constraints, dict):
-        return JsonResponse({"ok": False, "error": "invalid constraints"}, status=400)
+        return _json_response({"ok": False, "error": "invalid constraints"}, status=400)
 
     examples = data.get("examples")
     if isinstance(examples, str):
         s = examples.strip()
-        examples = json.loads(s) if s else []
+        examples = json_codec.loads(s) if s else []
     if not isinstance(examples, list):
-        return JsonResponse({"ok": False, "error": "invalid examples"}, status=400)
+        return _json_response({"ok": False, "error": "invalid examples"}, status=400)
 
     # Never allow unmarking obvious secrets.
     is_secret = _is_secret_key(key) or bool(data.get("is_secret", False))
@@ -1183,7 +1488,7 @@ def api_settings_help_set(request):
         target=key,
         payload_json={"title": title},
     )
-    return JsonResponse({"ok": True, "key": obj.key, "updated_at": obj.updated_at.isoformat()})
+    return _json_response({"ok": True, "key": obj.key, "updated_at": obj.updated_at.isoformat()})
 
 
 def _get_log_max_bytes(request) -> int:
@@ -1394,6 +1699,29 @@ def api_job_run_log_download(request, run_id: int):
     return out
 
 
+class _PercentileDisc(Aggregate):
+    """PostgreSQL PERCENTILE_DISC(p) WITHIN GROUP (ORDER BY expr): an observed value, NULLs ignored."""
+
+    function = "PERCENTILE_DISC"
+    template = "%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)"
+    output_field = BigIntegerField()
+
+
+def _supports_percentile_disc() -> bool:
+    # Ordered-set aggregates are PostgreSQL-only; SQLite (default without DATABASE_URL) lacks them.
+    return connections[JobRun.objects.db].vendor == "postgresql"
+
+
+def _p95_int(values: list[int]) -> int | None:
+    # Nearest-rank p95 in Python, for backends without _PercentileDisc.
+    if not values:
+        return None
+    values.sort()
+    idx = int(round(0.95 * (len(values) - 1)))
+    idx = max(0, min(idx, len(values) - 1))
+    return int(values[idx])
+
+
 @login_required
 @_require_app_operator
 def api_dashboard(request):
@@ -1414,21 +1742,18 @@ def api_dashboard(request):
     except Exception:
         recent_minutes = 15
 
-    # Worker-level load summary (DB-backed counts + Redis worker registry)
-    assigned_counts = {
-        row["assigned_worker_id"]: int(row["c"])
-        for row in JobRun.objects.filter(state=JobRun.State.ASSIGNED)
+    # Worker-level load summary (DB-backed counts + Redis worker registry).
+    # One GROUP BY (state, worker) covers both the ASSIGNED and the RUNNING counts.
+    assigned_counts: dict[str, int] = {}
+    running_counts: dict[str, int] = {}
+    for row in (
+        JobRun.objects.filter(state__in=[JobRun.State.ASSIGNED, JobRun.State.RUNNING])
         .exclude(assigned_worker_id="")
-        .values("assigned_worker_id")
+        .values("state", "assigned_worker_id")
         .annotate(c=Count("id"))
-    }
-    running_counts = {
-        row["assigned_worker_id"]: int(row["c"])
-        for row in JobRun.objects.filter(state=JobRun.State.RUNNING)
-        .exclude(assigned_worker_id="")
-        .values("assigned_worker_id")
-        .annotate(c=Count("id"))
-    }
+    ):
+        counts = assigned_counts if row["state"] == JobRun.State.ASSIGNED else running_counts
+        counts[row["assigned_worker_id"]] = int(row["c"])
 
     # Recent per-worker resource usage (best-effort; recorded at completion).
     # This is NOT "current" CPU/mem/IO, but it helps spot heavy workers.
@@ -1440,38 +1765,11 @@ def api_dashboard(request):
         JobRun.State.SKIPPED,
         JobRun.State.TIMED_OUT,
     ]
-    recent_by_worker: dict[str, dict[str, object]] = {}
-    try:
-        recent_qs = (
-            JobRun.objects.filter(state__in=terminal_states)
-            .exclude(finished_at=None)
-            .filter(finished_at__gte=recent_since)
-        )
-
-        recent_rows = (
-            recent_qs.exclude(assigned_worker_id="")
-            .values("assigned_worker_id")
-            .annotate(
-                finished_count=Count("id"),
-                cpu_seconds_total=Sum("resource_cpu_seconds_total"),
-                io_read_bytes_total=Sum("resource_io_read_bytes"),
-                io_write_bytes_total=Sum("resource_io_write_bytes"),
-                peak_rss_bytes_max=Max("resource_peak_rss_bytes"),
-            )
-        )
-        for row in recent_rows:
-            wid = str(row.get("assigned_worker_id") or "")
-            if not wid:
-                continue
-            recent_by_worker[wid] = {
-                "finished_count": int(row.get("finished_count") or 0),
-                "cpu_seconds_total": float(row.get("cpu_seconds_total") or 0.0),
-                "io_read_bytes_total": int(row.get("io_read_bytes_total") or 0),
-                "io_write_bytes_total": int(row.get("io_write_bytes_total") or 0),
-                "peak_rss_bytes_max": int(row.get("peak_rss_bytes_max") or 0),
-            }
-    except Exception:
-        recent_by_worker = {}
+    recent_qs = (
+        JobRun.objects.filter(state__in=terminal_states)
+        .exclude(finished_at=None)
+        .filter(finished_at__gte=recent_since)
+    )
 
     # System Load (DB-backed): aggregate job-run performance over the same window.
     # - CPU cores avg ~= cpu_seconds_total / window_seconds
@@ -1487,60 +1785,93 @@ def api_dashboard(request):
         "mem_p95_bytes": None,
         "finished_counts": {},
     }
-    try:
-        # Use the same recent_qs when available.
-        recent_qs  # type: ignore[name-defined]
-    except Exception:
-        recent_qs = (
-            JobRun.objects.filter(state__in=terminal_states)
-            .exclude(finished_at=None)
-            .filter(finished_at__gte=recent_since)
-        )
 
+    # Per-worker summaries, finished counts by state and the window totals all come from
+    # one GROUP BY (state, worker) over recent_qs; counts, sums and max fold in Python.
+    recent_by_worker: dict[str, dict[str, object]] = {}
+    per_worker: dict[str, list] = {}
+    recent_ok = True
+    cpu_seconds_total = 0.0
+    io_read_bytes_total = 0.0
+    io_write_bytes_total = 0.0
     try:
-        # Finished counts by state.
-        for row in recent_qs.values("state").annotate(c=Count("id")):
-            st = str(row.get("state") or "")
-            if st:
-                finished_counts[st] = int(row.get("c") or 0)
-
-        agg = recent_qs.aggregate(
+        recent_rows = recent_qs.values("state", "assigned_worker_id").annotate(
+            finished_count=Count("id"),
             cpu_seconds_total=Sum("resource_cpu_seconds_total"),
             io_read_bytes_total=Sum("resource_io_read_bytes"),
             io_write_bytes_total=Sum("resource_io_write_bytes"),
+            peak_rss_bytes_max=Max("resource_peak_rss_bytes"),
         )
-        cpu_seconds_total = float(agg.get("cpu_seconds_total") or 0.0)
-        io_read_bytes_total = float(agg.get("io_read_bytes_total") or 0.0)
-        io_write_bytes_total = float(agg.get("io_write_bytes_total") or 0.0)
-
-        cpu_cores_avg = (cpu_seconds_total / float(window_seconds)) if window_seconds > 0 else None
-        io_read_bps = (io_read_bytes_total / float(window_seconds)) if window_seconds > 0 else None
-        io_write_bps = (io_write_bytes_total / float(window_seconds)) if window_seconds > 0 else None
-
-        # Mem p95 (best-effort; cap to avoid large payloads).
-        peaks = list(
-            recent_qs.exclude(resource_peak_rss_bytes=None)
-            .order_by("-finished_at")
-            .values_list("resource_peak_rss_bytes", flat=True)[:2000]
-        )
-        peaks_clean = [int(v) for v in peaks if v is not None]
-        mem_p95 = None
-        if peaks_clean:
-            peaks_clean.sort()
-            idx = int(round(0.95 * (len(peaks_clean) - 1)))
-            idx = max(0, min(idx, len(peaks_clean) - 1))
-            mem_p95 = int(peaks_clean[idx])
-
-        load_payload = {
-            "window_seconds": int(window_seconds),
-            "cpu_cores_avg": float(cpu_cores_avg) if cpu_cores_avg is not None else None,
-            "io_read_bps": float(io_read_bps) if io_read_bps is not None else None,
-            "io_write_bps": float(io_write_bps) if io_write_bps is not None else None,
-            "mem_p95_bytes": mem_p95,
-            "finished_counts": {k: int(v) for k, v in finished_counts.items()},
+        for row in recent_rows:
+            n = int(row.get("finished_count") or 0)
+            cpu = float(row.get("cpu_seconds_total") or 0.0)
+            io_r = int(row.get("io_read_bytes_total") or 0)
+            io_w = int(row.get("io_write_bytes_total") or 0)
+
+            st = str(row.get("state") or "")
+            if st:
+                finished_counts[st] = finished_counts.get(st, 0) + n
+            cpu_seconds_total += cpu
+            io_read_bytes_total += io_r
+            io_write_bytes_total += io_w
+
+            wid = str(row.get("assigned_worker_id") or "")
+            if not wid:
+                continue
+            acc = per_worker.setdefault(wid, [0, 0.0, 0, 0, 0])
+            acc[0] += n
+            acc[1] += cpu
+            acc[2] += io_r
+            acc[3] += io_w
+            acc[4] = max(acc[4], int(row.get("peak_rss_bytes_max") or 0))
+        recent_by_worker = {
+            wid: {
+                "finished_count": int(acc[0]),
+                "cpu_seconds_total": float(acc[1]),
+                "io_read_bytes_total": int(acc[2]),
+                "io_write_bytes_total": int(acc[3]),
+                "peak_rss_bytes_max": int(acc[4]),
+            }
+            for wid, acc in per_worker.items()
         }
     except Exception:
-        pass
+        recent_ok = False
+
+    if recent_ok:
+        try:
+            cpu_cores_avg = (cpu_seconds_total / float(window_seconds)) if window_seconds > 0 else None
+            io_read_bps = (io_read_bytes_total / float(window_seconds)) if window_seconds > 0 else None
+            io_write_bps = (io_write_bytes_total / float(window_seconds)) if window_seconds > 0 else None
+
+            # Mem p95 (best-effort, own try: a failure only drops this value).
+            mem_p95 = None
+            try:
+                if _supports_percentile_disc():
+                    mem_p95_raw = recent_qs.aggregate(
+                        mem_p95=_PercentileDisc("resource_peak_rss_bytes", percentile=0.95)
+                    )["mem_p95"]
+                    mem_p95 = int(mem_p95_raw) if mem_p95_raw is not None else None
+                else:
+                    # Other backends (SQLite in dev): latest 2000 values, nearest rank in Python.
+                    peaks = list(
+                        recent_qs.exclude(resource_peak_rss_bytes=None)
+                        .order_by("-finished_at")
+                        .values_list("resource_peak_rss_bytes", flat=True)[:2000]
+                    )
+                    mem_p95 = _p95_int([int(v) for v in peaks if v is not None])
+            except Exception:
+                mem_p95 = None
+
+            load_payload = {
+                "window_seconds": int(window_seconds),
+                "cpu_cores_avg": float(cpu_cores_avg) if cpu_cores_avg is not None else None,
+                "io_read_bps": float(io_read_bps) if io_read_bps is not None else None,
+                "io_write_bps": float(io_write_bps) if io_write_bps is not None else None,
+                "mem_p95_bytes": mem_p95,
+                "finished_counts": {k: int(v) for k, v in finished_counts.items()},
+            }
+        except Exception:
+            pass
 
     # System Load sparklines (DB-backed): past 30 minutes, 1-minute buckets.
     # Best-effort: we group completed job runs by finished_at minute.
@@ -1557,22 +1888,14 @@ def api_dashboard(request):
             .filter(finished_at__gte=start_bucket, finished_at__lt=spark_until)
         )
 
+        # One backend-neutral GROUP BY per minute bucket for the CPU and IO series.
         cpu_by_bucket: dict[object, float] = {}
-        for row in (
-            spark_qs.annotate(bucket=TruncMinute("finished_at"))
-            .values("bucket")
-            .annotate(cpu_seconds_total=Sum("resource_cpu_seconds_total"))
-        ):
-            b = row.get("bucket")
-            if b is None:
-                continue
-            cpu_by_bucket[b] = float(row.get("cpu_seconds_total") or 0.0)
-
         io_by_bucket: dict[object, tuple[float, float]] = {}
         for row in (
             spark_qs.annotate(bucket=TruncMinute("finished_at"))
             .values("bucket")
             .annotate(
+                cpu_seconds_total=Sum("resource_cpu_seconds_total"),
                 io_read_bytes_total=Sum("resource_io_read_bytes"),
                 io_write_bytes_total=Sum("resource_io_write_bytes"),
             )
@@ -1580,29 +1903,41 @@ def api_dashboard(request):
             b = row.get("bucket")
             if b is None:
                 continue
+            cpu_by_bucket[b] = float(row.get("cpu_seconds_total") or 0.0)
             io_by_bucket[b] = (
                 float(row.get("io_read_bytes_total") or 0.0),
                 float(row.get("io_write_bytes_total") or 0.0),
             )
 
-        mem_values_by_bucket: dict[object, list[int]] = {}
-        mem_rows = list(
-            spark_qs.exclude(resource_peak_rss_bytes=None)
-            .annotate(bucket=TruncMinute("finished_at"))
-            .values_list("bucket", "resource_peak_rss_bytes")[:50000]
-        )
-        for b, v in mem_rows:
-            if b is None or v is None:
-                continue
-            mem_values_by_bucket.setdefault(b, []).append(int(v))
-
-        def _p95_int(values: list[int]) -> int | None:
-            if not values:
-                return None
-            values.sort()
-            idx = int(round(0.95 * (len(values) - 1)))
-            idx = max(0, min(idx, len(values) - 1))
-            return int(values[idx])
+        # Mem p95 per bucket, separately: a failure here only empties the mem series.
+        mem_p95_by_bucket: dict[object, int] = {}
+        try:
+            if _supports_percentile_disc():
+                for row in (
+                    spark_qs.annotate(bucket=TruncMinute("finished_at"))
+                    .values("bucket")
+                    .annotate(mem_p95=_PercentileDisc("resource_peak_rss_bytes", percentile=0.95))
+                ):
+                    b = row.get("bucket")
+                    if b is None or row.get("mem_p95") is None:
+                        continue
+                    mem_p95_by_bucket[b] = int(row["mem_p95"])
+            else:
+                mem_values_by_bucket: dict[object, list[int]] = {}
+                for b, v in (
+                    spark_qs.exclude(resource_peak_rss_bytes=None)
+                    .annotate(bucket=TruncMinute("finished_at"))
+                    .values_list("bucket", "resource_peak_rss_bytes")[:50000]
+                ):
+                    if b is None or v is None:
+                        continue
+                    mem_values_by_bucket.setdefault(b, []).append(int(v))
+                for b, values in mem_values_by_bucket.items():
+                    p95 = _p95_int(values)
+                    if p95 is not None:
+                        mem_p95_by_bucket[b] = p95
+        except Exception:
+            mem_p95_by_bucket = {}
 
         buckets = [start_bucket + timedelta(minutes=i) for i in range(spark_minutes)]
         cpu_series = []
@@ -1614,7 +1949,7 @@ def api_dashboard(request):
             cpu_cores = cpu_seconds / float(bucket_seconds) if bucket_seconds > 0 else None
             cpu_series.append([b.isoformat(), float(cpu_cores) if cpu_cores is not None else None])
 
-            mem_p95_b = _p95_int(mem_values_by_bucket.get(b, []))
+            mem_p95_b = mem_p95_by_bucket.get(b)
             mem_series.append([b.isoformat(), int(mem_p95_b) if mem_p95_b is not None else None])
 
             io_read_bytes, io_write_bytes = io_by_bucket.get(b, (0.0, 0.0))
@@ -1882,7 +2217,7 @@ def api_alertmanager_silence_create(request):
         return JsonResponse({"ok": False, "error": "Alertmanager not configured"}, status=400)
 
     try:
-        payload = json.loads((request.body or b"{}").decode("utf-8"))
+        payload = json_codec.loads(request.body or b"{}")
     except Exception:
         payload = {}
 
@@ -1934,7 +2269,7 @@ def api_alertmanager_silence_create(request):
         )
         with urllib.request.urlopen(req, timeout=3.0) as resp:
             raw = resp.read()
-        out = json.loads(raw.decode("utf-8")) if raw else {}
+        out = json_codec.loads(raw) if raw else {}
         silence_id = str(out.get("silenceID") or "")
         AdminActionLog.objects.create(
             actor=str(getattr(request.user, "username", "") or ""),
@@ -2188,6 +2523,11 @@ def api_job_run_rerun(request, run_id: int):
             "new_scheduled_for": (new_run.scheduled_for.isoformat() if new_run.scheduled_for else None),
         },
     )
+    # Wake an idle leader; without Redis the run is still picked up on the next (backed-off) tick.
+    try:
+        publish_jobrun_ready(get_scheduler_config().redis_url)
+    except Exception:
+        pass
 
     return JsonResponse(
         {
@@ -2254,8 +2594,7 @@ def api_jobs(request):
 
 def _parse_json_body(request):
     try:
-        raw = request.body.decode("utf-8") if request.body else "{}"
-        return json.loads(raw) if raw else {}
+        return json_codec.loads(request.body) if request.body else {}
     except Exception:
         return {}
 
@@ -2511,51 +2850,16 @@ def api_jobs_delete(request, job_id: int):
 @_require_app_operator
 def api_job_runs(request):
     now = timezone.now()
-    runs = (
-        JobRun.objects.select_related("job_definition")
-        .order_by("-id")
-        .only(
-            "id",
-            "state",
-            "attempt",
-            "scheduled_for",
-            "assigned_worker_id",
-            "started_at",
-            "finished_at",
-            "error_summary",
-            "log_ref",
-            "resource_cpu_seconds_total",
-            "resource_peak_rss_bytes",
-            "resource_io_read_bytes",
-            "resource_io_write_bytes",
-            "job_definition__id",
-            "job_definition__name",
-            "job_definition__type",
-            "job_definition__schedule",
-        )[:500]
-    )
+    runs = _recent_job_run_rows()
     return JsonResponse(
         {
             "server_time": now.isoformat(),
             "runs": [
                 {
-                    "id": r.id,
-                    "job_definition_id": r.job_definition_id,
-                    "job_definition_name": r.job_definition.name if r.job_definition_id else None,
-                    "job_definition_type": r.job_definition.type if r.job_definition_id else None,
-                    "job_definition_schedule": r.job_definition.schedule if r.job_definition_id else None,
-                    "state": r.state,
-                    "attempt": r.attempt,
-                    "scheduled_for": r.scheduled_for.isoformat() if r.scheduled_for else None,
-                    "assigned_worker_id": r.assigned_worker_id,
-                    "started_at": r.started_at.isoformat() if r.started_at else None,
-                    "finished_at": r.finished_at.isoformat() if r.finished_at else None,
-                    "error_summary": r.error_summary,
-                    "log_ref": r.log_ref,
-                    "resource_cpu_seconds_total": r.resource_cpu_seconds_total,
-                    "resource_peak_rss_bytes": r.resource_peak_rss_bytes,
-                    "resource_io_read_bytes": r.resource_io_read_bytes,
-                    "resource_io_write_bytes": r.resource_io_write_bytes,
+                    **r,
+                    "scheduled_for": r["scheduled_for"].isoformat() if r["scheduled_for"] else None,
+                    "started_at": r["started_at"].isoformat() if r["started_at"] else None,
+                    "finished_at": r["finished_at"].isoformat() if r["finished_at"] else None,
                 }
                 for r in runs
             ],
@@ -105,6 +105,14 @@ SCHEDULER_GRPC_PORT_RANGE_END = int(os.environ.get("SCHEDULER_GRPC_PORT_RANGE_EN
 SCHEDULER_TLS_CERT_FILE = os.environ.get("SCHEDULER_TLS_CERT_FILE", "")
 SCHEDULER_TLS_KEY_FILE = os.environ.get("SCHEDULER_TLS_KEY_FILE", "")
 
+# Mixed-version clusters only: send StartJob args as args_json instead of the Struct, for
+# workers that predate StartJobRequest.args. Turn off once every worker reads args.
+SCHEDULER_GRPC_SEND_ARGS_JSON = os.environ.get("SCHEDULER_GRPC_SEND_ARGS_JSON", "0") not in {
+    "0",
+    "false",
+    "False",
+}
+
 # --- Scheduling (M3) ---
 # How far ahead leader assigns (and ensures JobRuns exist) for time-based jobs.
 SCHEDULER_ASSIGN_AHEAD_SECONDS = int(os.environ.get("SCHEDULER_ASSIGN_AHEAD_SECONDS", "60"))
@@ -147,6 +155,9 @@ SCHEDULER_REBALANCE_ASSIGNED_COOLDOWN_SECONDS = int(
     os.environ.get("SCHEDULER_REBALANCE_ASSIGNED_COOLDOWN_SECONDS", "5")
 )
 
+# Upper bound of the leader's idle backoff (no pending/assigned work). New event/rerun JobRuns wake it via Redis.
+SCHEDULER_POLL_INTERVAL_SECONDS_MAX = int(os.environ.get("SCHEDULER_POLL_INTERVAL_SECONDS_MAX", "10"))
+
 # --- Events API (M4) ---
 # If set (non-empty), /api/events/ingest/ requires X-Scheduler-Token.
 # If empty, it requires an authenticated Django session.
@@ -179,6 +190,13 @@ SCHEDULER_LOG_LOCAL_DELETE_AFTER_UPLOAD = os.environ.get("SCHEDULER_LOG_LOCAL_DE
 # (MVP: cleanup is triggered after each job finishes)
 SCHEDULER_LOG_LOCAL_RETENTION_HOURS = int(os.environ.get("SCHEDULER_LOG_LOCAL_RETENTION_HOURS", "0"))
 
+# AdminActionLog retention (days). Rows older than this are pruned by scheduler_prune_audit_log. 0 = keep forever.
+# The "System: Prune audit log" job is created disabled (migration 0009); enable it in the Ops UI to prune.
+SCHEDULER_AUDIT_RETENTION_DAYS = int(os.environ.get("SCHEDULER_AUDIT_RETENTION_DAYS", "365"))
+# ConfigReloadRequest retention (days). Finished (APPLIED/FAILED) requests older than this are pruned by
+# scheduler_prune_audit_log as well. 0 = keep forever.
+SCHEDULER_CONFIG_RELOAD_RETENTION_DAYS = int(os.environ.get("SCHEDULER_CONFIG_RELOAD_RETENTION_DAYS", "30"))
+
 # Deployment hint for Ops UI behavior (e.g., show console log link only on k8s)
 SCHEDULER_DEPLOYMENT = os.environ.get("SCHEDULER_DEPLOYMENT", "local")
 